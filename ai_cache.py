@@ -0,0 +1,166 @@
+"""
+Disk-backed cache for AI-generated structured content, plus the JSON
+file helpers the scripts use to save and reload that content
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import List
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.expanduser(os.getenv("AI_CACHE_DIR", "~/.cache/majorprozenith/ai"))
+
+# Entries older than this many seconds are treated as misses and regenerated
+CACHE_TTL = float(os.getenv("AI_CACHE_TTL", str(7 * 24 * 60 * 60)))
+
+# Set AI_CACHE_REFRESH=1 to ignore existing entries (fresh results still overwrite them)
+CACHE_REFRESH = os.getenv("AI_CACHE_REFRESH", "0") == "1"
+
+def cache_key(namespace: str, **params) -> str:
+    """Stable file-name key for a namespace and its call parameters"""
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return f"{namespace}_{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+def _cache_path(namespace: str, **params) -> str:
+    """Cache file for a namespace and its call parameters"""
+    return os.path.join(CACHE_DIR, cache_key(namespace, **params) + ".json")
+
+def load_cached(namespace: str, **params):
+    """Return the cached result for params, or None on a miss (including expired entries)"""
+    if CACHE_REFRESH:
+        return None
+    path = _cache_path(namespace, **params)
+    try:
+        with open(path, "rb") as f:
+            if time.time() - os.fstat(f.fileno()).st_mtime > CACHE_TTL:
+                logger.info(f"AI cache entry expired: {namespace}")
+                return None
+            data = f.read()
+        logger.info(f"AI cache hit: {namespace}")
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    except FileNotFoundError:
+        pass
+    except ValueError:
+        logger.warning(f"Ignoring unreadable AI cache entry {path}")
+    return None
+
+def store_cached(namespace: str, result, **params) -> None:
+    """Store a non-empty result for params
+    
+    Results marked "fallback" (stand-in content built after the model
+    failed) are not stored, so a transient error is not served from disk.
+    """
+    if not result:
+        return
+    if isinstance(result, dict) and result.get("fallback"):
+        logger.info(f"Not caching fallback result: {namespace}")
+        return
+    path = _cache_path(namespace, **params)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(result)
+        else:
+            data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Failed to write AI cache entry {path}: {e}")
+
+def cached_json(namespace: str, compute, **params):
+    """Return the cached result for params, calling compute() and storing it on a miss"""
+    result = load_cached(namespace, **params)
+    if result is None:
+        result = compute()
+        store_cached(namespace, result, **params)
+    return result
+
+def cached_explainer(ai_service, topic: str, level: str = "beginner", num_slides: int = 6,
+                     free: bool = False, **kwargs):
+    """Structured explainer content for (topic, level, num_slides), cached on disk
+    
+    free selects generate_explainer_structured_free instead of
+    generate_explainer_structured. Extra kwargs (e.g. max_retries) are passed
+    through but are not part of the cache key.
+    """
+    if free:
+        namespace, generate = "explainer_structured_free", ai_service.generate_explainer_structured_free
+    else:
+        namespace, generate = "explainer_structured", ai_service.generate_explainer_structured
+    return cached_json(
+        namespace,
+        lambda: generate(topic=topic, level=level, num_slides=num_slides, **kwargs),
+        topic=topic,
+        level=level,
+        num_slides=num_slides,
+        model=ai_service.get_model_info().get("model_name", "")
+    )
+
+def cached_structured_content(universal_prompt, topic: str, level: str = "beginner",
+                               num_slides: int = 8, **kwargs):
+    """UniversalAIPrompt.generate_structured_content for (topic, level, num_slides), cached on disk
+    
+    Extra kwargs (e.g. max_retries) are passed through but are not part of
+    the cache key.
+    """
+    return cached_json(
+        "universal_structured",
+        lambda: universal_prompt.generate_structured_content(
+            topic=topic, level=level, num_slides=num_slides, **kwargs
+        ),
+        topic=topic,
+        level=level,
+        num_slides=num_slides,
+        model=universal_prompt.ai_service.get_model_info().get("model_name", "")
+    )
+
+def prefetch_explainers(ai_service, topics: List[str], level: str = "beginner", num_slides: int = 6) -> None:
+    """Fill the cache for generate_explainer_structured with one batched request
+    
+    Topics already cached are skipped; later cached_explainer calls with the
+    same (topic, level, num_slides) are then served from disk. Only topics
+    parsed from the batch response are stored; the rest stay uncached so
+    each caller generates them itself.
+    """
+    model = ai_service.get_model_info().get("model_name", "")
+    missing = [
+        topic for topic in topics
+        if load_cached("explainer_structured", topic=topic, level=level, num_slides=num_slides, model=model) is None
+    ]
+    if not missing:
+        return
+    batch = ai_service.generate_explainer_structured_batch(
+        missing, level=level, num_slides=num_slides, fill_missing=False
+    )
+    for topic, result in batch.items():
+        store_cached("explainer_structured", result, topic=topic, level=level, num_slides=num_slides, model=model)
+
+def save_content_json(content: dict, path: str) -> None:
+    """Write explainer content to an indented UTF-8 JSON file (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(content, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(content, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
+def load_content_json(path: str) -> dict:
+    """Read explainer content written by save_content_json"""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
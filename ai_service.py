@@ -1,14 +1,34 @@
 import google.generativeai as genai
+import functools
 import logging
 from typing import Optional, Dict, Any, List
 import requests
 from config import Config
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# Question openings rewritten as statements by AIService._clean_text, in match
+# order ("What is" is tried before "What"): (lowercased, original, replacement)
+_QUESTION_STARTERS = tuple(
+    (starter.lower(), starter, statement)
+    for starter, statement in (
+        ("What is", "This is"), ("How does", "This works by"),
+        ("Why do", "This happens because"), ("When do", "This occurs when"),
+        ("Where do", "This happens in"), ("Which is", "This is"),
+        ("What are", "These are"), ("How are", "These work by"),
+        ("Why are", "These exist because"), ("When are", "These occur when"),
+        ("Where are", "These exist in"), ("Which are", "These are"),
+        ("What", "This"), ("How", "This works by"),
+        ("Why", "This happens because"), ("When", "This occurs when"),
+        ("Where", "This happens in"), ("Which", "This"),
+    )
+)
+
 class AIService:
     """Handles AI model interactions"""
     
@@ -93,7 +113,33 @@ Please respond naturally:
                 time.sleep(0.2 * (attempt + 1))  # Even faster retries
         
         raise Exception("Failed to generate response after all retry attempts")
-    
+
+    def generate_responses(self, prompts: List[str], max_retries: int = 2) -> List[Optional[str]]:
+        """
+        Generate responses for several independent prompts concurrently
+
+        Gemini's generate_content takes one prompt per request, so the prompts
+        are sent in parallel and the batch costs about one round trip.
+
+        Args:
+            prompts: User input prompts
+            max_retries: Maximum number of retry attempts per prompt
+
+        Returns:
+            One response per prompt, in order; None where a prompt failed
+        """
+        def _generate(prompt: str) -> Optional[str]:
+            try:
+                return self.generate_response(prompt, max_retries=max_retries)
+            except Exception as e:
+                logger.warning(f"Batched prompt failed: {e}")
+                return None
+
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(prompts))) as executor:
+            return list(executor.map(_generate, prompts))
+
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model"""
         return {
@@ -207,6 +253,10 @@ Do NOT include code fences or markdown outside the specified format.
         """
         Generate a high-quality explainer with structured slides in Google NotebookLM style:
         [{ title, subtopics[], bullets[], narration, examples[], visual_prompts[] }]
+        
+        If every attempt fails, returns knowledge-backed or placeholder slides
+        marked with "fallback": True so callers (e.g. ai_cache) can tell them
+        apart from model output.
         """
         constraints = (
             f"Avoid repeating the following text and produce novel explanations: {avoid_text[:800]}"
@@ -340,19 +390,7 @@ IMPORTANT:
                 if not self.model:
                     raise ValueError("Model not initialized")
                 response = self.model.generate_content(prompt)
-                text = getattr(response, "text", None)
-                if not text and hasattr(response, "candidates"):
-                    try:
-                        candidates = response.candidates or []
-                        for c in candidates:
-                            parts = getattr(getattr(c, "content", None), "parts", None)
-                            if parts:
-                                joined = "\n".join([getattr(p, "text", "") for p in parts if getattr(p, "text", "")])
-                                if joined.strip():
-                                    text = joined
-                                    break
-                    except Exception:
-                        pass
+                text = self._response_text(response)
                 if not text:
                     raise ValueError("Empty response from model")
                 import json as _json
@@ -375,6 +413,92 @@ IMPORTANT:
                     # ultimate fallback
                     return self._build_placeholder_structured(topic, level)
     
+    def generate_explainer_structured_batch(
+        self,
+        topics: List[str],
+        level: str = "beginner",
+        num_slides: int = 6,
+        max_retries: int = 2,
+        fill_missing: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate structured explainers for several topics with a single model request.
+        Returns {topic: structured data}; topics missing from the batch response are
+        generated individually with generate_explainer_structured, or left out
+        when fill_missing is False.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        topic_list = "\n".join(f"- {topic}" for topic in topics)
+        prompt = f"""
+You are an AI system that generates video slideshows with synced narration in Google NotebookLM style.
+
+Create a professional VIDEO presentation for EACH of these topics:
+{topic_list}
+
+Audience Level: {level}
+Target Slides per topic: {num_slides} (8 seconds per slide)
+
+## 📋 CRITICAL STYLE RULES - NEVER VIOLATE
+- NEVER use question marks (?) anywhere in any content
+- Write ONLY clear, declarative statements in simple, direct language
+- Start each presentation with a title slide and end with a summary
+
+Each slide must include: title (max 6 words), subtopics (2-3), bullets (3-6 short phrases),
+narration (80-120 words), examples (1-2), visual_prompts (1-2), layout and subtopic_type
+(definition|comparison|process|advantages_disadvantages|case_study|timeline|classification|principles).
+
+## 📋 OUTPUT FORMAT
+Return ONLY valid JSON: an object keyed by the exact topic text, where each value is
+{{"topic": "<topic>", "level": "{level}", "slides": [{{"title": "...", "subtopics": [], "bullets": [], "narration": "...", "examples": [], "visual_prompts": [], "layout": "...", "subtopic_type": "..."}}]}}
+Do not include markdown fences or any text outside JSON.
+        """
+
+        for attempt in range(max_retries):
+            try:
+                if not self.model:
+                    raise ValueError("Model not initialized")
+                text = self._response_text(self.model.generate_content(prompt))
+                if not text:
+                    raise ValueError("Empty response from model")
+                import json as _json
+                data = _json.loads(text)
+                if not isinstance(data, dict):
+                    raise ValueError("Invalid JSON structure")
+                for topic in topics:
+                    entry = data.get(topic)
+                    if isinstance(entry, dict) and entry.get("slides"):
+                        results[topic] = self._clean_content_data(entry)
+                break
+            except Exception as e:
+                logger.warning(f"Batch structured explainer attempt {attempt + 1} failed: {e}")
+
+        if not fill_missing:
+            return results
+        for topic in topics:
+            if topic not in results:
+                results[topic] = self.generate_explainer_structured(
+                    topic=topic, level=level, num_slides=num_slides, max_retries=max_retries
+                )
+        return results
+
+    @staticmethod
+    def _response_text(response) -> Optional[str]:
+        """Extract the text of a model response, falling back to candidate parts"""
+        text = getattr(response, "text", None)
+        if not text and hasattr(response, "candidates"):
+            try:
+                candidates = response.candidates or []
+                for c in candidates:
+                    parts = getattr(getattr(c, "content", None), "parts", None)
+                    if parts:
+                        joined = "\n".join([getattr(p, "text", "") for p in parts if getattr(p, "text", "")])
+                        if joined.strip():
+                            text = joined
+                            break
+            except Exception:
+                pass
+        return text
+
     def _clean_content_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Clean content data to remove question marks and improve quality"""
         if "slides" in data:
@@ -406,22 +530,9 @@ IMPORTANT:
         if not text:
             return text
         
-        # Remove question marks and convert to statements
+        # Remove question marks and convert to statements (the first replace
+        # leaves no "?" behind, so one pass covers runs of them too)
         text = text.replace("?", ".")
-        text = text.replace("??", ".")
-        text = text.replace("???", ".")
-        text = text.replace("????", ".")
-        text = text.replace("?????", ".")
-        
-        # Remove any remaining question marks
-        text = text.replace("?", "")
-        
-        # Convert questions to statements - MORE AGGRESSIVE
-        question_starters = [
-            "What is", "How does", "Why do", "When do", "Where do", "Which is",
-            "What are", "How are", "Why are", "When are", "Where are", "Which are",
-            "What", "How", "Why", "When", "Where", "Which"
-        ]
         
         # Split into sentences and process each
         sentences = text.split('.')
@@ -432,46 +543,12 @@ IMPORTANT:
             if not sentence:
                 continue
                 
-            # Check if sentence starts with a question starter
-            for starter in question_starters:
-                if sentence.lower().startswith(starter.lower()):
-                    # Convert question to statement
-                    if starter.lower() == "what is":
-                        sentence = sentence.replace(starter, "This is", 1)
-                    elif starter.lower() == "how does":
-                        sentence = sentence.replace(starter, "This works by", 1)
-                    elif starter.lower() == "why do":
-                        sentence = sentence.replace(starter, "This happens because", 1)
-                    elif starter.lower() == "when do":
-                        sentence = sentence.replace(starter, "This occurs when", 1)
-                    elif starter.lower() == "where do":
-                        sentence = sentence.replace(starter, "This happens in", 1)
-                    elif starter.lower() == "which is":
-                        sentence = sentence.replace(starter, "This is", 1)
-                    elif starter.lower() == "what are":
-                        sentence = sentence.replace(starter, "These are", 1)
-                    elif starter.lower() == "how are":
-                        sentence = sentence.replace(starter, "These work by", 1)
-                    elif starter.lower() == "why are":
-                        sentence = sentence.replace(starter, "These exist because", 1)
-                    elif starter.lower() == "when are":
-                        sentence = sentence.replace(starter, "These occur when", 1)
-                    elif starter.lower() == "where are":
-                        sentence = sentence.replace(starter, "These exist in", 1)
-                    elif starter.lower() == "which are":
-                        sentence = sentence.replace(starter, "These are", 1)
-                    elif starter.lower() == "what":
-                        sentence = sentence.replace(starter, "This", 1)
-                    elif starter.lower() == "how":
-                        sentence = sentence.replace(starter, "This works by", 1)
-                    elif starter.lower() == "why":
-                        sentence = sentence.replace(starter, "This happens because", 1)
-                    elif starter.lower() == "when":
-                        sentence = sentence.replace(starter, "This occurs when", 1)
-                    elif starter.lower() == "where":
-                        sentence = sentence.replace(starter, "This happens in", 1)
-                    elif starter.lower() == "which":
-                        sentence = sentence.replace(starter, "This", 1)
+            # Check if sentence starts with a question starter and convert it
+            # to a statement - MORE AGGRESSIVE
+            lowered = sentence.lower()
+            for starter_lower, starter, statement in _QUESTION_STARTERS:
+                if lowered.startswith(starter_lower):
+                    sentence = sentence.replace(starter, statement, 1)
                     break
             
             cleaned_sentences.append(sentence)
@@ -495,11 +572,15 @@ IMPORTANT:
     ) -> Dict[str, Any]:
         """
         Generate structured content using free alternatives (no API key required)
+        
+        Only OpenAI output is model content; local template and placeholder
+        slides are marked with "fallback": True so ai_cache does not store them.
         """
         try:
             # Try OpenAI API first (if available)
-            if self._try_openai_generation(topic, level, num_slides, avoid_text):
-                return self._try_openai_generation(topic, level, num_slides, avoid_text)
+            data = self._try_openai_generation(topic, level, num_slides, avoid_text)
+            if data:
+                return data
             
             # Fallback to local template-based generation
             return self._generate_local_content(topic, level, num_slides)
@@ -753,20 +834,24 @@ IMPORTANT:
         return {
             'topic': topic,
             'level': level,
-            'slides': slides[:num_slides]
+            'slides': slides[:num_slides],
+            'fallback': True
         }
 
     def fetch_topic_knowledge(self, topic: str) -> Dict[str, Any]:
         """Fetch summary, sections, and image candidates from Wikipedia/Wikimedia."""
         try:
+            # One pooled session, so the three Wikipedia requests share a connection
+            from service_registry import get_http_session
+            session = get_http_session()
             summary_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{requests.utils.quote(topic)}"
-            r = requests.get(summary_url, timeout=10)
+            r = session.get(summary_url, timeout=10)
             data = r.json() if r.status_code == 200 else {}
             images: List[str] = []
             # Try page media-list for richer images
             title = data.get("title", topic)
             media_url = f"https://en.wikipedia.org/api/rest_v1/page/media-list/{requests.utils.quote(title)}"
-            rm = requests.get(media_url, timeout=10)
+            rm = session.get(media_url, timeout=10)
             if rm.status_code == 200:
                 mdata = rm.json()
                 for item in mdata.get("items", []):
@@ -779,7 +864,7 @@ IMPORTANT:
             sections: List[Dict[str, Any]] = []
             try:
                 sec_url = f"https://en.wikipedia.org/api/rest_v1/page/mobile-sections/{requests.utils.quote(title)}"
-                rs = requests.get(sec_url, timeout=10)
+                rs = session.get(sec_url, timeout=10)
                 if rs.status_code == 200:
                     sdata = rs.json()
                     for s in (sdata.get("remaining", []) or []):
@@ -865,7 +950,7 @@ IMPORTANT:
                 "examples": [],
                 "visual_prompts": [f"Topic illustration: {topic}"]
             }]
-        return {"topic": topic, "level": level, "slides": slides[:num_slides]}
+        return {"topic": topic, "level": level, "slides": slides[:num_slides], "fallback": True}
 
     def _build_placeholder_structured(self, topic: str, level: str) -> Dict[str, Any]:
         slides = []
@@ -890,7 +975,7 @@ IMPORTANT:
             "examples": ["Teach a friend"],
             "visual_prompts": ["Summary card"]
         })
-        return {"topic": topic, "level": level, "slides": slides}
+        return {"topic": topic, "level": level, "slides": slides, "fallback": True}
 
     def refine_structured_explainer(self, data: Dict[str, Any], topic: str, level: str = "beginner") -> Dict[str, Any]:
         """Post-process a structured explainer to ensure concrete, useful content.
@@ -955,8 +1040,10 @@ IMPORTANT:
         refined["slides"] = slides
         return refined
 
-    def _categorize_topic(self, topic: str) -> str:
-        """Categorize topic for dynamic content adaptation"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _categorize_topic(topic: str) -> str:
+        """Categorize topic for dynamic content adaptation (memoized per topic)"""
         topic_lower = topic.lower()
         
         # Technology & Science
@@ -1,10 +1,21 @@
 import streamlit as st
 import sys
 import os
+import contextlib
 from datetime import datetime
 import json
+import math
 import tempfile
 import logging
+import random
+import re
+
+# Optional faster JSON encoder for conversation export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -13,14 +24,22 @@ logger = logging.getLogger(__name__)
 # Add current directory to path to import modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from ai_service import AIService
-from video_generator import VideoGenerator
-from mind_map_generator import MindMapGenerator
+# AIService, VideoGenerator and MindMapGenerator pull in heavy dependencies
+# (Gemini SDK, OpenCV, gTTS, Pillow) and are imported inside their getters.
 from notes_generator import NotesGenerator
 from quiz_generator import QuizGenerator
 from study_planner import StudyPlanner
 from config import Config
 
+# Characters that are not safe in download file names
+_SLUG_RE = re.compile(r'[^A-Za-z0-9]+')
+
+# Number of list items rendered per page in long result/schedule views
+PAGE_SIZE = 10
+
+# Seconds a generated notes/quiz/study plan result is shared before regenerating
+AI_RESULT_TTL = 3600
+
 # Page configuration
 st.set_page_config(
     page_title="ZenithIQ - AI Learning Platform",
@@ -120,18 +139,6 @@ def initialize_session_state():
     """Initialize session state variables"""
     if "messages" not in st.session_state:
         st.session_state.messages = []
-    if "ai_service" not in st.session_state:
-        st.session_state.ai_service = None
-    if "video_generator" not in st.session_state:
-        st.session_state.video_generator = None
-    if "mind_map_generator" not in st.session_state:
-        st.session_state.mind_map_generator = None
-    if "notes_generator" not in st.session_state:
-        st.session_state.notes_generator = None
-    if "quiz_generator" not in st.session_state:
-        st.session_state.quiz_generator = None
-    if "study_planner" not in st.session_state:
-        st.session_state.study_planner = None
     if "connection_status" not in st.session_state:
         st.session_state.connection_status = None
     if "last_response" not in st.session_state:
@@ -139,7 +146,7 @@ def initialize_session_state():
     if "generated_video_path" not in st.session_state:
         st.session_state.generated_video_path = None
     if "active_tab" not in st.session_state:
-        st.session_state.active_tab = "Chat"
+        st.session_state.active_tab = "💬 Chat"
     if "explainer_script" not in st.session_state:
         st.session_state.explainer_script = ""
     if "explainer_video_path" not in st.session_state:
@@ -152,70 +159,143 @@ def initialize_session_state():
         st.session_state.reference_video_path = None
 
 def initialize_services():
-    """Initialize all AI services lazily (only when needed)"""
-    try:
-        # Don't initialize services immediately - just set them to None
-        # They will be initialized when first used
-        if st.session_state.ai_service is None:
-            st.session_state.ai_service = None
-        if st.session_state.video_generator is None:
-            st.session_state.video_generator = None
-        if st.session_state.mind_map_generator is None:
-            st.session_state.mind_map_generator = None
-        if st.session_state.notes_generator is None:
-            st.session_state.notes_generator = None
-        if st.session_state.quiz_generator is None:
-            st.session_state.quiz_generator = None
-        if st.session_state.study_planner is None:
-            st.session_state.study_planner = None
-        
-        st.session_state.connection_status = "ready"
-        return True
-    except Exception as e:
-        st.session_state.connection_status = "error"
-        return False
+    """Mark services as ready; instances are created lazily by the cached getters"""
+    st.session_state.connection_status = "ready"
+    return True
 
+@st.cache_resource(show_spinner="Initializing AI Service...")
 def get_ai_service():
-    """Get AI service instance, initializing if needed"""
-    if st.session_state.ai_service is None:
-        with st.spinner("Initializing AI Service..."):
-            st.session_state.ai_service = AIService()
-    return st.session_state.ai_service
+    """Get the shared AI service instance, created once per server process"""
+    from ai_service import AIService
+    return AIService()
 
+@st.cache_resource(show_spinner="Initializing Video Generator...")
 def get_video_generator():
-    """Get video generator instance, initializing if needed"""
-    if st.session_state.video_generator is None:
-        with st.spinner("Initializing Video Generator..."):
-            st.session_state.video_generator = VideoGenerator()
-    return st.session_state.video_generator
+    """Get the shared video generator instance, created once per server process"""
+    from video_generator import VideoGenerator
+    return VideoGenerator()
 
+@st.cache_resource(show_spinner="Initializing Mind Map Generator...")
 def get_mind_map_generator():
-    """Get mind map generator instance, initializing if needed"""
-    if st.session_state.mind_map_generator is None:
-        with st.spinner("Initializing Mind Map Generator..."):
-            st.session_state.mind_map_generator = MindMapGenerator()
-    return st.session_state.mind_map_generator
+    """Get the shared mind map generator instance, created once per server process"""
+    from mind_map_generator import MindMapGenerator
+    return MindMapGenerator()
 
+@st.cache_resource(show_spinner="Initializing Notes Generator...")
 def get_notes_generator():
-    """Get notes generator instance, initializing if needed"""
-    if st.session_state.notes_generator is None:
-        with st.spinner("Initializing Notes Generator..."):
-            st.session_state.notes_generator = NotesGenerator()
-    return st.session_state.notes_generator
+    """Get the shared notes generator instance, created once per server process"""
+    return NotesGenerator()
 
+@st.cache_resource(show_spinner="Initializing Quiz Generator...")
 def get_quiz_generator():
-    """Get quiz generator instance, initializing if needed"""
-    if st.session_state.quiz_generator is None:
-        with st.spinner("Initializing Quiz Generator..."):
-            st.session_state.quiz_generator = QuizGenerator()
-    return st.session_state.quiz_generator
+    """Get the shared quiz generator instance, created once per server process"""
+    return QuizGenerator()
 
+@st.cache_resource(show_spinner="Initializing Study Planner...")
 def get_study_planner():
-    """Get study planner instance, initializing if needed"""
-    if st.session_state.study_planner is None:
-        with st.spinner("Initializing Study Planner..."):
-            st.session_state.study_planner = StudyPlanner()
-    return st.session_state.study_planner
+    """Get the shared study planner instance, created once per server process"""
+    return StudyPlanner()
+
+def _model_name(ai_service):
+    """Model identifier used to key cached AI outputs"""
+    return ai_service.get_model_info().get("model_name", "")
+
+class FallbackResult(Exception):
+    """Carries a generator's fallback content out of an st.cache_data function
+    
+    st.cache_data does not cache exceptions, so raising this keeps stand-in
+    content from a failed AI call from being served to every session.
+    """
+    
+    def __init__(self, result):
+        super().__init__("AI generation fell back to stand-in content")
+        self.result = result
+
+def _model_result(result):
+    """Return result, raising FallbackResult if it is marked as fallback content"""
+    if result.get("fallback"):
+        raise FallbackResult(result)
+    return result
+
+def cached_or_fresh(cached_call, fresh_call, regenerate=False):
+    """Result of cached_call, or of fresh_call when regenerate bypasses the cache
+    
+    Fallback content is returned to the caller but never cached.
+    """
+    if regenerate:
+        return fresh_call()
+    try:
+        return cached_call()
+    except FallbackResult as e:
+        return e.result
+
+@st.cache_data(show_spinner=False, ttl=AI_RESULT_TTL)
+def cached_generate_notes(topic, note_type, model_name, _notes_generator, _ai_service):
+    """Generate study notes, reusing earlier results for the same topic and type"""
+    return _model_result(_notes_generator.generate_notes(topic, _ai_service, note_type))
+
+@st.cache_data(show_spinner=False, ttl=AI_RESULT_TTL)
+def cached_generate_quiz(topic, quiz_type, num_questions, difficulty, model_name, _quiz_generator, _ai_service):
+    """Generate a quiz, reusing earlier results for the same parameters"""
+    return _model_result(_quiz_generator.generate_quiz(topic, _ai_service, quiz_type, num_questions, difficulty))
+
+@st.cache_data(show_spinner=False, ttl=AI_RESULT_TTL)
+def cached_generate_study_plan(topic, study_duration, hours_per_day, difficulty, study_method, model_name, _study_planner, _ai_service):
+    """Generate a study plan, reusing earlier results for the same parameters"""
+    return _model_result(_study_planner.generate_study_plan(
+        topic, _ai_service, study_duration, hours_per_day, difficulty, study_method
+    ))
+
+@st.cache_data(show_spinner=False)
+def cached_notes_markdown(notes_data, _notes_generator):
+    """Markdown export of notes, rebuilt only when the notes change"""
+    return _notes_generator.export_notes_to_markdown_str(notes_data).encode("utf-8")
+
+@st.cache_data(show_spinner=False)
+def cached_quiz_markdown(quiz_data, _quiz_generator):
+    """Markdown export of a quiz, rebuilt only when the quiz changes"""
+    return _quiz_generator.export_quiz_to_markdown_str(quiz_data).encode("utf-8")
+
+@st.cache_data(show_spinner=False)
+def cached_study_plan_markdown(plan, _study_planner):
+    """Markdown export of a study plan, rebuilt only when the plan changes"""
+    return _study_planner.export_study_plan_to_markdown_str(plan).encode("utf-8")
+
+def slugify(topic):
+    """Filename-safe slug for a topic, e.g. 'C++ basics?' -> 'C_basics'"""
+    return _SLUG_RE.sub('_', topic.strip()).strip('_') or "topic"
+
+def paginate(items, key, page_size=PAGE_SIZE):
+    """Return the page of items selected by a page control and its start offset"""
+    if len(items) <= page_size:
+        return items, 0
+    num_pages = math.ceil(len(items) / page_size)
+    page = st.number_input("Page", min_value=1, max_value=num_pages, value=1, key=key)
+    start = (page - 1) * page_size
+    return items[start:start + page_size], start
+
+def collect_quiz_answers(quiz_data):
+    """Build the grading answers dict from the quiz form widgets on submit"""
+    quiz_type = quiz_data.get('quiz_type')
+    answers = {}
+    
+    if quiz_type == 'matching':
+        items = quiz_data.get('items', [])
+        order = st.session_state.get('matching_order') or list(range(len(items)))
+        definitions = st.session_state.get('matching_defs') or [item.get('definition', '') for item in items]
+        # Map each entered letter back to its definition for the displayed term
+        for i, item_index in enumerate(order):
+            answer = st.session_state.get(f"q{i}", "")
+            letter = answer.strip().upper()
+            if len(letter) == 1 and 0 <= ord(letter) - 65 < len(definitions):
+                answer = definitions[ord(letter) - 65]
+            answers[str(item_index)] = answer
+        return answers
+    
+    for i in range(len(quiz_data.get('questions', []))):
+        answer = st.session_state.get(f"q{i}", "")
+        answers[str(i)] = answer == "True" if quiz_type == 'true_false' else answer
+    return answers
 
 def display_chat_history():
     """Display chat history with improved styling"""
@@ -236,20 +316,37 @@ def display_chat_history():
                 </div>
                 """, unsafe_allow_html=True)
 
+def _serialize_conversation(messages, last_response):
+    """Serialize the conversation as indented JSON bytes, timestamped now"""
+    conversation_data = {
+        "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"),
+        "messages": messages,
+        "last_response": last_response
+    }
+    
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(conversation_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(conversation_data, indent=2).encode("utf-8")
+
 def export_conversation():
-    """Export conversation to JSON file"""
-    if st.session_state.messages:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"conversation_{timestamp}.json"
-        
-        conversation_data = {
-            "timestamp": timestamp,
-            "messages": st.session_state.messages,
-            "last_response": st.session_state.last_response
-        }
-        
-        return json.dumps(conversation_data, indent=2), filename
-    return None, None
+    """Export conversation to JSON bytes and a download file name
+    
+    The JSON is memoized in this session's state and rebuilt only when the
+    message count or last message timestamp changes; the file name is
+    stamped with the current time on every call.
+    """
+    messages = st.session_state.messages
+    if not messages:
+        return None, None
+    
+    key = (len(messages), messages[-1].get("timestamp"))
+    cached = st.session_state.get("conversation_export")
+    if cached is None or cached[0] != key:
+        cached = st.session_state.conversation_export = (
+            key, _serialize_conversation(messages, st.session_state.last_response)
+        )
+    filename = f"conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    return cached[1], filename
 
 def generate_video_with_progress(text, duration, video_settings):
     """Generate fast video with progress tracking"""
@@ -523,7 +620,7 @@ def video_generator_interface():
                 if st.button("🗑️ Delete Video", type="secondary", use_container_width=True, key="delete_existing_video"):
                     try:
                         # Delete the video file
-                        if os.path.exists(st.session_state.explainer_video_path):
+                        with contextlib.suppress(FileNotFoundError):
                             os.unlink(st.session_state.explainer_video_path)
                         # Clear the session state
                         st.session_state.explainer_video_path = None
@@ -556,10 +653,11 @@ def mind_map_interface():
             else:
                 with st.spinner("Creating mind map..."):
                     try:
+                        mind_map_generator = get_mind_map_generator()
+                        ai_service = get_ai_service()
+                        
                         if output_format == "Image":
                             # Generate mind map structure
-                            mind_map_generator = get_mind_map_generator()
-                            ai_service = get_ai_service()
                             mind_map_data = mind_map_generator.generate_mind_map_structure(
                                 topic.strip(), ai_service
                             )
@@ -567,22 +665,23 @@ def mind_map_interface():
                             # Create mind map image
                             image_path = mind_map_generator.create_mind_map_image(mind_map_data)
                             
-                            # Display image
-                            st.image(image_path, caption=f"Mind Map: {topic}", use_column_width=True)
-                            
-                            # Download button
-                            with open(image_path, "rb") as file:
-                                st.download_button(
-                                    label="⬇️ Download Mind Map Image",
-                                    data=file.read(),
-                                    file_name=f"mind_map_{topic.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png",
-                                    mime="image/png",
-                                    use_container_width=True
-                                )
-                            
-                            # Cleanup
-                            if os.path.exists(image_path):
-                                os.unlink(image_path)
+                            try:
+                                # Display image
+                                st.image(image_path, caption=f"Mind Map: {topic}", use_column_width=True)
+                                
+                                # Download button
+                                with open(image_path, "rb") as file:
+                                    st.download_button(
+                                        label="⬇️ Download Mind Map Image",
+                                        data=file.read(),
+                                        file_name=f"mind_map_{slugify(topic)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png",
+                                        mime="image/png",
+                                        use_container_width=True
+                                    )
+                            finally:
+                                # Cleanup
+                                with contextlib.suppress(FileNotFoundError):
+                                    os.unlink(image_path)
                         
                         else:  # Video format
                             # Generate mind map video
@@ -590,22 +689,23 @@ def mind_map_interface():
                                 topic.strip(), ai_service
                             )
                             
-                            # Display video
-                            st.video(video_path)
-                            
-                            # Download button
-                            with open(video_path, "rb") as file:
-                                st.download_button(
-                                    label="⬇️ Download Mind Map Video",
-                                    data=file.read(),
-                                    file_name=f"mind_map_{topic.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4",
-                                    mime="video/mp4",
-                                    use_container_width=True
-                                )
-                            
-                            # Cleanup
-                            if os.path.exists(video_path):
-                                os.unlink(video_path)
+                            try:
+                                # Display video
+                                st.video(video_path)
+                                
+                                # Download button
+                                with open(video_path, "rb") as file:
+                                    st.download_button(
+                                        label="⬇️ Download Mind Map Video",
+                                        data=file.read(),
+                                        file_name=f"mind_map_{slugify(topic)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4",
+                                        mime="video/mp4",
+                                        use_container_width=True
+                                    )
+                            finally:
+                                # Cleanup
+                                with contextlib.suppress(FileNotFoundError):
+                                    os.unlink(video_path)
                         
                         st.success("✅ Mind map generated successfully!")
                         
@@ -630,6 +730,8 @@ def notes_interface():
         with col2:
             note_type = st.selectbox("Note Type", ["comprehensive", "summary", "flashcards", "study_guide"], index=0, help="Choose the type of notes to generate")
         
+        regenerate = st.checkbox("🔄 Regenerate (skip cached notes)", key="regenerate_notes")
+        
         if st.button("📝 Generate Notes", use_container_width=True, key="generate_notes"):
             if not topic.strip():
                 st.warning("Please enter a topic for the notes.")
@@ -639,8 +741,13 @@ def notes_interface():
                         # Generate notes
                         notes_generator = get_notes_generator()
                         ai_service = get_ai_service()
-                        notes_data = notes_generator.generate_notes(
-                            topic.strip(), ai_service, note_type
+                        notes_data = cached_or_fresh(
+                            lambda: cached_generate_notes(
+                                topic.strip(), note_type, _model_name(ai_service),
+                                notes_generator, ai_service
+                            ),
+                            lambda: notes_generator.generate_notes(topic.strip(), ai_service, note_type),
+                            regenerate
                         )
                         
                         # Display notes
@@ -701,25 +808,73 @@ def notes_interface():
                                     st.markdown(f"**Duration:** {step.get('duration', '')}")
                         
                         # Export to Markdown
-                        markdown_path = st.session_state.notes_generator.export_notes_to_markdown(notes_data)
-                        with open(markdown_path, "rb") as file:
-                            st.download_button(
-                                label="⬇️ Download Notes (Markdown)",
-                                data=file.read(),
-                                file_name=f"notes_{topic.replace(' ', '_')}_{note_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                                mime="text/markdown",
-                                use_container_width=True
-                            )
-                        
-                        # Cleanup
-                        if os.path.exists(markdown_path):
-                            os.unlink(markdown_path)
+                        st.download_button(
+                            label="⬇️ Download Notes (Markdown)",
+                            data=cached_notes_markdown(notes_data, notes_generator),
+                            file_name=f"notes_{slugify(topic)}_{note_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+                            mime="text/markdown",
+                            use_container_width=True
+                        )
                         
                         st.success("✅ Study notes generated successfully!")
                         
                     except Exception as e:
                         st.error(f"❌ Failed to generate notes: {e}")
 
+def _render_multiple_choice(quiz_data):
+    """Render multiple choice questions inside the quiz form"""
+    for i, question in enumerate(quiz_data.get('questions', [])):
+        st.markdown(f"**{i+1}.** {question.get('question', '')}")
+        options = question.get('options', [])
+        st.radio(f"Answer for question {i+1}", options, key=f"q{i}")
+
+def _render_true_false(quiz_data):
+    """Render true/false statements inside the quiz form"""
+    for i, question in enumerate(quiz_data.get('questions', [])):
+        st.markdown(f"**{i+1}.** {question.get('statement', '')}")
+        st.radio(f"Answer for question {i+1}", ["True", "False"], key=f"q{i}")
+
+def _render_fill_blank(quiz_data):
+    """Render fill-in-the-blank sentences inside the quiz form"""
+    for i, question in enumerate(quiz_data.get('questions', [])):
+        st.markdown(f"**{i+1}.** {question.get('sentence', '')}")
+        st.text_input(f"Answer for question {i+1}", key=f"q{i}")
+
+def _render_matching(quiz_data):
+    """Render matching terms and definitions inside the quiz form"""
+    items = quiz_data.get('items', [])
+    st.markdown("Match each term with its definition:")
+    
+    # Order was shuffled once when the quiz was generated
+    order = st.session_state.get('matching_order') or list(range(len(items)))
+    definitions = st.session_state.get('matching_defs') or [item.get('definition', '') for item in items]
+    
+    for i, item_index in enumerate(order):
+        st.markdown(f"**{i+1}.** {items[item_index].get('term', '')}")
+    
+    st.markdown("**Definitions:**")
+    for i, definition in enumerate(definitions):
+        st.markdown(f"**{chr(65+i)}.** {definition}")
+    
+    # Simple matching interface
+    for i in range(len(order)):
+        st.text_input(f"Match for term {i+1} (enter A, B, C, etc.)", key=f"q{i}")
+
+def _render_essay(quiz_data):
+    """Render essay prompts inside the quiz form"""
+    for i, question in enumerate(quiz_data.get('questions', [])):
+        st.markdown(f"**{i+1}.** {question.get('prompt', '')}")
+        st.markdown(f"**Suggested Length:** {question.get('suggested_length', '')}")
+        st.text_area(f"Answer for question {i+1}", key=f"q{i}", height=150)
+
+QUIZ_RENDERERS = {
+    "multiple_choice": _render_multiple_choice,
+    "true_false": _render_true_false,
+    "fill_blank": _render_fill_blank,
+    "matching": _render_matching,
+    "essay": _render_essay
+}
+
 def quiz_interface():
     """Quiz generator interface tab"""
     st.markdown("### ❓ Quiz Generator")
@@ -744,6 +899,8 @@ def quiz_interface():
         with col4:
             difficulty = st.selectbox("Difficulty", ["easy", "medium", "hard"], index=1, help="Quiz difficulty level")
         
+        regenerate = st.checkbox("🔄 Regenerate (skip cached quiz)", key="regenerate_quiz")
+        
         if st.button("❓ Generate Quiz", use_container_width=True, key="generate_quiz"):
             if not topic.strip():
                 st.warning("Please enter a topic for the quiz.")
@@ -753,13 +910,29 @@ def quiz_interface():
                         # Generate quiz
                         quiz_generator = get_quiz_generator()
                         ai_service = get_ai_service()
-                        quiz_data = quiz_generator.generate_quiz(
-                            topic.strip(), ai_service, quiz_type, num_questions, difficulty
+                        quiz_data = cached_or_fresh(
+                            lambda: cached_generate_quiz(
+                                topic.strip(), quiz_type, num_questions, difficulty,
+                                _model_name(ai_service), quiz_generator, ai_service
+                            ),
+                            lambda: quiz_generator.generate_quiz(
+                                topic.strip(), ai_service, quiz_type, num_questions, difficulty
+                            ),
+                            regenerate
                         )
                         
                         # Store quiz data in session state
                         st.session_state.current_quiz = quiz_data
                         st.session_state.quiz_answers = {}
+                        st.session_state.quiz_results = None
+                        st.session_state.quiz_filename = f"quiz_{slugify(topic)}_{quiz_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+                        
+                        # Fix the matching order once so reruns keep the same layout
+                        items = quiz_data.get('items', [])
+                        st.session_state.matching_order = random.sample(range(len(items)), len(items))
+                        st.session_state.matching_defs = random.sample(
+                            [item.get('definition', '') for item in items], len(items)
+                        )
                         
                         st.success("✅ Quiz generated successfully!")
                         st.rerun()
@@ -779,101 +952,62 @@ def quiz_interface():
             
             # Quiz interface
             with st.form("quiz_form"):
-                if quiz_data.get('quiz_type') == 'multiple_choice':
-                    for i, question in enumerate(quiz_data.get('questions', [])):
-                        st.markdown(f"**{i+1}.** {question.get('question', '')}")
-                        options = question.get('options', [])
-                        answer = st.radio(f"Answer for question {i+1}", options, key=f"q{i}")
-                        st.session_state.quiz_answers[str(i)] = answer
-                
-                elif quiz_data.get('quiz_type') == 'true_false':
-                    for i, question in enumerate(quiz_data.get('questions', [])):
-                        st.markdown(f"**{i+1}.** {question.get('statement', '')}")
-                        answer = st.radio(f"Answer for question {i+1}", ["True", "False"], key=f"q{i}")
-                        st.session_state.quiz_answers[str(i)] = answer == "True"
-                
-                elif quiz_data.get('quiz_type') == 'fill_blank':
-                    for i, question in enumerate(quiz_data.get('questions', [])):
-                        st.markdown(f"**{i+1}.** {question.get('sentence', '')}")
-                        answer = st.text_input(f"Answer for question {i+1}", key=f"q{i}")
-                        st.session_state.quiz_answers[str(i)] = answer
-                
-                elif quiz_data.get('quiz_type') == 'matching':
-                    items = quiz_data.get('items', [])
-                    st.markdown("Match each term with its definition:")
-                    
-                    # Shuffle items for quiz
-                    import random
-                    shuffled_items = items.copy()
-                    random.shuffle(shuffled_items)
-                    
-                    for i, item in enumerate(shuffled_items):
-                        st.markdown(f"**{i+1}.** {item.get('term', '')}")
-                    
-                    st.markdown("**Definitions:**")
-                    definitions = [item.get('definition', '') for item in items]
-                    random.shuffle(definitions)
-                    
-                    for i, definition in enumerate(definitions):
-                        st.markdown(f"**{chr(65+i)}.** {definition}")
-                    
-                    # Simple matching interface
-                    for i in range(len(items)):
-                        answer = st.text_input(f"Match for term {i+1} (enter A, B, C, etc.)", key=f"q{i}")
-                        st.session_state.quiz_answers[str(i)] = answer
-                
-                elif quiz_data.get('quiz_type') == 'essay':
-                    for i, question in enumerate(quiz_data.get('questions', [])):
-                        st.markdown(f"**{i+1}.** {question.get('prompt', '')}")
-                        st.markdown(f"**Suggested Length:** {question.get('suggested_length', '')}")
-                        answer = st.text_area(f"Answer for question {i+1}", key=f"q{i}", height=150)
-                        st.session_state.quiz_answers[str(i)] = answer
+                renderer = QUIZ_RENDERERS.get(quiz_data.get('quiz_type'))
+                if renderer:
+                    renderer(quiz_data)
                 
                 submitted = st.form_submit_button("📊 Grade Quiz", use_container_width=True)
                 
                 if submitted:
                     try:
-                        # Grade the quiz
-                        results = quiz_generator.grade_quiz(quiz_data, st.session_state.quiz_answers)
-                        
-                        # Display results
-                        st.markdown("## 📊 Quiz Results")
-                        st.markdown(f"**Score:** {results.get('score_percentage', 0)}%")
-                        st.markdown(f"**Correct Answers:** {results.get('correct_answers', 0)}/{results.get('total_questions', 0)}")
-                        st.markdown(f"**Status:** {'✅ Passed' if results.get('passed', False) else '❌ Failed'}")
-                        st.markdown(f"**Feedback:** {results.get('feedback', '')}")
-                        
-                        # Detailed results
-                        with st.expander("📋 Detailed Results"):
-                            for i, result in enumerate(results.get('detailed_results', []), 1):
-                                status = "✅" if result.get('correct', False) else "❌"
-                                question_text = result.get('question', result.get('statement', result.get('sentence', '')))
-                                st.markdown(f"**{i}.** {status} {question_text}")
-                                if not result.get('correct', False):
-                                    st.markdown(f"   Your answer: {result.get('user_answer', '')}")
-                                    st.markdown(f"   Correct answer: {result.get('correct_answer', '')}")
-                                st.markdown(f"   Explanation: {result.get('explanation', '')}")
-                        
+                        # Collect answers from widget state and grade the quiz
+                        st.session_state.quiz_answers = collect_quiz_answers(quiz_data)
+                        st.session_state.quiz_results = get_quiz_generator().grade_quiz(
+                            quiz_data, st.session_state.quiz_answers
+                        )
                     except Exception as e:
                         st.error(f"❌ Failed to grade quiz: {e}")
             
+            # Display results (kept in session state so paging survives reruns)
+            results = st.session_state.get('quiz_results')
+            if results:
+                st.markdown("## 📊 Quiz Results")
+                st.markdown(f"**Score:** {results.get('score_percentage', 0)}%")
+                st.markdown(f"**Correct Answers:** {results.get('correct_answers', 0)}/{results.get('total_questions', 0)}")
+                st.markdown(f"**Status:** {'✅ Passed' if results.get('passed', False) else '❌ Failed'}")
+                st.markdown(f"**Feedback:** {results.get('feedback', '')}")
+                
+                # Detailed results
+                with st.expander("📋 Detailed Results"):
+                    page_results, offset = paginate(results.get('detailed_results', []), key="quiz_results_page")
+                    # Build the page as one Markdown block instead of one element per line
+                    lines = []
+                    for i, result in enumerate(page_results, offset + 1):
+                        correct = result.get('correct', False)
+                        question_text = result.get('question') or result.get('statement') or result.get('sentence') or ''
+                        lines.append(f"**{i}.** {'✅' if correct else '❌'} {question_text}")
+                        if not correct:
+                            lines.append(f"   Your answer: {result.get('user_answer', '')}")
+                            lines.append(f"   Correct answer: {result.get('correct_answer', '')}")
+                        lines.append(f"   Explanation: {result.get('explanation', '')}")
+                    st.markdown("\n\n".join(lines))
+            
             # Export quiz
             col1, col2 = st.columns([1, 1])
             with col1:
-                markdown_path = quiz_generator.export_quiz_to_markdown(quiz_data)
-                with open(markdown_path, "rb") as file:
-                    st.download_button(
-                        label="⬇️ Download Quiz (Markdown)",
-                        data=file.read(),
-                        file_name=f"quiz_{topic.replace(' ', '_')}_{quiz_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                        mime="text/markdown",
-                        use_container_width=True
-                    )
+                st.download_button(
+                    label="⬇️ Download Quiz (Markdown)",
+                    data=cached_quiz_markdown(quiz_data, get_quiz_generator()),
+                    file_name=st.session_state.get('quiz_filename', "quiz.md"),
+                    mime="text/markdown",
+                    use_container_width=True
+                )
             
             with col2:
                 if st.button("🔄 New Quiz", use_container_width=True):
                     st.session_state.current_quiz = None
                     st.session_state.quiz_answers = {}
+                    st.session_state.quiz_results = None
                     st.rerun()
 
 def study_planner_interface():
@@ -902,6 +1036,8 @@ def study_planner_interface():
         with col5:
             study_method = st.selectbox("Study Method", ["pomodoro", "traditional", "intensive", "casual"], index=0, help="Study technique to use")
         
+        regenerate = st.checkbox("🔄 Regenerate (skip cached plan)", key="regenerate_study_plan")
+        
         if st.button("📅 Generate Study Plan", use_container_width=True, key="generate_study_plan"):
             if not topic.strip():
                 st.warning("Please enter a topic for the study plan.")
@@ -911,12 +1047,21 @@ def study_planner_interface():
                         # Generate study plan
                         study_planner = get_study_planner()
                         ai_service = get_ai_service()
-                        study_plan = study_planner.generate_study_plan(
-                            topic.strip(), ai_service, study_duration, hours_per_day, difficulty, study_method
+                        study_plan = cached_or_fresh(
+                            lambda: cached_generate_study_plan(
+                                topic.strip(), study_duration, hours_per_day, difficulty, study_method,
+                                _model_name(ai_service), study_planner, ai_service
+                            ),
+                            lambda: study_planner.generate_study_plan(
+                                topic.strip(), ai_service, study_duration, hours_per_day,
+                                difficulty, study_method
+                            ),
+                            regenerate
                         )
                         
                         # Store study plan in session state
                         st.session_state.current_study_plan = study_plan
+                        st.session_state.study_plan_filename = f"study_plan_{slugify(topic)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
                         
                         st.success("✅ Study plan generated successfully!")
                         st.rerun()
@@ -932,17 +1077,16 @@ def study_planner_interface():
             st.markdown(f"**Duration:** {plan.get('study_duration', 0)} days | **Hours per Day:** {plan.get('hours_per_day', 0)} | **Method:** {plan.get('study_method', '').title()}")
             
             # Progress tracking
-            progress = plan.get('progress_tracking', {})
+            progress = plan.get('progress_tracking') or {}
+            metrics = (
+                ("Total Units", progress.get('total_units', 0)),
+                ("Completed Units", progress.get('completed_units', 0)),
+                ("Total Hours", progress.get('total_hours', 0)),
+                ("Progress", f"{progress.get('progress_percentage', 0):.1f}%")
+            )
             st.markdown("### 📊 Progress Tracking")
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Units", progress.get('total_units', 0))
-            with col2:
-                st.metric("Completed Units", progress.get('completed_units', 0))
-            with col3:
-                st.metric("Total Hours", progress.get('total_hours', 0))
-            with col4:
-                st.metric("Progress", f"{progress.get('progress_percentage', 0):.1f}%")
+            for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+                col.metric(label, value)
             
             # Learning objectives
             with st.expander("🎯 Learning Objectives"):
@@ -954,7 +1098,8 @@ def study_planner_interface():
             
             # Topic breakdown
             with st.expander("📚 Topic Breakdown"):
-                for i, unit in enumerate(plan.get('topic_breakdown', []), 1):
+                page_units, offset = paginate(plan.get('topic_breakdown', []), key="topic_breakdown_page")
+                for i, unit in enumerate(page_units, offset + 1):
                     st.markdown(f"**{i}.** {unit.get('title', '')}")
                     st.write(unit.get('description', ''))
                     st.markdown(f"   - Hours: {unit.get('estimated_hours', 0)}")
@@ -963,10 +1108,15 @@ def study_planner_interface():
             # Study schedule
             with st.expander("📅 Study Schedule"):
                 schedule = plan.get('schedule', {})
-                for daily in schedule.get('daily_schedules', []):
-                    st.markdown(f"### Day {daily.get('day', '')} - {daily.get('day_of_week', '')}")
-                    for session in daily.get('sessions', []):
-                        st.markdown(f"- **{session.get('unit', '')}** ({session.get('duration', 0)} hours)")
+                page_days, _ = paginate(schedule.get('daily_schedules', []), key="schedule_page")
+                lines = []
+                for daily in page_days:
+                    lines.append(f"### Day {daily.get('day', '')} - {daily.get('day_of_week', '')}")
+                    lines.append("\n".join(
+                        f"- **{session.get('unit', '')}** ({session.get('duration', 0)} hours)"
+                        for session in daily.get('sessions', [])
+                    ))
+                st.markdown("\n\n".join(lines))
             
             # Study tips
             with st.expander("💡 Study Tips"):
@@ -1008,15 +1158,13 @@ def study_planner_interface():
             # Export study plan
             col1, col2 = st.columns([1, 1])
             with col1:
-                markdown_path = study_planner.export_study_plan_to_markdown(plan)
-                with open(markdown_path, "rb") as file:
-                    st.download_button(
-                        label="⬇️ Download Study Plan (Markdown)",
-                        data=file.read(),
-                        file_name=f"study_plan_{topic.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                        mime="text/markdown",
-                        use_container_width=True
-                    )
+                st.download_button(
+                    label="⬇️ Download Study Plan (Markdown)",
+                    data=cached_study_plan_markdown(plan, get_study_planner()),
+                    file_name=st.session_state.get('study_plan_filename', "study_plan.md"),
+                    mime="text/markdown",
+                    use_container_width=True
+                )
             
             with col2:
                 if st.button("🔄 New Study Plan", use_container_width=True):
@@ -1073,38 +1221,27 @@ def main():
         st.metric("Messages", len(st.session_state.messages))
         
         if st.session_state.messages:
-            user_messages = len([m for m in st.session_state.messages if m["role"] == "user"])
-            ai_messages = len([m for m in st.session_state.messages if m["role"] == "assistant"])
+            # Single pass; every non-user message is an assistant response
+            user_messages = sum(1 for m in st.session_state.messages if m["role"] == "user")
+            ai_messages = len(st.session_state.messages) - user_messages
             st.metric("User Messages", user_messages)
             st.metric("AI Responses", ai_messages)
     
-    # Main content area with tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "💬 Chat", 
-        "📹 Video Generator", 
-        "🗺️ Mind Maps", 
-        "📝 Study Notes", 
-        "❓ Quizzes", 
-        "📅 Study Planner"
-    ])
-    
-    with tab1:
-        chat_interface()
-    
-    with tab2:
-        video_generator_interface()
-    
-    with tab3:
-        mind_map_interface()
-    
-    with tab4:
-        notes_interface()
-    
-    with tab5:
-        quiz_interface()
-    
-    with tab6:
-        study_planner_interface()
+    # Main content area. A radio-driven tab bar is used instead of st.tabs
+    # because st.tabs executes every tab body on each rerun; this way only
+    # the selected section is rendered.
+    tabs = {
+        "💬 Chat": chat_interface,
+        "📹 Video Generator": video_generator_interface,
+        "🗺️ Mind Maps": mind_map_interface,
+        "📝 Study Notes": notes_interface,
+        "❓ Quizzes": quiz_interface,
+        "📅 Study Planner": study_planner_interface
+    }
+    active_tab = st.radio(
+        "Section", list(tabs), horizontal=True, key="active_tab", label_visibility="collapsed"
+    )
+    tabs[active_tab]()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,10 +4,51 @@ Debug script to identify and fix audio generation issues
 """
 
 import os
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import shutil
 import tempfile
-from video_generator import VideoGenerator
-from ai_service import AIService
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from service_registry import get_ai_service, get_video_generator
+
+# Per-user cache for the merge test's input audio (TTS itself is always
+# exercised by test_tts_generation)
+TTS_CACHE_DIR = os.path.expanduser(os.getenv("TTS_CACHE_DIR", "~/.cache/majorprozenith/tts"))
+
+@functools.lru_cache(maxsize=1)
+def ffmpeg_exe():
+    """Path to the imageio-ffmpeg binary, resolved once per process"""
+    import imageio_ffmpeg
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+@functools.lru_cache(maxsize=1)
+def ffmpeg_version_check():
+    """Run `ffmpeg -version` once per process and return the completed process"""
+    return subprocess.run([ffmpeg_exe(), "-version"], 
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          text=True, timeout=10)
+
+def _remove_if_exists(path: str):
+    """Delete a scratch file, ignoring one that is already gone"""
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+def cached_tts(video_generator, text: str) -> str:
+    """Return an mp3 for text, reusing the copy from an earlier run when present"""
+    key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    path = os.path.join(TTS_CACHE_DIR, f"tts_{key}.mp3")
+    if not os.path.exists(path):
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        # Move to a private name, then rename into place, so concurrent
+        # runs never see (or clobber) a partial file
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.move(video_generator.text_to_speech(text), temp_path)
+        os.replace(temp_path, path)
+    return path
 
 def test_tts_generation():
     """Test TTS generation step by step"""
@@ -16,22 +57,23 @@ def test_tts_generation():
     
     try:
         # Initialize services
-        video_generator = VideoGenerator()
-        ai_service = AIService()
+        video_generator = get_video_generator()
+        ai_service = get_ai_service()
         print("✅ Services initialized successfully!")
         
         # Test text
         test_text = "This is a test of the text to speech system. It should generate clear audio."
         print(f"📝 Test text: {test_text}")
         
-        # Test TTS generation
+        # Test TTS generation (always a fresh call, so a broken TTS is reported)
         print("\n🎤 Testing TTS generation...")
         audio_path = video_generator.text_to_speech(test_text)
         
-        if os.path.exists(audio_path):
+        if audio_path and os.path.exists(audio_path):
             file_size = os.path.getsize(audio_path)
             print(f"✅ Audio file generated: {audio_path}")
             print(f"📁 File size: {file_size} bytes")
+            _remove_if_exists(audio_path)
             
             # Check if file is not empty
             if file_size > 100:
@@ -55,13 +97,10 @@ def test_ffmpeg_availability():
     
     try:
         # Check if imageio-ffmpeg is available
-        import imageio_ffmpeg
-        ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-        print(f"✅ FFmpeg found: {ffmpeg_exe}")
+        print(f"✅ FFmpeg found: {ffmpeg_exe()}")
         
         # Test ffmpeg command
-        result = subprocess.run([ffmpeg_exe, "-version"], 
-                              capture_output=True, text=True, timeout=10)
+        result = ffmpeg_version_check()
         if result.returncode == 0:
             print("✅ FFmpeg is working correctly")
             return True
@@ -79,65 +118,48 @@ def test_audio_merging():
     print("\n🔍 Testing audio merging...")
     
     try:
-        # Create a simple test video (1 second, black frame)
-        import cv2
-        import numpy as np
-        
-        # Create test video
-        test_video = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
-        test_video.close()
-        
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        writer = cv2.VideoWriter(test_video.name, fourcc, 24, (640, 480))
-        
-        # Write 24 frames (1 second at 24fps)
-        for _ in range(24):
-            frame = np.zeros((480, 640, 3), dtype=np.uint8)
-            writer.write(frame)
-        writer.release()
-        
-        # Create test audio
-        video_generator = VideoGenerator()
-        test_text = "This is a test audio for merging."
-        audio_path = video_generator.text_to_speech(test_text)
-        
-        # Test merging
-        import imageio_ffmpeg
-        ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-        
-        output_path = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
-        output_path.close()
-        
-        cmd = [
-            ffmpeg_exe, "-y",
-            "-i", test_video.name,
-            "-i", audio_path,
-            "-c:v", "libx264",
-            "-c:a", "aac",
-            "-shortest",
-            output_path.name
-        ]
-        
-        print(f"🔄 Running FFmpeg command: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
-            if os.path.exists(output_path.name):
-                file_size = os.path.getsize(output_path.name)
-                print(f"✅ Audio merging successful: {output_path.name}")
-                print(f"📁 Output file size: {file_size} bytes")
-                
-                # Cleanup
-                os.unlink(test_video.name)
-                os.unlink(audio_path)
-                os.unlink(output_path.name)
-                return True
+        with contextlib.ExitStack() as stack:
+            # Create test audio
+            video_generator = get_video_generator()
+            test_text = "This is a test audio for merging."
+            audio_path = cached_tts(video_generator, test_text)
+            
+            # Test merging; the output is removed however the test exits
+            # (the audio stays in the TTS cache for the next run)
+            output_path = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
+            output_path.close()
+            stack.callback(_remove_if_exists, output_path.name)
+            
+            # The test video (1 second of black frames) is generated by ffmpeg's
+            # lavfi color source, so no intermediate video file is written
+            cmd = [
+                ffmpeg_exe(), "-y",
+                "-loglevel", "error", "-nostats",
+                "-f", "lavfi", "-i", "color=c=black:s=640x480:d=1:r=24",
+                "-i", audio_path,
+                "-c:v", "libx264",
+                "-c:a", "aac",
+                "-shortest",
+                output_path.name
+            ]
+            
+            print(f"🔄 Running FFmpeg command: {' '.join(cmd)}")
+            # Only stderr is read (and only on failure), so discard stdout
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    text=True, timeout=30)
+            
+            if result.returncode == 0:
+                if os.path.exists(output_path.name):
+                    file_size = os.path.getsize(output_path.name)
+                    print(f"✅ Audio merging successful: {output_path.name}")
+                    print(f"📁 Output file size: {file_size} bytes")
+                    return True
+                else:
+                    print("❌ Output file not created")
+                    return False
             else:
-                print("❌ Output file not created")
+                print(f"❌ FFmpeg merging failed: {result.stderr}")
                 return False
-        else:
-            print(f"❌ FFmpeg merging failed: {result.stderr}")
-            return False
             
     except Exception as e:
         print(f"❌ Audio merging test failed: {e}")
@@ -148,16 +170,20 @@ def check_environment():
     
     print("\n🔍 Checking environment...")
     
-    # Check Python packages
-    packages = [
-        "gtts", "opencv-python", "numpy", "imageio-ffmpeg", "elevenlabs"
-    ]
-    
-    for package in packages:
-        try:
-            __import__(package.replace("-", "_"))
+    # Check Python packages (distribution name -> import name). find_spec only
+    # locates each module, without running its import-time initialization.
+    packages = {
+        "gtts": "gtts",
+        "opencv-python": "cv2",
+        "numpy": "numpy",
+        "imageio-ffmpeg": "imageio_ffmpeg",
+        "elevenlabs": "elevenlabs"
+    }
+    
+    for package, module_name in packages.items():
+        if importlib.util.find_spec(module_name) is not None:
             print(f"✅ {package} is available")
-        except ImportError:
+        else:
             print(f"❌ {package} is NOT available")
     
     # Check environment variables
@@ -184,14 +210,15 @@ def main():
     # Check environment
     check_environment()
     
-    # Test TTS generation
-    tts_ok = test_tts_generation()
-    
-    # Test FFmpeg availability
-    ffmpeg_ok = test_ffmpeg_availability()
-    
-    # Test audio merging
-    merging_ok = test_audio_merging()
+    # The three tests are I/O-bound (TTS network call, ffmpeg subprocesses),
+    # so run them concurrently; their progress output may interleave.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        tts_future = executor.submit(test_tts_generation)
+        ffmpeg_future = executor.submit(test_ffmpeg_availability)
+        merging_future = executor.submit(test_audio_merging)
+        tts_ok = tts_future.result()
+        ffmpeg_ok = ffmpeg_future.result()
+        merging_ok = merging_future.result()
     
     print("\n" + "=" * 50)
     print("📊 Diagnostic Results:")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Run all command-line video demos in parallel, one process per demo
+"""
+
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from ai_cache import prefetch_explainers
+from service_registry import get_ai_service
+
+# Each demo module exposes an entry point with the same name
+DEMOS = [
+    "demo_detailed_audio",
+    "demo_sun_video",
+    "demo_notebooklm_style",
+    "demo_quick_video",
+    "demo_detailed_subtopics",
+]
+
+def run_demo(name: str) -> bool:
+    """Import a demo module in the worker process and run its entry point"""
+    module = importlib.import_module(name)
+    return getattr(module, name)() is not False
+
+def prefetch_demo_content():
+    """Generate the Gemini-backed demos' content in one batched request
+    
+    The workers then read it from the AI disk cache instead of each making
+    their own request. Demos using the free generator are not batched.
+    """
+    import demo_notebooklm_style
+    import demo_sun_video
+    
+    # One request per distinct slide count (currently both demos use the same)
+    topics_by_slides = {}
+    for demo in (demo_notebooklm_style, demo_sun_video):
+        topics_by_slides.setdefault(demo.NUM_SLIDES, []).append(demo.TOPIC)
+    
+    try:
+        ai_service = get_ai_service()
+        for num_slides, topics in topics_by_slides.items():
+            prefetch_explainers(ai_service, topics, level="beginner", num_slides=num_slides)
+    except Exception as e:
+        print(f"⚠️ Batch content generation failed, demos will generate their own: {e}")
+
+def main():
+    """Dispatch every demo to a process pool and summarize the results"""
+
+    print("🚀 Running All Demos")
+    print("=" * 45)
+
+    prefetch_demo_content()
+
+    # Each demo spawns its own ffmpeg encode, so use half the cores to leave
+    # room for those subprocesses
+    max_workers = min(len(DEMOS), max(1, (os.cpu_count() or 2) // 2))
+    # Spawn fresh workers: the parent holds a Gemini client from the prefetch,
+    # and its gRPC channel cannot be used in a forked child
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        results = list(executor.map(run_demo, DEMOS))
+
+    print("\n" + "=" * 45)
+    print("📊 Demo Results Summary:")
+    for name, ok in zip(DEMOS, results):
+        print(f"  {name}: {'✅ PASS' if ok else '❌ FAIL'}")
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,16 @@ Demo script for detailed audio format with subtopics
 """
 
 import os
-from video_generator import VideoGenerator
-from ai_service import AIService
+import traceback
+from ai_cache import cached_explainer
+from video_generator import slides_to_script
+from service_registry import get_services
+
+# Set DEMO_ENCODE=0 to print the content preview without encoding the video
+DEMO_ENCODE = os.getenv("DEMO_ENCODE", "1") == "1"
+
+# Set DEMO_DEBUG=0 to print failures without the full traceback
+DEMO_DEBUG = os.getenv("DEMO_DEBUG", "1") == "1"
 
 def demo_detailed_audio():
     """Demo the detailed audio format with subtopics"""
@@ -15,8 +23,7 @@ def demo_detailed_audio():
     
     # Initialize services
     try:
-        video_generator = VideoGenerator()
-        ai_service = AIService()
+        video_generator, ai_service = get_services()
         print("✅ Services initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize services: {e}")
@@ -28,19 +35,22 @@ def demo_detailed_audio():
     
     try:
         # Generate structured content with detailed narration
-        structured_data = ai_service.generate_explainer_structured_free(
+        structured_data = cached_explainer(
+            ai_service,
             topic=topic,
             level="beginner",
             num_slides=2,
-            max_retries=1
+            max_retries=1,
+            free=True
         )
         
         print("✅ Content generated successfully")
-        print(f"📊 Generated {len(structured_data.get('slides', []))} slides")
+        slides = structured_data.get('slides') or []
+        print(f"📊 Generated {len(slides)} slides")
         
         # Show the new format
         print("\n📋 New Format Preview:")
-        for i, slide in enumerate(structured_data.get('slides', []), 1):
+        for i, slide in enumerate(slides, 1):
             print(f"\n--- Slide {i} ---")
             print(f"Title: {slide.get('title', 'N/A')}")
             print(f"Video Shows: {slide.get('subtopics', [])}")
@@ -52,34 +62,32 @@ def demo_detailed_audio():
                 print(f"Audio Preview: {narration[:100]}...")
         
         # Convert to script format
-        script_lines = []
-        for slide in structured_data.get('slides', []):
-            script_lines.append(f"### {slide.get('title', 'Untitled')}")
-            for bullet in slide.get('bullets', []):
-                script_lines.append(f"- {bullet}")
-            script_lines.append("")
-        
-        script = "\n".join(script_lines)
-        
-        # Generate video with detailed audio format
-        print(f"\n🎥 Generating video with detailed audio...")
-        output_path = "demo_detailed_audio.mp4"
+        script = slides_to_script(slides)
         
-        video_path = video_generator.generate_slideshow_video(
-            script=script,
-            output_path=output_path,
-            seconds_per_slide=15.0,  # 15 seconds per slide for detailed explanations
-            width=1280,
-            height=720,
-            fps=30,
-            topic=topic
-        )
-        
-        print(f"✅ Video generated successfully: {video_path}")
-        print(f"📁 File size: {os.path.getsize(video_path) / (1024*1024):.1f} MB")
+        if DEMO_ENCODE:
+            # Generate video with detailed audio format
+            print(f"\n🎥 Generating video with detailed audio...")
+            output_path = "demo_detailed_audio.mp4"
+            
+            video_path = video_generator.generate_slideshow_video(
+                script=script,
+                output_path=output_path,
+                seconds_per_slide=15.0,  # 15 seconds per slide for detailed explanations
+                width=1280,
+                height=720,
+                fps=30,
+                topic=topic,
+                encoder_preset="ultrafast",  # Demo output favours speed over quality
+                crf=28
+            )
+            
+            print(f"✅ Video generated successfully: {video_path}")
+            print(f"📁 File size: {os.path.getsize(video_path) / (1 << 20):.1f} MB")
+            print("📹 Check 'demo_detailed_audio.mp4' for the new format.")
+        else:
+            print("\n⏭️ Skipping video encode (DEMO_ENCODE=0)")
         
         print("\n🎉 Demo completed successfully!")
-        print("📹 Check 'demo_detailed_audio.mp4' for the new format.")
         print("🎤 Video shows subtopics while audio explains each in detail.")
         print("⏱️ Extended duration for comprehensive coverage.")
         
@@ -87,8 +95,8 @@ def demo_detailed_audio():
         
     except Exception as e:
         print(f"❌ Error during demo: {e}")
-        import traceback
-        traceback.print_exc()
+        if DEMO_DEBUG:
+            traceback.print_exc()
         return False
 
 if __name__ == "__main__":
@@ -4,9 +4,18 @@ Demo script for detailed subtopic explanations with different gradient backgroun
 """
 
 import os
+import traceback
 import time
-from video_generator import VideoGenerator
-from ai_service import AIService
+from concurrent.futures import ThreadPoolExecutor
+from ai_cache import cached_explainer
+from video_generator import slides_to_script
+from service_registry import get_services, get_video_generator
+
+# Set DEMO_ENCODE=0 to print the content preview without encoding the video
+DEMO_ENCODE = os.getenv("DEMO_ENCODE", "1") == "1"
+
+# Set DEMO_DEBUG=0 to print failures without the full traceback
+DEMO_DEBUG = os.getenv("DEMO_DEBUG", "1") == "1"
 
 def demo_detailed_subtopics():
     """Demo the detailed subtopic explanations with different backgrounds"""
@@ -16,8 +25,7 @@ def demo_detailed_subtopics():
     
     # Initialize services
     try:
-        video_generator = VideoGenerator()
-        ai_service = AIService()
+        video_generator, ai_service = get_services()
         print("✅ Services initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize services: {e}")
@@ -29,19 +37,22 @@ def demo_detailed_subtopics():
     
     try:
         # Generate structured content with detailed narration for each subtopic
-        structured_data = ai_service.generate_explainer_structured_free(
+        structured_data = cached_explainer(
+            ai_service,
             topic=topic,
             level="beginner",
             num_slides=3,
-            max_retries=1
+            max_retries=1,
+            free=True
         )
         
         print("✅ Content generated successfully")
-        print(f"📊 Generated {len(structured_data.get('slides', []))} slides")
+        slides = structured_data.get('slides') or []
+        print(f"📊 Generated {len(slides)} slides")
         
         # Show the detailed format
         print("\n📋 Detailed Subtopic Format Preview:")
-        for i, slide in enumerate(structured_data.get('slides', []), 1):
+        for i, slide in enumerate(slides, 1):
             print(f"\n--- Slide {i} ---")
             print(f"Title: {slide.get('title', 'N/A')}")
             print(f"Subtopics: {slide.get('subtopics', [])}")
@@ -65,39 +76,40 @@ def demo_detailed_subtopics():
             print(f"Background: Different gradient for each slide")
         
         # Convert to script format
-        script_lines = []
-        for slide in structured_data.get('slides', []):
-            script_lines.append(f"### {slide.get('title', 'Untitled')}")
-            for bullet in slide.get('bullets', []):
-                script_lines.append(f"- {bullet}")
-            script_lines.append("")
-        
-        script = "\n".join(script_lines)
-        
-        # Generate video with detailed subtopic explanations
-        print(f"\n🎥 Generating video with detailed subtopic explanations...")
-        output_path = "demo_detailed_subtopics.mp4"
-        
-        start_time = time.time()
-        video_path = video_generator.generate_slideshow_video(
-            script=script,
-            output_path=output_path,
-            seconds_per_slide=25.0,  # 25 seconds per slide for detailed subtopic explanations
-            width=1280,
-            height=720,
-            fps=30,
-            topic=topic
-        )
-        end_time = time.time()
+        script = slides_to_script(slides)
         
-        print(f"✅ Video generated successfully: {video_path}")
-        print(f"📁 File size: {os.path.getsize(video_path) / (1024*1024):.1f} MB")
-        print(f"⏱️ Generation time: {end_time - start_time:.1f} seconds")
+        if DEMO_ENCODE:
+            # Generate video with detailed subtopic explanations
+            print(f"\n🎥 Generating video with detailed subtopic explanations...")
+            output_path = "demo_detailed_subtopics.mp4"
+            
+            start_time = time.time()
+            video_path = video_generator.generate_slideshow_video(
+                script=script,
+                output_path=output_path,
+                seconds_per_slide=25.0,  # 25 seconds per slide for detailed subtopic explanations
+                width=1280,
+                height=720,
+                fps=30,
+                topic=topic,
+                encoder_preset="ultrafast",  # Demo output favours speed over quality
+                crf=28
+            )
+            end_time = time.time()
+            
+            print(f"✅ Video generated successfully: {video_path}")
+            print(f"📁 File size: {os.path.getsize(video_path) / (1 << 20):.1f} MB")
+            print(f"⏱️ Generation time: {end_time - start_time:.1f} seconds")
+            print("📹 Check 'demo_detailed_subtopics.mp4' for the new format.")
+        else:
+            print("\n⏭️ Skipping video encode (DEMO_ENCODE=0)")
         
         # Test content composition
         print(f"\n🎤 Testing detailed audio content composition:")
-        for i, slide in enumerate(structured_data.get('slides', []), 1):
-            content = video_generator._create_enhanced_slide_content(slide)
+        # Compose every slide's content concurrently; map keeps slide order
+        with ThreadPoolExecutor(max_workers=min(8, len(slides) or 1)) as executor:
+            contents = list(executor.map(video_generator._create_enhanced_slide_content, slides))
+        for i, (slide, content) in enumerate(zip(slides, contents), 1):
             words = len(content.split())
             estimated_duration = words / 2.5
             
@@ -109,7 +121,6 @@ def demo_detailed_subtopics():
             print(f"Preview: {content[:200]}...")
         
         print("\n🎉 Demo completed successfully!")
-        print("📹 Check 'demo_detailed_subtopics.mp4' for the new format.")
         print("🎤 Each subtopic gets 20-25 seconds of detailed explanation.")
         print("🎨 Each slide has a different gradient background.")
         print("📋 Video shows clean subtopics while audio explains each in detail.")
@@ -118,8 +129,8 @@ def demo_detailed_subtopics():
         
     except Exception as e:
         print(f"❌ Error during demo: {e}")
-        import traceback
-        traceback.print_exc()
+        if DEMO_DEBUG:
+            traceback.print_exc()
         return False
 
 def test_gradient_backgrounds():
@@ -129,17 +140,26 @@ def test_gradient_backgrounds():
     print("=" * 35)
     
     try:
-        video_generator = VideoGenerator()
+        video_generator = get_video_generator()
         
         # Test different topic categories
         categories = ['technology', 'science', 'business', 'education']
         
+        # Test different slide indices, fetching all 12 backgrounds concurrently
+        slide_indices = range(3)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            backgrounds = {
+                (category, slide_index): executor.submit(
+                    video_generator._get_notebooklm_background, category, slide_index
+                )
+                for category in categories
+                for slide_index in slide_indices
+            }
+        
         for category in categories:
             print(f"\n--- {category.upper()} Category ---")
-            
-            # Test different slide indices
-            for slide_index in range(3):
-                background = video_generator._get_notebooklm_background(category, slide_index)
+            for slide_index in slide_indices:
+                background = backgrounds[(category, slide_index)].result()
                 print(f"Slide {slide_index + 1}: {background.shape} - Different gradient")
         
         print("\n✅ All gradient backgrounds generated successfully")
@@ -155,11 +175,15 @@ if __name__ == "__main__":
     print("🚀 Detailed Subtopics Demo Suite")
     print("=" * 45)
     
-    # Test 1: Detailed subtopic format
-    success1 = demo_detailed_subtopics()
-    
-    # Test 2: Gradient backgrounds
-    success2 = test_gradient_backgrounds()
+    # The two tests share no state, so the gradient test runs while the
+    # video encodes; their progress output may interleave.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Test 1: Detailed subtopic format
+        subtopics_future = executor.submit(demo_detailed_subtopics)
+        # Test 2: Gradient backgrounds
+        gradients_future = executor.submit(test_gradient_backgrounds)
+        success1 = subtopics_future.result()
+        success2 = gradients_future.result()
     
     print("\n" + "=" * 45)
     print("📊 Test Results Summary:")
@@ -4,10 +4,10 @@ Demonstration of Enhanced Video Generation Features
 """
 
 import streamlit as st
-from video_generator import VideoGenerator
-from ai_service import AIService
+from service_registry import get_services
 import tempfile
 import os
+import contextlib
 
 def main():
     st.title("🎬 Enhanced Video Generator Demo")
@@ -21,8 +21,7 @@ def main():
     
     # Initialize services
     try:
-        video_generator = VideoGenerator()
-        ai_service = AIService()
+        video_generator, ai_service = get_services()
         st.success("✅ Services initialized successfully!")
     except Exception as e:
         st.error(f"❌ Failed to initialize services: {e}")
@@ -99,24 +98,26 @@ def main():
                     
                     st.success("✅ Enhanced video generated successfully!")
                     
+                    # Read the video once; the player and the download button
+                    # share the same bytes instead of each reading the file
+                    with open(video_path, "rb") as file:
+                        video_bytes = file.read()
+                    
                     # Display video
-                    st.video(video_path)
+                    st.video(video_bytes)
                     
                     # Download button
-                    with open(video_path, "rb") as file:
-                        st.download_button(
-                            label="⬇️ Download Enhanced Video",
-                            data=file.read(),
-                            file_name=f"enhanced_{topic.replace(' ', '_')}_{width}x{height}.mp4",
-                            mime="video/mp4",
-                            use_container_width=True
-                        )
+                    st.download_button(
+                        label="⬇️ Download Enhanced Video",
+                        data=video_bytes,
+                        file_name=f"enhanced_{topic.replace(' ', '_')}_{width}x{height}.mp4",
+                        mime="video/mp4",
+                        use_container_width=True
+                    )
                     
                     # Clean up
-                    try:
+                    with contextlib.suppress(OSError):
                         os.unlink(video_path)
-                    except:
-                        pass
                         
                 except Exception as e:
                     st.error(f"❌ Failed to generate video: {e}")
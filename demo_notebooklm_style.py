@@ -4,8 +4,17 @@ Demo script for NotebookLM-style video generation
 """
 
 import os
-from ai_service import AIService
-from video_generator import VideoGenerator
+import traceback
+from ai_cache import cached_explainer
+from video_generator import slides_to_script
+from service_registry import get_services
+
+# Demo content request (also prefetched in one batch by demo_all.py)
+TOPIC = "Artificial Intelligence Basics"
+NUM_SLIDES = 6
+
+# Set DEMO_DEBUG=0 to print failures without the full traceback
+DEMO_DEBUG = os.getenv("DEMO_DEBUG", "1") == "1"
 
 def demo_notebooklm_style():
     """Demo the NotebookLM-style video generation"""
@@ -15,28 +24,29 @@ def demo_notebooklm_style():
     
     # Initialize services
     try:
-        ai_service = AIService()
-        video_generator = VideoGenerator()
+        video_generator, ai_service = get_services()
         print("✅ Services initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize services: {e}")
         return False
     
     # Demo topic
-    topic = "Artificial Intelligence Basics"
+    topic = TOPIC
     print(f"\n📚 Generating NotebookLM-style presentation for: {topic}")
     
     try:
         # Generate structured content
-        structured_data = ai_service.generate_explainer_structured(
+        structured_data = cached_explainer(
+            ai_service,
             topic=topic,
             level="beginner",
-            num_slides=6,
+            num_slides=NUM_SLIDES,
             max_retries=2
         )
         
         print("✅ Content generated successfully")
-        print(f"📊 Generated {len(structured_data.get('slides', []))} slides")
+        slides = structured_data.get('slides') or []
+        print(f"📊 Generated {len(slides)} slides")
         
         # Show topic categorization
         topic_category = ai_service._categorize_topic(topic)
@@ -44,7 +54,7 @@ def demo_notebooklm_style():
         
         # Display the structure
         print("\n📋 Presentation Structure:")
-        for i, slide in enumerate(structured_data.get('slides', []), 1):
+        for i, slide in enumerate(slides, 1):
             print(f"\n--- Slide {i} ---")
             print(f"Title: {slide.get('title', 'N/A')}")
             print(f"Subtopics: {slide.get('subtopics', [])}")
@@ -52,14 +62,7 @@ def demo_notebooklm_style():
             print(f"Narration: {len(slide.get('narration', ''))} characters")
         
         # Convert to script format
-        script_lines = []
-        for slide in structured_data.get('slides', []):
-            script_lines.append(f"### {slide.get('title', 'Untitled')}")
-            for bullet in slide.get('bullets', []):
-                script_lines.append(f"- {bullet}")
-            script_lines.append("")
-        
-        script = "\n".join(script_lines)
+        script = slides_to_script(slides)
         
         # Generate video
         print(f"\n🎥 Generating NotebookLM-style video...")
@@ -72,11 +75,13 @@ def demo_notebooklm_style():
             width=1280,
             height=720,
             fps=30,
-            topic=topic
+            topic=topic,
+            encoder_preset="ultrafast",  # Demo output favours speed over quality
+            crf=28
         )
         
         print(f"✅ Video generated successfully: {video_path}")
-        print(f"📁 File size: {os.path.getsize(video_path) / (1024*1024):.1f} MB")
+        print(f"📁 File size: {os.path.getsize(video_path) / (1 << 20):.1f} MB")
         
         print("\n🎉 Demo completed successfully!")
         print("📹 Check 'notebooklm_style_demo.mp4' for the new NotebookLM-style video.")
@@ -85,8 +90,8 @@ def demo_notebooklm_style():
         
     except Exception as e:
         print(f"❌ Error during demo: {e}")
-        import traceback
-        traceback.print_exc()
+        if DEMO_DEBUG:
+            traceback.print_exc()
         return False
 
 if __name__ == "__main__":
@@ -4,9 +4,13 @@ Demo script for quick 10-second video generation
 """
 
 import os
+import traceback
 import time
-from video_generator import VideoGenerator
-from ai_service import AIService
+from ai_cache import cached_explainer
+from service_registry import get_services
+
+# Set DEMO_DEBUG=0 to print failures without the full traceback
+DEMO_DEBUG = os.getenv("DEMO_DEBUG", "1") == "1"
 
 def demo_quick_video():
     """Demo the quick 10-second video generation"""
@@ -16,8 +20,7 @@ def demo_quick_video():
     
     # Initialize services
     try:
-        video_generator = VideoGenerator()
-        ai_service = AIService()
+        video_generator, ai_service = get_services()
         print("✅ Services initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize services: {e}")
@@ -45,7 +48,7 @@ def demo_quick_video():
         generation_time = end_time - start_time
         
         print(f"✅ Video generated successfully: {video_path}")
-        print(f"📁 File size: {os.path.getsize(video_path) / (1024*1024):.1f} MB")
+        print(f"📁 File size: {os.path.getsize(video_path) / (1 << 20):.1f} MB")
         print(f"⏱️ Generation time: {generation_time:.1f} seconds")
         
         # Test content cleaning
@@ -57,22 +60,25 @@ def demo_quick_video():
         
         # Test free content generation
         print(f"\n🆓 Testing free content generation:")
-        structured_data = ai_service.generate_explainer_structured_free(
+        structured_data = cached_explainer(
+            ai_service,
             topic=topic,
             level="beginner",
             num_slides=3,
-            max_retries=1
+            max_retries=1,
+            free=True
         )
         
         print("✅ Free content generated successfully")
-        print(f"📊 Generated {len(structured_data.get('slides', []))} slides")
+        slides = structured_data.get('slides') or []
+        print(f"📊 Generated {len(slides)} slides")
         
         # Check for question marks in generated content
-        has_questions = False
-        for slide in structured_data.get('slides', []):
-            if '?' in slide.get('title', '') or any('?' in bullet for bullet in slide.get('bullets', [])) or '?' in slide.get('narration', ''):
-                has_questions = True
-                break
+        # (one scan per slide over its title, narration and bullets together)
+        has_questions = any(
+            '?' in "".join((slide.get('title', ''), slide.get('narration', ''), *slide.get('bullets', ())))
+            for slide in slides
+        )
         
         print(f"❓ Content has question marks: {has_questions}")
         
@@ -85,8 +91,8 @@ def demo_quick_video():
         
     except Exception as e:
         print(f"❌ Error during demo: {e}")
-        import traceback
-        traceback.print_exc()
+        if DEMO_DEBUG:
+            traceback.print_exc()
         return False
 
 if __name__ == "__main__":
@@ -4,9 +4,20 @@ Demo script for Sun video generation using the enhanced universal AI prompt
 """
 
 import os
-import json
-from ai_service import AIService
-from video_generator import VideoGenerator
+import traceback
+from ai_cache import cached_explainer, load_content_json, save_content_json
+from video_generator import slides_to_script
+from service_registry import get_services
+
+# Demo content request (also prefetched in one batch by demo_all.py)
+TOPIC = "The Sun: Our Star"
+NUM_SLIDES = 6
+
+# Set DEMO_ENCODE=0 to print the content preview without encoding the video
+DEMO_ENCODE = os.getenv("DEMO_ENCODE", "1") == "1"
+
+# Set DEMO_DEBUG=0 to print failures without the full traceback
+DEMO_DEBUG = os.getenv("DEMO_DEBUG", "1") == "1"
 
 def demo_sun_video():
     """Demo the enhanced video generation system with Sun topic"""
@@ -16,29 +27,30 @@ def demo_sun_video():
     
     # Initialize services
     try:
-        ai_service = AIService()
-        video_generator = VideoGenerator()
+        video_generator, ai_service = get_services()
         print("✅ Services initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize services: {e}")
         return False
     
     # Demo topic: The Sun
-    topic = "The Sun: Our Star"
+    topic = TOPIC
     print(f"\n🌞 Generating enhanced video presentation for: {topic}")
     
     try:
         # Generate structured content using the enhanced universal prompt
         print("🔄 Generating content with universal AI prompt...")
-        structured_data = ai_service.generate_explainer_structured(
+        structured_data = cached_explainer(
+            ai_service,
             topic=topic,
             level="beginner",
-            num_slides=6,
+            num_slides=NUM_SLIDES,
             max_retries=2
         )
         
         print("✅ Content generated successfully")
-        print(f"📊 Generated {len(structured_data.get('slides', []))} slides")
+        slides = structured_data.get('slides') or []
+        print(f"📊 Generated {len(slides)} slides")
         
         # Show topic categorization
         topic_category = ai_service._categorize_topic(topic)
@@ -46,7 +58,7 @@ def demo_sun_video():
         
         # Display the enhanced structure
         print("\n📋 Enhanced Presentation Structure:")
-        for i, slide in enumerate(structured_data.get('slides', []), 1):
+        for i, slide in enumerate(slides, 1):
             print(f"\n--- Slide {i} ---")
             print(f"Title: {slide.get('title', 'N/A')}")
             print(f"Subtopics: {slide.get('subtopics', [])}")
@@ -56,61 +68,58 @@ def demo_sun_video():
             print(f"Layout: {slide.get('layout', 'N/A')}")
         
         # Show slide types used
-        slide_types = [slide.get('subtopic_type', 'unknown') for slide in structured_data.get('slides', [])]
+        slide_types = [slide.get('subtopic_type', 'unknown') for slide in slides]
         unique_types = list(set(slide_types))
         print(f"\n🎭 Subtopic types used: {', '.join(unique_types)}")
         
         # Save structured data to file
         output_file = "sun_video_content.json"
-        with open(output_file, 'w') as f:
-            json.dump(structured_data, f, indent=2)
+        save_content_json(structured_data, output_file)
         print(f"💾 Structured data saved to: {output_file}")
         
         # Convert to script format for video generation
-        script_lines = []
-        for slide in structured_data.get('slides', []):
-            script_lines.append(f"### {slide.get('title', 'Untitled')}")
-            for bullet in slide.get('bullets', []):
-                script_lines.append(f"- {bullet}")
-            script_lines.append("")
-        
-        script = "\n".join(script_lines)
-        
-        # Generate video
-        print(f"\n🎥 Generating enhanced Sun video...")
-        output_path = "sun_demo_video.mp4"
-        
-        video_path = video_generator.generate_slideshow_video(
-            script=script,
-            output_path=output_path,
-            seconds_per_slide=8.0,  # 8 seconds per slide as per universal prompt
-            width=1280,
-            height=720,
-            fps=30,
-            topic=topic
-        )
-        
-        print(f"✅ Video generated successfully: {video_path}")
-        print(f"📁 File size: {os.path.getsize(video_path) / (1024*1024):.1f} MB")
-        
-        # Show video details
-        print(f"\n🎬 Video Details:")
-        print(f"  - Duration: {len(structured_data.get('slides', [])) * 8} seconds")
-        print(f"  - Resolution: 1280x720")
-        print(f"  - FPS: 30")
-        print(f"  - Topic: {topic}")
-        print(f"  - Category: {topic_category}")
+        script = slides_to_script(slides)
+        
+        if DEMO_ENCODE:
+            # Generate video
+            print(f"\n🎥 Generating enhanced Sun video...")
+            output_path = "sun_demo_video.mp4"
+            
+            video_path = video_generator.generate_slideshow_video(
+                script=script,
+                output_path=output_path,
+                seconds_per_slide=8.0,  # 8 seconds per slide as per universal prompt
+                width=1280,
+                height=720,
+                fps=30,
+                topic=topic,
+                encoder_preset="ultrafast",  # Demo output favours speed over quality
+                crf=28
+            )
+            
+            print(f"✅ Video generated successfully: {video_path}")
+            print(f"📁 File size: {os.path.getsize(video_path) / (1 << 20):.1f} MB")
+            
+            # Show video details
+            print(f"\n🎬 Video Details:")
+            print(f"  - Duration: {len(slides) * 8} seconds")
+            print(f"  - Resolution: 1280x720")
+            print(f"  - FPS: 30")
+            print(f"  - Topic: {topic}")
+            print(f"  - Category: {topic_category}")
+            print("📹 Check 'sun_demo_video.mp4' for the enhanced video presentation.")
+        else:
+            print("\n⏭️ Skipping video encode (DEMO_ENCODE=0)")
         
         print("\n🎉 Sun video demo completed successfully!")
-        print("📹 Check 'sun_demo_video.mp4' for the enhanced video presentation.")
         print("📄 Check 'sun_video_content.json' for the detailed content structure.")
         
         return True
         
     except Exception as e:
         print(f"❌ Error during demo: {e}")
-        import traceback
-        traceback.print_exc()
+        if DEMO_DEBUG:
+            traceback.print_exc()
         return False
 
 def show_content_preview():
@@ -120,8 +129,7 @@ def show_content_preview():
     print("=" * 30)
     
     try:
-        with open("sun_video_content.json", 'r') as f:
-            data = json.load(f)
+        data = load_content_json("sun_video_content.json")
         
         print(f"Topic: {data.get('topic', 'N/A')}")
         print(f"Level: {data.get('level', 'N/A')}")
@@ -5,147 +5,225 @@ Tests the system with different topics and shows its capabilities
 """
 
 import os
-import json
-from universal_ai_prompt import UniversalAIPrompt
+import sys
+import traceback
+import functools
+import argparse
+import threading
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from ai_cache import cached_structured_content, save_content_json
 
-def demo_universal_prompt():
-    """Demo the Universal AI Prompt system with multiple topics"""
+# Set DEMO_DEBUG=0 to print failures without the full traceback
+DEMO_DEBUG = os.getenv("DEMO_DEBUG", "1") == "1"
+
+# Demo topics with different categories
+DEMO_TOPICS = [
+    {
+        "topic": "Machine Learning Fundamentals",
+        "level": "beginner",
+        "slides": 6,
+        "description": "Technology topic with definition, process, and case study types"
+    },
+    {
+        "topic": "Climate Change Science",
+        "level": "intermediate", 
+        "slides": 7,
+        "description": "Science topic with timeline, classification, and advantages/disadvantages"
+    },
+    {
+        "topic": "Digital Marketing Strategies",
+        "level": "intermediate",
+        "slides": 6,
+        "description": "Business topic with process, advantages/disadvantages, and case study"
+    }
+]
+
+# Settings for topics given with --topics
+CUSTOM_TOPIC_LEVEL = "beginner"
+CUSTOM_TOPIC_SLIDES = 6
+
+# Maps topic characters that are awkward in file names to underscores
+_SLUG_TABLE = str.maketrans({' ': '_', '/': '_', ':': '_'})
+
+# Serializes progress output from the concurrent demo topics
+_print_lock = threading.Lock()
+
+def _process_demo(universal_prompt, demo, i, max_retries=2):
+    """Generate, summarize and save the content for one demo topic
+    
+    Progress lines are buffered and printed as one block under _print_lock,
+    so topics processed on different threads do not interleave.
+    """
+    lines = [
+        f"\n{'='*20} Demo {i}: {demo['topic']} {'='*20}",
+        f"📚 Topic: {demo['topic']}",
+        f"📊 Level: {demo['level']}",
+        f"📋 Slides: {demo['slides']}",
+        f"📝 Description: {demo['description']}",
+    ]
+    
+    def show_streamed_slide(index, slide):
+        # Live progress while the response streams; the full summary follows
+        with _print_lock:
+            print(f"  ⏳ {demo['topic']} - slide {index + 1}: {slide.get('title', 'Untitled')}")
+    
+    try:
+        # Generate structured content (served from the disk cache on reruns)
+        structured_data = cached_structured_content(
+            universal_prompt,
+            topic=demo['topic'],
+            level=demo['level'],
+            num_slides=demo['slides'],
+            max_retries=max_retries,
+            on_slide=show_streamed_slide
+        )
+        
+        lines.append(f"✅ Content generated successfully")
+        lines.append(f"📊 Generated {len(structured_data.get('slides', []))} slides")
+        lines.append(f"🏷️ Topic category: {structured_data.get('category', 'N/A')}")
+        lines.append(f"📈 Complexity: {structured_data.get('complexity', 'N/A')}")
+        
+        # Show slide types used, in first-seen order so reruns print the same
+        unique_types = list(dict.fromkeys(
+            slide.get('subtopic_type', 'unknown') for slide in structured_data.get('slides', ())
+        ))
+        lines.append(f"🎭 Slide types used: {', '.join(unique_types)}")
+        
+        # Show slide titles
+        lines.append(f"\n📋 Slide Titles:")
+        for j, slide in enumerate(structured_data.get('slides', []), 1):
+            title = slide.get('title', 'Untitled')
+            subtopic_type = slide.get('subtopic_type', 'unknown')
+            lines.append(f"  {j}. {title} ({subtopic_type})")
+        
+        # Save structured data to file
+        slug = demo['topic'].lower().translate(_SLUG_TABLE)
+        output_file = f"universal_demo_{i}_{slug}.json"
+        save_content_json(structured_data, output_file)
+        lines.append(f"💾 Structured data saved to: {output_file}")
+        
+        result = {
+            "topic": demo['topic'],
+            "success": True,
+            "slides": len(structured_data.get('slides', [])),
+            "category": structured_data.get('category', 'N/A'),
+            "complexity": structured_data.get('complexity', 'N/A'),
+            "slide_types": unique_types,
+            "output_file": output_file,
+            "structured_data": structured_data
+        }
+        
+    except Exception as e:
+        lines.append(f"❌ Error processing {demo['topic']}: {e}")
+        if DEMO_DEBUG:
+            lines.append(traceback.format_exc())
+        
+        result = {
+            "topic": demo['topic'],
+            "success": False,
+            "error": str(e)
+        }
+    
+    # One write per topic: a single syscall, and one contiguous block even
+    # when several topics finish at once
+    with _print_lock:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
+    return result
+
+def demo_universal_prompt(topics: Optional[List[str]] = None, generate_video: bool = False,
+                          max_retries: int = 2, workers: Optional[int] = None):
+    """Demo the Universal AI Prompt system with multiple topics
+    
+    topics replaces DEMO_TOPICS with custom topics. Content for all topics is
+    generated concurrently on up to workers threads (default: one per topic);
+    videos are generated afterwards only when generate_video is set.
+    """
     
     print("🎬 Universal AI Prompt System Demo")
     print("=" * 60)
     
-    # Initialize the system
+    # Initialize the system (imported here so loading this module, e.g. for
+    # --help, does not pull in the AI and video stack)
     try:
+        from universal_ai_prompt import UniversalAIPrompt
         universal_prompt = UniversalAIPrompt()
         print("✅ Universal AI Prompt system initialized successfully")
     except Exception as e:
         print(f"❌ Failed to initialize system: {e}")
         return False
     
-    # Demo topics with different categories
-    demo_topics = [
-        {
-            "topic": "Machine Learning Fundamentals",
-            "level": "beginner",
-            "slides": 6,
-            "description": "Technology topic with definition, process, and case study types"
-        },
-        {
-            "topic": "Climate Change Science",
-            "level": "intermediate", 
-            "slides": 7,
-            "description": "Science topic with timeline, classification, and advantages/disadvantages"
-        },
-        {
-            "topic": "Digital Marketing Strategies",
-            "level": "intermediate",
-            "slides": 6,
-            "description": "Business topic with process, advantages/disadvantages, and case study"
-        }
-    ]
+    if topics:
+        demo_topics = [
+            {
+                "topic": topic,
+                "level": CUSTOM_TOPIC_LEVEL,
+                "slides": CUSTOM_TOPIC_SLIDES,
+                "description": "Custom topic"
+            }
+            for topic in topics
+        ]
+    else:
+        demo_topics = DEMO_TOPICS
     
-    results = []
+    # The generations are independent and network-bound, so run them
+    # concurrently; results keep the demo_topics order
+    print(f"\n🔄 Generating content for {len(demo_topics)} topics...")
+    with ThreadPoolExecutor(max_workers=workers or len(demo_topics)) as executor:
+        futures = [
+            executor.submit(_process_demo, universal_prompt, demo, i, max_retries)
+            for i, demo in enumerate(demo_topics, 1)
+        ]
+        results = [future.result() for future in futures]
     
-    for i, demo in enumerate(demo_topics, 1):
-        print(f"\n{'='*20} Demo {i}: {demo['topic']} {'='*20}")
-        print(f"📚 Topic: {demo['topic']}")
-        print(f"📊 Level: {demo['level']}")
-        print(f"📋 Slides: {demo['slides']}")
-        print(f"📝 Description: {demo['description']}")
-        
+    # Generate videos (optional - can be slow)
+    for result in results:
+        if not result['success']:
+            continue
+        if not generate_video:
+            print(f"⏭️ Skipping video generation for '{result['topic']}' (use --generate-video)")
+            continue
         try:
-            # Generate structured content
-            print(f"\n🔄 Generating content...")
-            structured_data = universal_prompt.generate_structured_content(
-                topic=demo['topic'],
-                level=demo['level'],
-                num_slides=demo['slides'],
-                max_retries=2
-            )
-            
-            print(f"✅ Content generated successfully")
-            print(f"📊 Generated {len(structured_data.get('slides', []))} slides")
-            print(f"🏷️ Topic category: {structured_data.get('category', 'N/A')}")
-            print(f"📈 Complexity: {structured_data.get('complexity', 'N/A')}")
-            
-            # Show slide types used
-            slide_types = [slide.get('subtopic_type', 'unknown') for slide in structured_data.get('slides', [])]
-            unique_types = list(set(slide_types))
-            print(f"🎭 Slide types used: {', '.join(unique_types)}")
-            
-            # Show slide titles
-            print(f"\n📋 Slide Titles:")
-            for j, slide in enumerate(structured_data.get('slides', []), 1):
-                title = slide.get('title', 'Untitled')
-                subtopic_type = slide.get('subtopic_type', 'unknown')
-                print(f"  {j}. {title} ({subtopic_type})")
-            
-            # Save structured data to file
-            output_file = f"universal_demo_{i}_{demo['topic'].lower().replace(' ', '_')}.json"
-            with open(output_file, 'w') as f:
-                json.dump(structured_data, f, indent=2)
-            print(f"💾 Structured data saved to: {output_file}")
-            
-            # Generate video (optional - can be slow)
-            generate_video = input(f"\n🎥 Generate video for '{demo['topic']}'? (y/n): ").lower().strip()
-            if generate_video == 'y':
-                print(f"🎬 Generating video...")
-                video_path = universal_prompt.generate_video_from_content(structured_data)
-                print(f"✅ Video generated: {video_path}")
-                print(f"📁 File size: {os.path.getsize(video_path) / (1024*1024):.1f} MB")
-            else:
-                print("⏭️ Skipping video generation")
-            
-            # Store results
-            results.append({
-                "topic": demo['topic'],
-                "success": True,
-                "slides": len(structured_data.get('slides', [])),
-                "category": structured_data.get('category', 'N/A'),
-                "complexity": structured_data.get('complexity', 'N/A'),
-                "slide_types": unique_types,
-                "output_file": output_file
-            })
-            
+            print(f"🎬 Generating video for '{result['topic']}'...")
+            video_path = universal_prompt.generate_video_from_content(result['structured_data'])
+            print(f"✅ Video generated: {video_path}")
+            print(f"📁 File size: {os.path.getsize(video_path) / (1 << 20):.1f} MB")
         except Exception as e:
-            print(f"❌ Error processing {demo['topic']}: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            results.append({
-                "topic": demo['topic'],
-                "success": False,
-                "error": str(e)
-            })
-            continue
-    
-    # Summary
-    print(f"\n{'='*60}")
-    print("📊 DEMO SUMMARY")
-    print("="*60)
+            print(f"❌ Error generating video for {result['topic']}: {e}")
+            if DEMO_DEBUG:
+                traceback.print_exc()
     
+    # Summary (written in one go, like the per-topic blocks)
     successful = [r for r in results if r['success']]
     failed = [r for r in results if not r['success']]
     
-    print(f"✅ Successful: {len(successful)}/{len(results)}")
-    print(f"❌ Failed: {len(failed)}/{len(results)}")
+    lines = [
+        f"\n{'='*60}",
+        "📊 DEMO SUMMARY",
+        "="*60,
+        f"✅ Successful: {len(successful)}/{len(results)}",
+        f"❌ Failed: {len(failed)}/{len(results)}",
+    ]
     
     if successful:
-        print(f"\n📋 Successful Topics:")
+        lines.append(f"\n📋 Successful Topics:")
         for result in successful:
-            print(f"  • {result['topic']}")
-            print(f"    - Slides: {result['slides']}")
-            print(f"    - Category: {result['category']}")
-            print(f"    - Types: {', '.join(result['slide_types'])}")
-            print(f"    - Output: {result['output_file']}")
+            lines.append(f"  • {result['topic']}")
+            lines.append(f"    - Slides: {result['slides']}")
+            lines.append(f"    - Category: {result['category']}")
+            lines.append(f"    - Types: {', '.join(result['slide_types'])}")
+            lines.append(f"    - Output: {result['output_file']}")
     
     if failed:
-        print(f"\n❌ Failed Topics:")
+        lines.append(f"\n❌ Failed Topics:")
         for result in failed:
-            print(f"  • {result['topic']}: {result['error']}")
+            lines.append(f"  • {result['topic']}: {result['error']}")
     
-    print(f"\n🎉 Universal AI Prompt demo completed!")
-    print(f"📁 Check the generated JSON files for detailed content structure")
+    lines.append(f"\n🎉 Universal AI Prompt demo completed!")
+    lines.append(f"📁 Check the generated JSON files for detailed content structure")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return len(successful) > 0
 
@@ -156,7 +234,10 @@ def test_prompt_generation():
     print("=" * 40)
     
     try:
+        from universal_ai_prompt import UniversalAIPrompt
         universal_prompt = UniversalAIPrompt()
+        # Prompts depend only on (topic, level, num_slides), so build each once
+        generate_prompt = functools.lru_cache(maxsize=256)(universal_prompt.generate_universal_prompt)
         
         # Test different topics
         test_topics = [
@@ -168,7 +249,7 @@ def test_prompt_generation():
         for topic in test_topics:
             print(f"\n📝 Testing prompt for: {topic}")
             
-            prompt = universal_prompt.generate_universal_prompt(
+            prompt = generate_prompt(
                 topic=topic,
                 level="beginner",
                 num_slides=5
@@ -186,6 +267,17 @@ def test_prompt_generation():
     return True
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Universal AI Prompt System demo")
+    parser.add_argument("--topics", nargs="+", metavar="TOPIC",
+                        help="topics to generate instead of the built-in demo topics")
+    parser.add_argument("--generate-video", action=argparse.BooleanOptionalAction, default=False,
+                        help="generate a video for every topic (default: content only)")
+    parser.add_argument("--max-retries", type=int, default=2,
+                        help="generation attempts per topic (default: 2)")
+    parser.add_argument("--workers", type=int,
+                        help="topics generated concurrently (default: one per topic)")
+    args = parser.parse_args()
+    
     print("🚀 Starting Universal AI Prompt System Demo")
     
     # Test prompt generation first
@@ -193,7 +285,12 @@ if __name__ == "__main__":
     
     if prompt_test_success:
         # Run main demo
-        demo_success = demo_universal_prompt()
+        demo_success = demo_universal_prompt(
+            topics=args.topics,
+            generate_video=args.generate_video,
+            max_retries=args.max_retries,
+            workers=args.workers
+        )
         
         if demo_success:
             print("\n🎉 All tests completed successfully!")
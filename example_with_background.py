@@ -3,10 +3,11 @@
 Example script demonstrating the new background image functionality
 """
 
-from video_generator import VideoGenerator
-
 def main():
     """Demonstrate background image usage"""
+    # Imported here so loading this module does not pull in the video stack
+    from video_generator import VideoGenerator
+    
     print("Background Image Video Generation Example")
     print("=" * 50)
     
@@ -3,9 +3,8 @@
 Generate Sun video using the enhanced universal AI prompt system
 """
 
-import json
 import os
-from video_generator import VideoGenerator
+from ai_cache import load_content_json
 
 def generate_sun_video():
     """Generate the Sun video using the enhanced system"""
@@ -14,26 +13,24 @@ def generate_sun_video():
     print("=" * 40)
     
     try:
+        # Imported here so loading this module does not pull in the video stack
+        from video_generator import VideoGenerator, slides_to_script
+        
         # Initialize video generator
         video_generator = VideoGenerator()
         print("✅ Video generator initialized")
         
+        # Pay the first-frame setup costs before the real render
+        video_generator.warmup(width=1280, height=720, fps=30, parallel_segments=True)
+        
         # Load the generated content
-        with open("sun_video_content.json", 'r') as f:
-            structured_data = json.load(f)
+        structured_data = load_content_json("sun_video_content.json")
         
         print(f"📄 Loaded content for: {structured_data.get('topic', 'Unknown')}")
         print(f"📊 Found {len(structured_data.get('slides', []))} slides")
         
         # Convert to script format
-        script_lines = []
-        for slide in structured_data.get('slides', []):
-            script_lines.append(f"### {slide.get('title', 'Untitled')}")
-            for bullet in slide.get('bullets', []):
-                script_lines.append(f"- {bullet}")
-            script_lines.append("")
-        
-        script = "\n".join(script_lines)
+        script = slides_to_script(structured_data.get('slides', ()))
         
         # Generate video
         print("🎥 Generating video...")
@@ -46,7 +43,8 @@ def generate_sun_video():
             width=1280,
             height=720,
             fps=30,
-            topic="The Sun: Our Star"
+            topic="The Sun: Our Star",
+            parallel_segments=True  # Encode the slides concurrently
         )
         
         print(f"✅ Video generated successfully!")
@@ -1,18 +1,260 @@
 import json
 import tempfile
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 from config import Config
+from ai_cache import load_cached, store_cached
 import requests
 from PIL import Image, ImageDraw, ImageFont
 import io
+import functools
 import math
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# jiter (a Rust JSON parser) parses AI responses
+# faster than json; its key cache suits the repeated mind map keys
+try:
+    import jiter
+    JITER_AVAILABLE = True
+except Exception:
+    JITER_AVAILABLE = False
+
+# Shape required of an AI mind map; fastjsonschema compiles it to a plain
+# Python function, replacing the hand-written walk when it is installed
+MIND_MAP_SCHEMA = {
+    "type": "object",
+    "required": ["topic", "main_branches"],
+    "properties": {
+        "main_branches": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["title", "sub_branches"],
+                "properties": {
+                    "sub_branches": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "required": ["title", "key_points"],
+                            "properties": {
+                                "key_points": {"type": "array"}
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+# numba compiles the layout geometry to native code when installed; without
+# it the same loops run as plain Python, which is fine for a dozen nodes
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as it is"""
+        return lambda func: func
+
+try:
+    import fastjsonschema
+    _validate_mind_map_schema = fastjsonschema.compile(MIND_MAP_SCHEMA)
+    FASTJSONSCHEMA_AVAILABLE = True
+except Exception:
+    FASTJSONSCHEMA_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default images are read back once and deleted by every caller, so keep
+# them in memory-backed tmpfs where the system has it
+SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Mind map JSON shape shown to the AI
+MIND_MAP_JSON_EXAMPLE = """{
+  "topic": "Main Topic Name",
+  "description": "Brief description of the topic",
+  "main_branches": [
+    {
+      "title": "Primary Branch Title",
+      "color": "blue",
+      "description": "Brief description of this branch",
+      "sub_branches": [
+        {
+          "title": "Sub-branch Title",
+          "description": "Brief description",
+          "key_points": ["Point 1", "Point 2", "Point 3", "Point 4"]
+        }
+      ]
+    }
+  ]
+}"""
+
+# The mind map prompts are fixed text around the topic, assembled once at
+# import; a prompt is just _PROMPT_PREFIX + topic + one of the suffixes
+_PROMPT_PREFIX = '\nYou are an expert educator creating a comprehensive mind map for the topic: "'
+
+_PROMPT_INSTRUCTIONS = """"
+
+Create a detailed, educational mind map structure that covers:
+1. Main topic (central concept)
+2. 4-6 primary branches (major themes/concepts)
+3. 2-4 sub-branches for each primary branch
+4. Key points/details for each sub-branch
+
+Requirements:
+- Use clear, educational language
+- Focus on learning and understanding
+- Include practical applications where relevant
+- Ensure logical flow and connections
+- Make it comprehensive but not overwhelming
+"""
+
+_PROMPT_FOOTER = """
+
+Color options: blue, green, purple, orange, red, yellow, teal, gray
+Ensure the JSON is properly formatted and valid.
+"""
+
+_PROMPT_SUFFIX = _PROMPT_INSTRUCTIONS + """
+Return ONLY valid JSON with this exact structure:
+""" + MIND_MAP_JSON_EXAMPLE + _PROMPT_FOOTER
+
+_NARRATION_PROMPT_SUFFIX = _PROMPT_INSTRUCTIONS + """
+Also write a clear, engaging 30-45 second narration for a video of this mind map
+that introduces the topic, explains the main branches and their importance,
+highlights key insights and concludes with a summary.
+
+Return ONLY valid JSON with this exact structure:
+{
+  "structure": <the mind map object described below>,
+  "narration": "Narration text"
+}
+
+The mind map object has this exact structure:
+""" + MIND_MAP_JSON_EXAMPLE + _PROMPT_FOOTER
+
+# Mind map canvas color
+BACKGROUND_COLOR = (248, 249, 250)
+
+# Branch colors by the names offered in the mind map prompt
+_COLOR_MAP = {
+    "blue": (52, 152, 219),
+    "green": (46, 204, 113),
+    "purple": (155, 89, 182),
+    "orange": (230, 126, 34),
+    "red": (231, 76, 60),
+    "yellow": (241, 196, 15),
+    "teal": (26, 188, 156),
+    "gray": (52, 73, 94)
+}
+_DEFAULT_COLOR = _COLOR_MAP["blue"]
+
+@functools.lru_cache(maxsize=None)
+def _default_font() -> ImageFont.ImageFont:
+    """Pillow's built-in font (loaded once per process)"""
+    return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=None)
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Arial at size, or the default font if it is unavailable (loaded once per size)"""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except Exception:
+        return _default_font()
+
+@functools.lru_cache(maxsize=128)
+def _render_center(topic: str, description: str, center_x: int, center_y: int) -> Tuple[Image.Image, Tuple[int, int]]:
+    """Central circle, topic and description on a background tile, with its canvas position
+    
+    Cached per topic, so re-rendering a topic skips rasterizing its large
+    title glyphs. The tile covers everything drawn (plus a margin) and uses
+    integer offsets, so pasting it gives the same pixels as drawing in place.
+    """
+    font_large = _load_font(40)
+    font_tiny = _load_font(16)
+    measure = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    
+    circle_radius = 100
+    circle_box = (center_x - circle_radius, center_y - circle_radius,
+                  center_x + circle_radius, center_y + circle_radius)
+    bbox = measure.textbbox((0, 0), topic, font=font_large)
+    topic_xy = (center_x - (bbox[2] - bbox[0]) // 2, center_y - (bbox[3] - bbox[1]) // 2)
+    boxes = [circle_box, measure.textbbox(topic_xy, topic, font=font_large)]
+    if description:
+        bbox = measure.textbbox((0, 0), description, font=font_tiny)
+        desc_xy = (center_x - (bbox[2] - bbox[0]) // 2, center_y + circle_radius + 10)
+        boxes.append(measure.textbbox(desc_xy, description, font=font_tiny))
+    
+    margin = 2
+    left = min(box[0] for box in boxes) - margin
+    top = min(box[1] for box in boxes) - margin
+    right = max(box[2] for box in boxes) + margin + 1
+    bottom = max(box[3] for box in boxes) + margin + 1
+    
+    tile = Image.new("RGB", (right - left, bottom - top), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(tile)
+    draw.ellipse([
+        circle_box[0] - left, circle_box[1] - top,
+        circle_box[2] - left, circle_box[3] - top
+    ], fill=(52, 152, 219), outline=(44, 62, 80), width=4)
+    draw.text(
+        (topic_xy[0] - left, topic_xy[1] - top),
+        topic, fill=(255, 255, 255), font=font_large
+    )
+    if description:
+        draw.text(
+            (desc_xy[0] - left, desc_xy[1] - top),
+            description, fill=(100, 100, 100), font=font_tiny
+        )
+    return tile, (left, top)
+
+@njit(cache=True)
+def _layout(sub_counts, center_x, center_y):
+    """Node positions and arrowheads for a mind map with len(sub_counts) branches
+    
+    Returns (branches, arrows, subs): branches holds each branch's (x, y),
+    arrows the two barb ends (x1, y1, x2, y2) of the arrow from the centre
+    to it, and subs every sub-branch's (x, y) in branch order. Positions
+    truncate toward zero like int().
+    """
+    num_branches = len(sub_counts)
+    branches = np.empty((num_branches, 2), dtype=np.int64)
+    arrows = np.empty((num_branches, 4), dtype=np.float64)
+    subs = np.empty((sub_counts.sum(), 2), dtype=np.int64)
+    
+    distance = 350
+    sub_distance = 180
+    arrow_length = 15
+    arrow_angle = math.pi / 6
+    k = 0
+    for i in range(num_branches):
+        angle = 2 * math.pi * i / num_branches
+        branch_x = center_x + int(distance * math.cos(angle))
+        branch_y = center_y + int(distance * math.sin(angle))
+        branches[i, 0] = branch_x
+        branches[i, 1] = branch_y
+        
+        line_angle = math.atan2(branch_y - center_y, branch_x - center_x)
+        arrows[i, 0] = branch_x - arrow_length * math.cos(line_angle - arrow_angle)
+        arrows[i, 1] = branch_y - arrow_length * math.sin(line_angle - arrow_angle)
+        arrows[i, 2] = branch_x - arrow_length * math.cos(line_angle + arrow_angle)
+        arrows[i, 3] = branch_y - arrow_length * math.sin(line_angle + arrow_angle)
+        
+        num_sub = sub_counts[i]
+        for j in range(num_sub):
+            sub_angle = angle + (j - num_sub // 2) * 0.4
+            subs[k, 0] = branch_x + int(sub_distance * math.cos(sub_angle))
+            subs[k, 1] = branch_y + int(sub_distance * math.sin(sub_angle))
+            k += 1
+    return branches, arrows, subs
+
 class MindMapGenerator:
     """Generates visual mind maps from topics and concepts using Gemini AI"""
     
@@ -31,49 +273,79 @@ class MindMapGenerator:
             (52, 73, 94)      # Dark Gray
         ]
     
+    def _mind_map_prompt(self, topic: str, with_narration: bool = False) -> str:
+        """Mind map prompt for topic, optionally also asking for the video narration"""
+        suffix = _NARRATION_PROMPT_SUFFIX if with_narration else _PROMPT_SUFFIX
+        return _PROMPT_PREFIX + topic + suffix
+    
+    def _structure_cache_params(self, topic: str, ai_service) -> Dict[str, str]:
+        """ai_cache key parameters for a topic's mind map structure"""
+        return {
+            "topic": " ".join(topic.lower().split()),
+            "model": ai_service.get_model_info().get("model_name", ""),
+        }
+    
+    def _parse_json_response(self, response: str) -> Optional[Any]:
+        """Parse the outermost {...} in an AI response, or None if it has none
+        
+        Raises ValueError (from json or jiter) when the JSON is malformed.
+        """
+        # Find JSON in the encoded response; both parsers take bytes, and
+        # a response that is pure JSON is sliced without a copy
+        raw = response.encode("utf-8")
+        start_idx = raw.find(b'{')
+        end_idx = raw.rfind(b'}') + 1
+        if start_idx == -1:
+            return None
+        json_bytes = raw[start_idx:end_idx]
+        if JITER_AVAILABLE:
+            return jiter.from_json(json_bytes, cache_mode="keys")
+        return json.loads(json_bytes)
+    
+    def generate_structure_and_narration(self, topic: str, ai_service) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Generate the mind map structure and its video narration in one AI call
+        
+        Returns (structure, narration). narration is None when it still needs
+        its own request: the structure came from the cache, the combined
+        response had no usable narration, or the combined request failed (the
+        structure then comes from generate_mind_map_structure).
+        """
+        cache_params = self._structure_cache_params(topic, ai_service)
+        cached = load_cached("mind_map_structure", **cache_params)
+        if cached is not None:
+            return cached, None
+        
+        try:
+            response = ai_service.generate_response(self._mind_map_prompt(topic, with_narration=True))
+            logger.info(f"AI response received for mind map and narration: {topic}")
+            data = self._parse_json_response(response)
+            structure = data.get("structure") if isinstance(data, dict) else None
+            if structure is not None and self._validate_mind_map_structure(structure):
+                store_cached("mind_map_structure", structure, **cache_params)
+                narration = data.get("narration")
+                if not isinstance(narration, str) or len(narration) < 50:
+                    narration = None
+                return structure, narration
+            logger.warning(f"Invalid combined mind map response, using separate requests for: {topic}")
+        except Exception as e:
+            logger.warning(f"Combined mind map request failed, using separate requests: {e}")
+        
+        return self.generate_mind_map_structure(topic, ai_service), None
+    
     def generate_mind_map_structure(self, topic: str, ai_service) -> Dict[str, Any]:
-        """Generate mind map structure using Gemini AI"""
+        """Generate mind map structure using Gemini AI
+        
+        Valid AI structures are cached on disk by normalized topic (case and
+        whitespace ignored) and model, so repeat requests skip the AI call.
+        """
+        cache_params = self._structure_cache_params(topic, ai_service)
+        cached = load_cached("mind_map_structure", **cache_params)
+        if cached is not None:
+            return cached
+        
         try:
             # Enhanced prompt for better AI response
-            prompt = f"""
-You are an expert educator creating a comprehensive mind map for the topic: "{topic}"
-
-Create a detailed, educational mind map structure that covers:
-1. Main topic (central concept)
-2. 4-6 primary branches (major themes/concepts)
-3. 2-4 sub-branches for each primary branch
-4. Key points/details for each sub-branch
-
-Requirements:
-- Use clear, educational language
-- Focus on learning and understanding
-- Include practical applications where relevant
-- Ensure logical flow and connections
-- Make it comprehensive but not overwhelming
-
-Return ONLY valid JSON with this exact structure:
-{{
-  "topic": "Main Topic Name",
-  "description": "Brief description of the topic",
-  "main_branches": [
-    {{
-      "title": "Primary Branch Title",
-      "color": "blue",
-      "description": "Brief description of this branch",
-      "sub_branches": [
-        {{
-          "title": "Sub-branch Title",
-          "description": "Brief description",
-          "key_points": ["Point 1", "Point 2", "Point 3", "Point 4"]
-        }}
-      ]
-    }}
-  ]
-}}
-
-Color options: blue, green, purple, orange, red, yellow, teal, gray
-Ensure the JSON is properly formatted and valid.
-"""
+            prompt = self._mind_map_prompt(topic)
             
             # Get AI response
             response = ai_service.generate_response(prompt)
@@ -81,22 +353,19 @@ Ensure the JSON is properly formatted and valid.
             
             # Extract JSON from response
             try:
-                # Find JSON in the response
-                start_idx = response.find('{')
-                end_idx = response.rfind('}') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response[start_idx:end_idx]
-                    data = json.loads(json_str)
-                    
+                data = self._parse_json_response(response)
+                if data is not None:
                     # Validate structure
                     if self._validate_mind_map_structure(data):
                         logger.info(f"Valid mind map structure generated for: {topic}")
+                        store_cached("mind_map_structure", data, **cache_params)
                         return data
                     else:
                         logger.warning(f"Invalid mind map structure, using fallback for: {topic}")
                         return self._create_fallback_mind_map(topic)
                         
-            except json.JSONDecodeError as e:
+            except ValueError as e:
+                # json.JSONDecodeError and jiter's parse errors are both ValueErrors
                 logger.error(f"JSON parsing error: {e}")
                 logger.error(f"Response was: {response[:200]}...")
                 return self._create_fallback_mind_map(topic)
@@ -110,32 +379,39 @@ Ensure the JSON is properly formatted and valid.
     
     def _validate_mind_map_structure(self, data: Dict[str, Any]) -> bool:
         """Validate mind map structure"""
+        if FASTJSONSCHEMA_AVAILABLE:
+            try:
+                _validate_mind_map_schema(data)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+        
+        # Parsed JSON only holds plain dicts and lists, so exact type checks suffice
         try:
-            required_keys = ["topic", "main_branches"]
-            if not all(key in data for key in required_keys):
+            if type(data) is not dict or "topic" not in data or "main_branches" not in data:
                 return False
             
-            if not isinstance(data["main_branches"], list):
+            if type(data["main_branches"]) is not list:
                 return False
             
             for branch in data["main_branches"]:
-                if not isinstance(branch, dict):
+                if type(branch) is not dict:
                     return False
                 if "title" not in branch or "sub_branches" not in branch:
                     return False
-                if not isinstance(branch["sub_branches"], list):
+                if type(branch["sub_branches"]) is not list:
                     return False
                 
                 for sub_branch in branch["sub_branches"]:
-                    if not isinstance(sub_branch, dict):
+                    if type(sub_branch) is not dict:
                         return False
                     if "title" not in sub_branch or "key_points" not in sub_branch:
                         return False
-                    if not isinstance(sub_branch["key_points"], list):
+                    if type(sub_branch["key_points"]) is not list:
                         return False
             
             return True
-        except:
+        except (TypeError, KeyError, AttributeError):
             return False
     
     def _create_fallback_mind_map(self, topic: str) -> Dict[str, Any]:
@@ -261,66 +537,66 @@ Ensure the JSON is properly formatted and valid.
         """Create a visual mind map image with enhanced design"""
         try:
             if output_path is None:
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
+                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png", dir=SCRATCH_DIR)
                 output_path = temp_file.name
                 temp_file.close()
             
             # Create image with better resolution
-            img = Image.new('RGB', (self.default_width, self.default_height), (248, 249, 250))
+            img = Image.new('RGB', (self.default_width, self.default_height), BACKGROUND_COLOR)
             draw = ImageDraw.Draw(img)
             
-            # Try to load fonts, fallback to default if not available
-            try:
-                font_large = ImageFont.truetype("arial.ttf", 40)
-                font_medium = ImageFont.truetype("arial.ttf", 28)
-                font_small = ImageFont.truetype("arial.ttf", 20)
-                font_tiny = ImageFont.truetype("arial.ttf", 16)
-            except:
-                font_large = ImageFont.load_default()
-                font_medium = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-                font_tiny = ImageFont.load_default()
+            # Fonts are parsed once per process, falling back to the default font
+            font_medium = _load_font(28)
+            font_small = _load_font(20)
+            font_tiny = _load_font(16)
+            
+            # Measure each (font, text) pair once per image; fallback maps and
+            # repeated key points reuse the same strings. The fonts are
+            # process-wide singletons, so id(font) is a stable key.
+            text_sizes = {}
+            
+            def text_size(text, font, multiline=False):
+                key = (id(font), text)
+                size = text_sizes.get(key)
+                if size is None:
+                    if multiline:
+                        bbox = draw.multiline_textbbox((0, 0), text, font=font, spacing=key_point_spacing)
+                    else:
+                        bbox = draw.textbbox((0, 0), text, font=font)
+                    size = text_sizes[key] = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+                return size
+            
+            # Pillow advances multiline text by the height of "A" plus spacing;
+            # pick spacing so key points keep their 18px line pitch
+            key_point_spacing = 18 - draw.textbbox((0, 0), "A", font=font_tiny)[3]
             
             # Draw central topic
             center_x, center_y = self.default_width // 2, self.default_height // 2
             topic = mind_map_data.get("topic", "Topic")
             description = mind_map_data.get("description", "")
             
-            # Draw central circle with gradient effect
-            circle_radius = 100
-            draw.ellipse([
-                center_x - circle_radius, center_y - circle_radius,
-                center_x + circle_radius, center_y + circle_radius
-            ], fill=(52, 152, 219), outline=(44, 62, 80), width=4)
-            
-            # Draw topic text
-            bbox = draw.textbbox((0, 0), topic, font=font_large)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            draw.text(
-                (center_x - text_width // 2, center_y - text_height // 2),
-                topic, fill=(255, 255, 255), font=font_large
-            )
-            
-            # Draw description if available
-            if description:
-                bbox = draw.textbbox((0, 0), description, font=font_tiny)
-                desc_width = bbox[2] - bbox[0]
-                draw.text(
-                    (center_x - desc_width // 2, center_y + circle_radius + 10),
-                    description, fill=(100, 100, 100), font=font_tiny
-                )
+            # Paste the central circle, topic and description; the canvas is
+            # still blank there, so the prerendered tile matches drawing in place
+            center_tile, center_origin = _render_center(topic, description, center_x, center_y)
+            img.paste(center_tile, center_origin)
             
             # Draw main branches
             main_branches = mind_map_data.get("main_branches", [])
             num_branches = len(main_branches)
             
+            # Lay out every branch, arrowhead and sub-branch in one call
+            sub_counts = np.array(
+                [len(branch.get("sub_branches", [])) for branch in main_branches], dtype=np.int64
+            )
+            branch_layout, arrow_layout, sub_layout = _layout(sub_counts, center_x, center_y)
+            branch_positions = branch_layout.tolist()
+            arrow_barbs = arrow_layout.tolist()
+            sub_positions = sub_layout.tolist()
+            sub_start = 0
+            
             for i, branch in enumerate(main_branches):
                 # Calculate position
-                angle = (2 * math.pi * i) / num_branches
-                distance = 350
-                branch_x = center_x + int(distance * math.cos(angle))
-                branch_y = center_y + int(distance * math.sin(angle))
+                branch_x, branch_y = branch_positions[i]
                 
                 # Get color
                 color_name = branch.get("color", "blue")
@@ -335,24 +611,18 @@ Ensure the JSON is properly formatted and valid.
                 
                 # Draw branch title
                 title = branch.get("title", "Branch")
-                bbox = draw.textbbox((0, 0), title, font=font_medium)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
+                text_width, text_height = text_size(title, font_medium)
                 draw.text(
                     (branch_x - text_width // 2, branch_y - text_height // 2),
                     title, fill=(255, 255, 255), font=font_medium
                 )
                 
                 # Draw connection line with arrow effect
-                self._draw_connection_line(draw, center_x, center_y, branch_x, branch_y, color)
+                self._draw_connection_line(draw, center_x, center_y, branch_x, branch_y, color, arrow_barbs[i])
                 
                 # Draw sub-branches
                 sub_branches = branch.get("sub_branches", [])
-                for j, sub_branch in enumerate(sub_branches):
-                    sub_angle = angle + (j - len(sub_branches) // 2) * 0.4
-                    sub_distance = 180
-                    sub_x = branch_x + int(sub_distance * math.cos(sub_angle))
-                    sub_y = branch_y + int(sub_distance * math.sin(sub_angle))
+                for sub_branch, (sub_x, sub_y) in zip(sub_branches, sub_positions[sub_start:]):
                     
                     # Draw sub-branch rectangle
                     sub_title = sub_branch.get("title", "Sub-branch")
@@ -360,9 +630,7 @@ Ensure the JSON is properly formatted and valid.
                     key_points = sub_branch.get("key_points", [])
                     
                     # Calculate text dimensions
-                    bbox = draw.textbbox((0, 0), sub_title, font=font_small)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
+                    text_width, text_height = text_size(sub_title, font_small)
                     
                     # Add space for key points
                     points_height = len(key_points) * 20 if key_points else 0
@@ -382,22 +650,26 @@ Ensure the JSON is properly formatted and valid.
                     )
                     
                     # Draw key points
+                    # (one centred multiline block; limit to 3 points for space)
                     y_offset = sub_y - rect_height // 2 + text_height + 10
-                    for k, point in enumerate(key_points[:3]):  # Limit to 3 points for space
-                        point_text = f"• {point}"
-                        bbox = draw.textbbox((0, 0), point_text, font=font_tiny)
-                        point_width = bbox[2] - bbox[0]
-                        draw.text(
-                            (sub_x - point_width // 2, y_offset + k * 18),
-                            point_text, fill=(80, 80, 80), font=font_tiny
+                    if key_points:
+                        points_block = "\n".join(f"• {point}" for point in key_points[:3])
+                        block_width = text_size(points_block, font_tiny, multiline=True)[0]
+                        draw.multiline_text(
+                            (sub_x - block_width // 2, y_offset),
+                            points_block, fill=(80, 80, 80), font=font_tiny,
+                            spacing=key_point_spacing, align="center"
                         )
                     
                     # Draw connection line
                     draw.line([(branch_x, branch_y), (sub_x, sub_y)], 
                              fill=(150, 150, 150), width=2)
+                sub_start += len(sub_branches)
             
             # Save image
-            img.save(output_path, "PNG", quality=95)
+            # PNG is lossless (quality does not apply); the fastest zlib level
+            # cuts encode time several-fold for a somewhat larger file
+            img.save(output_path, "PNG", compress_level=1)
             logger.info(f"Mind map image created: {output_path}")
             return output_path
             
@@ -405,47 +677,34 @@ Ensure the JSON is properly formatted and valid.
             logger.error(f"Failed to create mind map image: {e}")
             raise
     
-    def _draw_connection_line(self, draw, x1, y1, x2, y2, color):
-        """Draw connection line with arrow effect"""
+    def _draw_connection_line(self, draw, x1, y1, x2, y2, color, barbs):
+        """Draw connection line with arrow effect
+        
+        barbs holds the arrowhead's two barb ends (x1, y1, x2, y2), as
+        computed by _layout.
+        """
         # Main line
         draw.line([(x1, y1), (x2, y2)], fill=(100, 100, 100), width=3)
         
         # Arrow head
-        angle = math.atan2(y2 - y1, x2 - x1)
-        arrow_length = 15
-        arrow_angle = math.pi / 6
-        
-        # Arrow points
-        arrow_x1 = x2 - arrow_length * math.cos(angle - arrow_angle)
-        arrow_y1 = y2 - arrow_length * math.sin(angle - arrow_angle)
-        arrow_x2 = x2 - arrow_length * math.cos(angle + arrow_angle)
-        arrow_y2 = y2 - arrow_length * math.sin(angle + arrow_angle)
+        arrow_x1, arrow_y1, arrow_x2, arrow_y2 = barbs
         
-        draw.line([(x2, y2), (arrow_x1, arrow_y1)], fill=color, width=2)
-        draw.line([(x2, y2), (arrow_x2, arrow_y2)], fill=color, width=2)
+        # Both barbs in one call: a polyline through the tip
+        draw.line([(arrow_x1, arrow_y1), (x2, y2), (arrow_x2, arrow_y2)], fill=color, width=2)
     
     def _get_color_from_name(self, color_name: str) -> tuple:
         """Convert color name to RGB tuple"""
-        color_map = {
-            "blue": (52, 152, 219),
-            "green": (46, 204, 113),
-            "purple": (155, 89, 182),
-            "orange": (230, 126, 34),
-            "red": (231, 76, 60),
-            "yellow": (241, 196, 15),
-            "teal": (26, 188, 156),
-            "gray": (52, 73, 94)
-        }
-        return color_map.get(color_name.lower(), (52, 152, 219))
+        # The AI is asked for lowercase names, so try those as given first
+        color = _COLOR_MAP.get(color_name)
+        if color is None:
+            color = _COLOR_MAP.get(color_name.lower(), _DEFAULT_COLOR)
+        return color
     
     def generate_mind_map_video(self, topic: str, ai_service, output_path: str = None) -> str:
         """Generate a video showing mind map creation with narration"""
         try:
-            # Generate mind map structure using AI
-            mind_map_data = self.generate_mind_map_structure(topic, ai_service)
-            
-            # Create mind map image
-            image_path = self.create_mind_map_image(mind_map_data)
+            # Generate mind map structure and narration in one AI call
+            mind_map_data, narration = self.generate_structure_and_narration(topic, ai_service)
             
             # Convert to video with narration
             if output_path is None:
@@ -453,8 +712,13 @@ Ensure the JSON is properly formatted and valid.
                 output_path = temp_file.name
                 temp_file.close()
             
-            # Create narration text using AI
-            narration_prompt = f"""
+            # The narration only needs the structure, so render the image
+            # while any separate narration request is in flight
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                image_future = executor.submit(self.create_mind_map_image, mind_map_data)
+                if narration is None:
+                    # Create narration text using AI
+                    narration_prompt = f"""
 Create a clear, educational narration for a mind map video about "{topic}".
 
 The mind map has these main branches:
@@ -469,20 +733,25 @@ Create a 30-45 second narration that:
 Use clear, engaging language suitable for educational content.
 Keep it concise but informative.
 """
-            
-            narration = ai_service.generate_response(narration_prompt)
+                    narration = executor.submit(ai_service.generate_response, narration_prompt).result()
+                image_path = image_future.result()
             
             # Fallback narration if AI fails
             if not narration or len(narration) < 50:
-                narration = f"Welcome to this mind map about {topic}. This visual representation shows the main concepts and their relationships. "
-                narration += f"The central topic is {topic}. "
+                parts = [
+                    f"Welcome to this mind map about {topic}. This visual representation shows the main concepts and their relationships. ",
+                    f"The central topic is {topic}. ",
+                ]
                 
                 for i, branch in enumerate(mind_map_data.get("main_branches", [])):
-                    narration += f"The {i+1} main branch covers {branch.get('title', 'concepts')}. "
-                    for sub_branch in branch.get("sub_branches", []):
-                        narration += f"This includes {sub_branch.get('title', 'elements')}. "
+                    parts.append(f"The {i+1} main branch covers {branch.get('title', 'concepts')}. ")
+                    parts.extend(
+                        f"This includes {sub_branch.get('title', 'elements')}. "
+                        for sub_branch in branch.get("sub_branches", [])
+                    )
                 
-                narration += f"This mind map provides a comprehensive overview of {topic} and its key components."
+                parts.append(f"This mind map provides a comprehensive overview of {topic} and its key components.")
+                narration = "".join(parts)
             
             # Generate video using video generator
             from video_generator import VideoGenerator
@@ -1,11 +1,41 @@
 import json
 import tempfile
+import io
 import os
 from typing import Dict, List, Any, Optional
 import logging
 from config import Config
 from datetime import datetime
 
+# orjson parses the multi-KB notes JSON several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    ORJSON_AVAILABLE = False
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _extract_json(text: str) -> Optional[Any]:
+    """The JSON value starting at the first '{' of an AI response, or None
+    
+    A response that is pure JSON goes straight to orjson when installed;
+    otherwise raw_decode parses one value in a single forward pass, so
+    prose after the JSON (braces included) is ignored.
+    """
+    start_idx = text.find('{')
+    if start_idx < 0:
+        return None
+    if start_idx == 0 and ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    try:
+        return _JSON_DECODER.raw_decode(text, start_idx)[0]
+    except ValueError:
+        return None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,30 +45,74 @@ class NotesGenerator:
     
     def __init__(self):
         self.config = Config()
-        self.note_templates = {
-            "comprehensive": self._comprehensive_template,
-            "summary": self._summary_template,
-            "flashcards": self._flashcards_template,
-            "study_guide": self._study_guide_template
+        self.note_prompts = {
+            "comprehensive": self._comprehensive_prompt,
+            "summary": self._summary_prompt,
+            "flashcards": self._flashcards_prompt,
+            "study_guide": self._study_guide_prompt
+        }
+        self.note_fallbacks = {
+            "comprehensive": self._create_fallback_notes,
+            "summary": self._create_fallback_summary,
+            "flashcards": self._create_fallback_flashcards,
+            "study_guide": self._create_fallback_study_guide
         }
     
     def generate_notes(self, topic: str, ai_service, note_type: str = "comprehensive") -> Dict[str, Any]:
         """Generate study notes for a topic"""
+        if note_type not in self.note_prompts:
+            note_type = "comprehensive"
+        
         try:
-            if note_type not in self.note_templates:
-                note_type = "comprehensive"
-            
-            template_func = self.note_templates[note_type]
-            return template_func(topic, ai_service)
+            response = ai_service.generate_response(self._build_prompt(note_type, topic))
+            return self._parse_response(note_type, response, topic)
             
         except Exception as e:
-            logger.error(f"Failed to generate notes: {e}")
-            return self._create_fallback_notes(topic)
+            logger.error(f"Failed to generate {note_type} notes: {e}")
+            return self.note_fallbacks[note_type](topic)
     
-    def _comprehensive_template(self, topic: str, ai_service) -> Dict[str, Any]:
-        """Generate comprehensive study notes"""
-        try:
-            prompt = f"""
+    def generate_notes_batch(self, topic: str, ai_service, note_types: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Generate several note types for a topic with their AI requests in flight together
+        
+        note_types defaults to every type; unknown types map to "comprehensive"
+        as in generate_notes. Returns {note_type: notes}, with the type's
+        fallback notes for any request that failed.
+        """
+        if note_types is None:
+            note_types = list(self.note_prompts)
+        note_types = list(dict.fromkeys(
+            note_type if note_type in self.note_prompts else "comprehensive"
+            for note_type in note_types
+        ))
+        
+        prompts = [self._build_prompt(note_type, topic) for note_type in note_types]
+        responses = ai_service.generate_responses(prompts)
+        
+        results = {}
+        for note_type, response in zip(note_types, responses):
+            if response is None:
+                results[note_type] = self.note_fallbacks[note_type](topic)
+            else:
+                results[note_type] = self._parse_response(note_type, response, topic)
+        return results
+    
+    def _build_prompt(self, note_type: str, topic: str) -> str:
+        """AI prompt for one note type"""
+        return self.note_prompts[note_type](topic)
+    
+    def _parse_response(self, note_type: str, text: str, topic: str) -> Dict[str, Any]:
+        """Notes parsed from an AI response, or the note type's fallback notes"""
+        # Try to extract JSON from response
+        data = _extract_json(text)
+        if isinstance(data, dict):
+            data["generated_at"] = datetime.now().isoformat()
+            return data
+        
+        return self.note_fallbacks[note_type](topic)
+    
+    def _comprehensive_prompt(self, topic: str) -> str:
+        """Comprehensive study notes prompt"""
+        return f"""
 Create comprehensive study notes for: "{topic}"
 
 Generate detailed notes with the following structure:
@@ -78,31 +152,10 @@ Return ONLY valid JSON with this structure:
 
 Use clear, educational language. Focus on understanding and retention.
 """
-            
-            response = ai_service.generate_response(prompt)
-            
-            # Try to extract JSON from response
-            try:
-                start_idx = response.find('{')
-                end_idx = response.rfind('}') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response[start_idx:end_idx]
-                    data = json.loads(json_str)
-                    data["generated_at"] = datetime.now().isoformat()
-                    return data
-            except:
-                pass
-            
-            return self._create_fallback_notes(topic)
-            
-        except Exception as e:
-            logger.error(f"Failed to generate comprehensive notes: {e}")
-            return self._create_fallback_notes(topic)
     
-    def _summary_template(self, topic: str, ai_service) -> Dict[str, Any]:
-        """Generate summary notes"""
-        try:
-            prompt = f"""
+    def _summary_prompt(self, topic: str) -> str:
+        """Summary notes prompt"""
+        return f"""
 Create a concise summary of: "{topic}"
 
 Generate a brief but comprehensive summary with:
@@ -130,30 +183,10 @@ Return ONLY valid JSON with this structure:
 
 Keep it concise and focused on the most important information.
 """
-            
-            response = ai_service.generate_response(prompt)
-            
-            try:
-                start_idx = response.find('{')
-                end_idx = response.rfind('}') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response[start_idx:end_idx]
-                    data = json.loads(json_str)
-                    data["generated_at"] = datetime.now().isoformat()
-                    return data
-            except:
-                pass
-            
-            return self._create_fallback_summary(topic)
-            
-        except Exception as e:
-            logger.error(f"Failed to generate summary notes: {e}")
-            return self._create_fallback_summary(topic)
     
-    def _flashcards_template(self, topic: str, ai_service) -> Dict[str, Any]:
-        """Generate flashcard notes"""
-        try:
-            prompt = f"""
+    def _flashcards_prompt(self, topic: str) -> str:
+        """Flashcard notes prompt"""
+        return f"""
 Create flashcards for: "{topic}"
 
 Generate 10-15 flashcards covering:
@@ -180,30 +213,10 @@ Return ONLY valid JSON with this structure:
 
 Create clear, concise flashcards that are easy to study.
 """
-            
-            response = ai_service.generate_response(prompt)
-            
-            try:
-                start_idx = response.find('{')
-                end_idx = response.rfind('}') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response[start_idx:end_idx]
-                    data = json.loads(json_str)
-                    data["generated_at"] = datetime.now().isoformat()
-                    return data
-            except:
-                pass
-            
-            return self._create_fallback_flashcards(topic)
-            
-        except Exception as e:
-            logger.error(f"Failed to generate flashcard notes: {e}")
-            return self._create_fallback_flashcards(topic)
     
-    def _study_guide_template(self, topic: str, ai_service) -> Dict[str, Any]:
-        """Generate study guide notes"""
-        try:
-            prompt = f"""
+    def _study_guide_prompt(self, topic: str) -> str:
+        """Study guide prompt"""
+        return f"""
 Create a study guide for: "{topic}"
 
 Generate a structured study guide with:
@@ -250,25 +263,6 @@ Return ONLY valid JSON with this structure:
 
 Create a practical, actionable study guide.
 """
-            
-            response = ai_service.generate_response(prompt)
-            
-            try:
-                start_idx = response.find('{')
-                end_idx = response.rfind('}') + 1
-                if start_idx != -1 and end_idx != -1:
-                    json_str = response[start_idx:end_idx]
-                    data = json.loads(json_str)
-                    data["generated_at"] = datetime.now().isoformat()
-                    return data
-            except:
-                pass
-            
-            return self._create_fallback_study_guide(topic)
-            
-        except Exception as e:
-            logger.error(f"Failed to generate study guide: {e}")
-            return self._create_fallback_study_guide(topic)
     
     def _create_fallback_notes(self, topic: str) -> Dict[str, Any]:
         """Create fallback comprehensive notes"""
@@ -276,6 +270,7 @@ Create a practical, actionable study guide.
             "topic": topic,
             "generated_at": datetime.now().isoformat(),
             "note_type": "comprehensive",
+            "fallback": True,
             "sections": [
                 {
                     "title": "Overview",
@@ -309,6 +304,7 @@ Create a practical, actionable study guide.
             "topic": topic,
             "generated_at": datetime.now().isoformat(),
             "note_type": "summary",
+            "fallback": True,
             "overview": f"{topic} is a fundamental concept with important applications.",
             "key_concepts": ["Core principle", "Main application", "Key benefit"],
             "definitions": [
@@ -324,6 +320,7 @@ Create a practical, actionable study guide.
             "topic": topic,
             "generated_at": datetime.now().isoformat(),
             "note_type": "flashcards",
+            "fallback": True,
             "flashcards": [
                 {
                     "front": f"What is {topic}?",
@@ -346,6 +343,7 @@ Create a practical, actionable study guide.
             "topic": topic,
             "generated_at": datetime.now().isoformat(),
             "note_type": "study_guide",
+            "fallback": True,
             "learning_objectives": ["Understand core concepts", "Apply principles", "Master applications"],
             "prerequisites": ["Basic knowledge", "Fundamental understanding"],
             "learning_path": [
@@ -384,21 +382,7 @@ Create a practical, actionable study guide.
                 temp_file.close()
             
             with open(output_path, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write(f"# {notes_data.get('topic', 'Study Notes')}\n\n")
-                f.write(f"**Generated:** {notes_data.get('generated_at', 'Unknown')}\n")
-                f.write(f"**Type:** {notes_data.get('note_type', 'Notes')}\n\n")
-                
-                note_type = notes_data.get('note_type', 'comprehensive')
-                
-                if note_type == 'comprehensive':
-                    self._write_comprehensive_markdown(f, notes_data)
-                elif note_type == 'summary':
-                    self._write_summary_markdown(f, notes_data)
-                elif note_type == 'flashcards':
-                    self._write_flashcards_markdown(f, notes_data)
-                elif note_type == 'study_guide':
-                    self._write_study_guide_markdown(f, notes_data)
+                self._write_notes_markdown(f, notes_data)
             
             logger.info(f"Notes exported to Markdown: {output_path}")
             return output_path
@@ -407,6 +391,30 @@ Create a practical, actionable study guide.
             logger.error(f"Failed to export notes to Markdown: {e}")
             raise
     
+    def export_notes_to_markdown_str(self, notes_data: Dict[str, Any]) -> str:
+        """Render notes as a Markdown string without touching the filesystem"""
+        buffer = io.StringIO()
+        self._write_notes_markdown(buffer, notes_data)
+        return buffer.getvalue()
+    
+    def _write_notes_markdown(self, f, notes_data):
+        """Write notes Markdown to a file-like object"""
+        # Write header
+        f.write(f"# {notes_data.get('topic', 'Study Notes')}\n\n")
+        f.write(f"**Generated:** {notes_data.get('generated_at', 'Unknown')}\n")
+        f.write(f"**Type:** {notes_data.get('note_type', 'Notes')}\n\n")
+        
+        note_type = notes_data.get('note_type', 'comprehensive')
+        
+        if note_type == 'comprehensive':
+            self._write_comprehensive_markdown(f, notes_data)
+        elif note_type == 'summary':
+            self._write_summary_markdown(f, notes_data)
+        elif note_type == 'flashcards':
+            self._write_flashcards_markdown(f, notes_data)
+        elif note_type == 'study_guide':
+            self._write_study_guide_markdown(f, notes_data)
+    
     def _write_comprehensive_markdown(self, f, notes_data):
         """Write comprehensive notes to Markdown"""
         # Write sections
@@ -3,8 +3,8 @@
 Quick test to generate Sun content using the enhanced universal AI prompt
 """
 
-import json
 from ai_service import AIService
+from ai_cache import save_content_json
 
 def test_sun_content():
     """Test the enhanced universal AI prompt with Sun topic"""
@@ -49,8 +49,7 @@ def test_sun_content():
         print(f"\n🎭 Subtopic types used: {', '.join(unique_types)}")
         
         # Save to file
-        with open("sun_test_content.json", 'w') as f:
-            json.dump(structured_data, f, indent=2)
+        save_content_json(structured_data, "sun_test_content.json")
         print(f"\n💾 Content saved to: sun_test_content.json")
         
         # Show video-ready format
@@ -1,5 +1,6 @@
 import json
 import tempfile
+import io
 import os
 from typing import Dict, List, Any, Optional
 import logging
@@ -352,6 +353,7 @@ Focus on testing critical thinking and deep understanding.
         return {
             "topic": topic,
             "quiz_type": "multiple_choice",
+            "fallback": True,
             "difficulty": "medium",
             "num_questions": len(questions),
             "generated_at": datetime.now().isoformat(),
@@ -378,6 +380,7 @@ Focus on testing critical thinking and deep understanding.
         return {
             "topic": topic,
             "quiz_type": "true_false",
+            "fallback": True,
             "difficulty": "medium",
             "num_questions": len(questions),
             "generated_at": datetime.now().isoformat(),
@@ -404,6 +407,7 @@ Focus on testing critical thinking and deep understanding.
         return {
             "topic": topic,
             "quiz_type": "fill_blank",
+            "fallback": True,
             "difficulty": "medium",
             "num_questions": len(questions),
             "generated_at": datetime.now().isoformat(),
@@ -430,6 +434,7 @@ Focus on testing critical thinking and deep understanding.
         return {
             "topic": topic,
             "quiz_type": "matching",
+            "fallback": True,
             "difficulty": "medium",
             "num_questions": len(items),
             "generated_at": datetime.now().isoformat(),
@@ -457,6 +462,7 @@ Focus on testing critical thinking and deep understanding.
         return {
             "topic": topic,
             "quiz_type": "essay",
+            "fallback": True,
             "difficulty": "medium",
             "num_questions": len(questions),
             "generated_at": datetime.now().isoformat(),
@@ -474,6 +480,7 @@ Focus on testing critical thinking and deep understanding.
         return {
             "topic": topic,
             "quiz_type": quiz_type,
+            "fallback": True,
             "difficulty": "medium",
             "num_questions": num_questions,
             "generated_at": datetime.now().isoformat(),
@@ -603,61 +610,7 @@ Focus on testing critical thinking and deep understanding.
                 temp_file.close()
             
             with open(output_path, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write(f"# {quiz_data.get('topic', 'Quiz')} - {quiz_data.get('quiz_type', 'Quiz').title()}\n\n")
-                f.write(f"**Generated:** {quiz_data.get('generated_at', 'Unknown')}\n")
-                f.write(f"**Difficulty:** {quiz_data.get('difficulty', 'Medium')}\n")
-                f.write(f"**Questions:** {quiz_data.get('num_questions', 0)}\n\n")
-                
-                # Instructions
-                if quiz_data.get('instructions'):
-                    f.write(f"## Instructions\n\n{quiz_data['instructions']}\n\n")
-                
-                quiz_type = quiz_data.get('quiz_type', 'multiple_choice')
-                
-                if quiz_type == 'multiple_choice':
-                    self._write_multiple_choice_markdown(f, quiz_data)
-                elif quiz_type == 'true_false':
-                    self._write_true_false_markdown(f, quiz_data)
-                elif quiz_type == 'fill_blank':
-                    self._write_fill_blank_markdown(f, quiz_data)
-                elif quiz_type == 'matching':
-                    self._write_matching_markdown(f, quiz_data)
-                elif quiz_type == 'essay':
-                    self._write_essay_markdown(f, quiz_data)
-                
-                # Answer key
-                f.write("## Answer Key\n\n")
-                f.write("*Answers and explanations for all questions.*\n\n")
-                
-                if quiz_type == 'multiple_choice':
-                    for i, question in enumerate(quiz_data.get('questions', []), 1):
-                        f.write(f"**{i}.** {question.get('question', '')}\n")
-                        f.write(f"**Answer:** {question.get('correct_answer', '')}\n")
-                        f.write(f"**Explanation:** {question.get('explanation', '')}\n\n")
-                
-                elif quiz_type == 'true_false':
-                    for i, question in enumerate(quiz_data.get('questions', []), 1):
-                        f.write(f"**{i}.** {question.get('statement', '')}\n")
-                        f.write(f"**Answer:** {question.get('correct_answer', '')}\n")
-                        f.write(f"**Explanation:** {question.get('explanation', '')}\n\n")
-                
-                elif quiz_type == 'fill_blank':
-                    for i, question in enumerate(quiz_data.get('questions', []), 1):
-                        f.write(f"**{i}.** {question.get('sentence', '')}\n")
-                        f.write(f"**Answer:** {', '.join(question.get('correct_answers', []))}\n")
-                        f.write(f"**Explanation:** {question.get('explanation', '')}\n\n")
-                
-                elif quiz_type == 'matching':
-                    for i, item in enumerate(quiz_data.get('items', []), 1):
-                        f.write(f"**{i}.** {item.get('term', '')} → {item.get('definition', '')}\n")
-                        f.write(f"**Explanation:** {item.get('explanation', '')}\n\n")
-                
-                elif quiz_type == 'essay':
-                    for i, question in enumerate(quiz_data.get('questions', []), 1):
-                        f.write(f"**{i}.** {question.get('prompt', '')}\n")
-                        f.write(f"**Key Points:** {', '.join(question.get('key_points', []))}\n")
-                        f.write(f"**Evaluation Criteria:** {', '.join(question.get('evaluation_criteria', []))}\n\n")
+                self._write_quiz_markdown(f, quiz_data)
             
             logger.info(f"Quiz exported to Markdown: {output_path}")
             return output_path
@@ -666,6 +619,70 @@ Focus on testing critical thinking and deep understanding.
             logger.error(f"Failed to export quiz to Markdown: {e}")
             raise
     
+    def export_quiz_to_markdown_str(self, quiz_data: Dict[str, Any]) -> str:
+        """Render quiz as a Markdown string without touching the filesystem"""
+        buffer = io.StringIO()
+        self._write_quiz_markdown(buffer, quiz_data)
+        return buffer.getvalue()
+    
+    def _write_quiz_markdown(self, f, quiz_data):
+        """Write quiz Markdown to a file-like object"""
+        # Write header
+        f.write(f"# {quiz_data.get('topic', 'Quiz')} - {quiz_data.get('quiz_type', 'Quiz').title()}\n\n")
+        f.write(f"**Generated:** {quiz_data.get('generated_at', 'Unknown')}\n")
+        f.write(f"**Difficulty:** {quiz_data.get('difficulty', 'Medium')}\n")
+        f.write(f"**Questions:** {quiz_data.get('num_questions', 0)}\n\n")
+        
+        # Instructions
+        if quiz_data.get('instructions'):
+            f.write(f"## Instructions\n\n{quiz_data['instructions']}\n\n")
+        
+        quiz_type = quiz_data.get('quiz_type', 'multiple_choice')
+        
+        if quiz_type == 'multiple_choice':
+            self._write_multiple_choice_markdown(f, quiz_data)
+        elif quiz_type == 'true_false':
+            self._write_true_false_markdown(f, quiz_data)
+        elif quiz_type == 'fill_blank':
+            self._write_fill_blank_markdown(f, quiz_data)
+        elif quiz_type == 'matching':
+            self._write_matching_markdown(f, quiz_data)
+        elif quiz_type == 'essay':
+            self._write_essay_markdown(f, quiz_data)
+        
+        # Answer key
+        f.write("## Answer Key\n\n")
+        f.write("*Answers and explanations for all questions.*\n\n")
+        
+        if quiz_type == 'multiple_choice':
+            for i, question in enumerate(quiz_data.get('questions', []), 1):
+                f.write(f"**{i}.** {question.get('question', '')}\n")
+                f.write(f"**Answer:** {question.get('correct_answer', '')}\n")
+                f.write(f"**Explanation:** {question.get('explanation', '')}\n\n")
+        
+        elif quiz_type == 'true_false':
+            for i, question in enumerate(quiz_data.get('questions', []), 1):
+                f.write(f"**{i}.** {question.get('statement', '')}\n")
+                f.write(f"**Answer:** {question.get('correct_answer', '')}\n")
+                f.write(f"**Explanation:** {question.get('explanation', '')}\n\n")
+        
+        elif quiz_type == 'fill_blank':
+            for i, question in enumerate(quiz_data.get('questions', []), 1):
+                f.write(f"**{i}.** {question.get('sentence', '')}\n")
+                f.write(f"**Answer:** {', '.join(question.get('correct_answers', []))}\n")
+                f.write(f"**Explanation:** {question.get('explanation', '')}\n\n")
+        
+        elif quiz_type == 'matching':
+            for i, item in enumerate(quiz_data.get('items', []), 1):
+                f.write(f"**{i}.** {item.get('term', '')} → {item.get('definition', '')}\n")
+                f.write(f"**Explanation:** {item.get('explanation', '')}\n\n")
+        
+        elif quiz_type == 'essay':
+            for i, question in enumerate(quiz_data.get('questions', []), 1):
+                f.write(f"**{i}.** {question.get('prompt', '')}\n")
+                f.write(f"**Key Points:** {', '.join(question.get('key_points', []))}\n")
+                f.write(f"**Evaluation Criteria:** {', '.join(question.get('evaluation_criteria', []))}\n\n")
+    
     def _write_multiple_choice_markdown(self, f, quiz_data):
         """Write multiple choice quiz to Markdown"""
         f.write("## Questions\n\n")
@@ -0,0 +1,58 @@
+"""
+Process-wide shared service instances for the command-line scripts
+"""
+
+import functools
+import threading
+
+def _shared(func):
+    """Cache func's instance process-wide, creating it at most once across threads
+    
+    lru_cache alone does not lock, so two threads calling a getter for the
+    first time could each construct an instance.
+    """
+    cached = functools.lru_cache(maxsize=1)(func)
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper():
+        with lock:
+            return cached()
+    return wrapper
+
+@_shared
+def get_ai_service():
+    """Get the shared AIService instance, created on first use"""
+    from ai_service import AIService
+    return AIService()
+
+@_shared
+def get_video_generator():
+    """Get the shared VideoGenerator instance, created on first use"""
+    from video_generator import VideoGenerator
+    return VideoGenerator()
+
+@_shared
+def get_http_session():
+    """Get the shared requests.Session, pooling keep-alive connections per host
+    
+    Reusing it saves the TCP and TLS handshakes on repeated requests to the
+    same host; connection errors are retried twice with a short backoff.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_services():
+    """Get the shared (VideoGenerator, AIService) pair"""
+    return get_video_generator(), get_ai_service()
@@ -1,7 +1,8 @@
 import json
 import tempfile
+import io
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 from config import Config
 from datetime import datetime, timedelta
@@ -29,13 +30,16 @@ class StudyPlanner:
         """Generate a comprehensive study plan"""
         try:
             # Generate topic breakdown
-            topic_breakdown = self._generate_topic_breakdown(topic, ai_service, difficulty)
+            topic_breakdown, breakdown_fallback = self._generate_topic_breakdown(topic, ai_service, difficulty)
             
             # Create study schedule
             schedule = self._create_study_schedule(topic_breakdown, study_duration, hours_per_day, study_method)
             
             # Generate learning objectives
-            objectives = self._generate_learning_objectives(topic, ai_service, difficulty)
+            objectives, objectives_fallback = self._generate_learning_objectives(topic, ai_service, difficulty)
+            
+            # Generate resource list
+            resources, resources_fallback = self._generate_resource_list(topic, ai_service)
             
             # Create progress tracking
             progress_tracking = self._create_progress_tracking(topic_breakdown, study_duration)
@@ -52,15 +56,17 @@ class StudyPlanner:
                 "objectives": objectives,
                 "progress_tracking": progress_tracking,
                 "study_tips": self._generate_study_tips(study_method),
-                "resources": self._generate_resource_list(topic, ai_service)
+                "resources": resources,
+                # Set when any AI part is stand-in content, so it is not cached
+                "fallback": breakdown_fallback or objectives_fallback or resources_fallback
             }
             
         except Exception as e:
             logger.error(f"Failed to generate study plan: {e}")
             return self._create_fallback_study_plan(topic, study_duration, hours_per_day)
     
-    def _generate_topic_breakdown(self, topic: str, ai_service, difficulty: str) -> List[Dict[str, Any]]:
-        """Generate detailed topic breakdown"""
+    def _generate_topic_breakdown(self, topic: str, ai_service, difficulty: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """Generate detailed topic breakdown, and whether it is the fallback breakdown"""
         try:
             prompt = f"""
 Create a detailed breakdown of the topic: "{topic}" for {difficulty} level study.
@@ -98,15 +104,15 @@ Structure the units in logical learning order. Consider dependencies between con
                 if start_idx != -1 and end_idx != -1:
                     json_str = response[start_idx:end_idx]
                     data = json.loads(json_str)
-                    return data.get("units", [])
+                    return data.get("units", []), False
             except:
                 pass
             
-            return self._create_fallback_topic_breakdown(topic)
+            return self._create_fallback_topic_breakdown(topic), True
             
         except Exception as e:
             logger.error(f"Failed to generate topic breakdown: {e}")
-            return self._create_fallback_topic_breakdown(topic)
+            return self._create_fallback_topic_breakdown(topic), True
     
     def _create_fallback_topic_breakdown(self, topic: str) -> List[Dict[str, Any]]:
         """Create fallback topic breakdown"""
@@ -248,8 +254,8 @@ Structure the units in logical learning order. Consider dependencies between con
         
         return schedule
     
-    def _generate_learning_objectives(self, topic: str, ai_service, difficulty: str) -> List[Dict[str, Any]]:
-        """Generate learning objectives"""
+    def _generate_learning_objectives(self, topic: str, ai_service, difficulty: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """Generate learning objectives, and whether they are the fallback objectives"""
         try:
             prompt = f"""
 Create specific learning objectives for studying: "{topic}" at {difficulty} level.
@@ -284,15 +290,15 @@ Focus on creating clear, achievable learning goals.
                 if start_idx != -1 and end_idx != -1:
                     json_str = response[start_idx:end_idx]
                     data = json.loads(json_str)
-                    return data.get("objectives", [])
+                    return data.get("objectives", []), False
             except:
                 pass
             
-            return self._create_fallback_objectives(topic)
+            return self._create_fallback_objectives(topic), True
             
         except Exception as e:
             logger.error(f"Failed to generate learning objectives: {e}")
-            return self._create_fallback_objectives(topic)
+            return self._create_fallback_objectives(topic), True
     
     def _create_fallback_objectives(self, topic: str) -> List[Dict[str, Any]]:
         """Create fallback learning objectives"""
@@ -383,8 +389,8 @@ Focus on creating clear, achievable learning goals.
         
         return tips.get(study_method, tips["pomodoro"])
     
-    def _generate_resource_list(self, topic: str, ai_service) -> List[Dict[str, Any]]:
-        """Generate resource list for studying"""
+    def _generate_resource_list(self, topic: str, ai_service) -> Tuple[List[Dict[str, Any]], bool]:
+        """Generate resource list for studying, and whether it is the fallback list"""
         try:
             prompt = f"""
 Suggest study resources for: "{topic}"
@@ -423,15 +429,15 @@ Focus on high-quality, educational resources.
                 if start_idx != -1 and end_idx != -1:
                     json_str = response[start_idx:end_idx]
                     data = json.loads(json_str)
-                    return data.get("resources", [])
+                    return data.get("resources", []), False
             except:
                 pass
             
-            return self._create_fallback_resources(topic)
+            return self._create_fallback_resources(topic), True
             
         except Exception as e:
             logger.error(f"Failed to generate resource list: {e}")
-            return self._create_fallback_resources(topic)
+            return self._create_fallback_resources(topic), True
     
     def _create_fallback_resources(self, topic: str) -> List[Dict[str, Any]]:
         """Create fallback resource list"""
@@ -488,7 +494,8 @@ Focus on high-quality, educational resources.
             "objectives": self._create_fallback_objectives(topic),
             "progress_tracking": self._create_progress_tracking(self._create_fallback_topic_breakdown(topic), study_duration),
             "study_tips": self._generate_study_tips("pomodoro"),
-            "resources": self._create_fallback_resources(topic)
+            "resources": self._create_fallback_resources(topic),
+            "fallback": True
         }
     
     def update_progress(self, study_plan: Dict[str, Any], completed_units: List[str], 
@@ -568,86 +575,96 @@ Focus on high-quality, educational resources.
                 temp_file.close()
             
             with open(output_path, 'w', encoding='utf-8') as f:
-                # Write header
-                f.write(f"# Study Plan: {study_plan.get('topic', 'Topic')}\n\n")
-                f.write(f"**Generated:** {study_plan.get('generated_at', 'Unknown')}\n")
-                f.write(f"**Duration:** {study_plan.get('study_duration', 0)} days\n")
-                f.write(f"**Hours per Day:** {study_plan.get('hours_per_day', 0)}\n")
-                f.write(f"**Difficulty:** {study_plan.get('difficulty', 'Medium')}\n")
-                f.write(f"**Study Method:** {study_plan.get('study_method', 'Pomodoro')}\n\n")
-                
-                # Learning Objectives
-                f.write("## Learning Objectives\n\n")
-                for i, objective in enumerate(study_plan.get('objectives', []), 1):
-                    f.write(f"**{i}.** {objective.get('objective', '')}\n")
-                    f.write(f"   - **Category:** {objective.get('category', '')}\n")
-                    f.write(f"   - **Difficulty:** {objective.get('difficulty', '')}\n")
-                    f.write(f"   - **Timeframe:** {objective.get('timeframe', '')}\n")
-                    f.write(f"   - **Success Criteria:** {', '.join(objective.get('success_criteria', []))}\n\n")
-                
-                # Topic Breakdown
-                f.write("## Topic Breakdown\n\n")
-                for i, unit in enumerate(study_plan.get('topic_breakdown', []), 1):
-                    f.write(f"### {i}. {unit.get('title', '')}\n\n")
-                    f.write(f"{unit.get('description', '')}\n\n")
-                    f.write(f"**Estimated Hours:** {unit.get('estimated_hours', 0)}\n")
-                    f.write(f"**Difficulty:** {unit.get('difficulty', '')}\n")
-                    f.write(f"**Key Concepts:** {', '.join(unit.get('key_concepts', []))}\n")
-                    f.write(f"**Activities:** {', '.join(unit.get('activities', []))}\n\n")
-                
-                # Study Schedule
-                f.write("## Study Schedule\n\n")
-                schedule = study_plan.get('schedule', {})
-                f.write(f"**Total Hours:** {schedule.get('total_hours', 0)}\n")
-                f.write(f"**Study Method:** {schedule.get('study_method', '')}\n\n")
-                
-                for daily in schedule.get('daily_schedules', []):
-                    f.write(f"### Day {daily.get('day', '')} - {daily.get('day_of_week', '')} ({daily.get('date', '')})\n\n")
-                    f.write(f"**Total Hours:** {daily.get('total_hours', 0)}\n\n")
-                    
-                    for session in daily.get('sessions', []):
-                        f.write(f"**{session.get('unit', '')}** ({session.get('duration', 0)} hours)\n")
-                        f.write(f"- Activities: {', '.join(session.get('activities', []))}\n")
-                        f.write(f"- Key Concepts: {', '.join(session.get('key_concepts', []))}\n")
-                        f.write(f"- Difficulty: {session.get('difficulty', '')}\n\n")
-                
-                # Study Tips
-                f.write("## Study Tips\n\n")
-                for tip in study_plan.get('study_tips', []):
-                    f.write(f"- {tip}\n")
-                f.write("\n")
-                
-                # Resources
-                f.write("## Study Resources\n\n")
-                for resource in study_plan.get('resources', []):
-                    f.write(f"### {resource.get('title', '')}\n")
-                    f.write(f"**Type:** {resource.get('type', '')}\n")
-                    f.write(f"**Description:** {resource.get('description', '')}\n")
-                    f.write(f"**Difficulty:** {resource.get('difficulty', '')}\n")
-                    if resource.get('url'):
-                        f.write(f"**URL:** {resource.get('url', '')}\n")
-                    f.write(f"**Cost:** {resource.get('cost', '')}\n")
-                    f.write(f"**Recommended:** {'Yes' if resource.get('recommended') else 'No'}\n\n")
-                
-                # Progress Tracking
-                f.write("## Progress Tracking\n\n")
-                progress = study_plan.get('progress_tracking', {})
-                f.write(f"**Total Units:** {progress.get('total_units', 0)}\n")
-                f.write(f"**Total Hours:** {progress.get('total_hours', 0)}\n")
-                f.write(f"**Completed Units:** {progress.get('completed_units', 0)}\n")
-                f.write(f"**Progress:** {progress.get('progress_percentage', 0):.1f}%\n\n")
-                
-                f.write("### Milestones\n\n")
-                for milestone in progress.get('milestones', []):
-                    status = "✅" if milestone.get('completed') else "⏳"
-                    f.write(f"{status} **{milestone.get('unit', '')}** (Day {milestone.get('day_target', 0)})\n")
-                    if milestone.get('completed'):
-                        f.write(f"   Completed: {milestone.get('completion_date', '')}\n")
-                    f.write(f"   Notes: {milestone.get('notes', '')}\n\n")
+                self._write_study_plan_markdown(f, study_plan)
             
             logger.info(f"Study plan exported to Markdown: {output_path}")
             return output_path
             
         except Exception as e:
             logger.error(f"Failed to export study plan to Markdown: {e}")
-            raise 
\ No newline at end of file
+            raise
+    
+    def export_study_plan_to_markdown_str(self, study_plan: Dict[str, Any]) -> str:
+        """Render study plan as a Markdown string without touching the filesystem"""
+        buffer = io.StringIO()
+        self._write_study_plan_markdown(buffer, study_plan)
+        return buffer.getvalue()
+    
+    def _write_study_plan_markdown(self, f, study_plan):
+        """Write study plan Markdown to a file-like object"""
+        # Write header
+        f.write(f"# Study Plan: {study_plan.get('topic', 'Topic')}\n\n")
+        f.write(f"**Generated:** {study_plan.get('generated_at', 'Unknown')}\n")
+        f.write(f"**Duration:** {study_plan.get('study_duration', 0)} days\n")
+        f.write(f"**Hours per Day:** {study_plan.get('hours_per_day', 0)}\n")
+        f.write(f"**Difficulty:** {study_plan.get('difficulty', 'Medium')}\n")
+        f.write(f"**Study Method:** {study_plan.get('study_method', 'Pomodoro')}\n\n")
+        
+        # Learning Objectives
+        f.write("## Learning Objectives\n\n")
+        for i, objective in enumerate(study_plan.get('objectives', []), 1):
+            f.write(f"**{i}.** {objective.get('objective', '')}\n")
+            f.write(f"   - **Category:** {objective.get('category', '')}\n")
+            f.write(f"   - **Difficulty:** {objective.get('difficulty', '')}\n")
+            f.write(f"   - **Timeframe:** {objective.get('timeframe', '')}\n")
+            f.write(f"   - **Success Criteria:** {', '.join(objective.get('success_criteria', []))}\n\n")
+        
+        # Topic Breakdown
+        f.write("## Topic Breakdown\n\n")
+        for i, unit in enumerate(study_plan.get('topic_breakdown', []), 1):
+            f.write(f"### {i}. {unit.get('title', '')}\n\n")
+            f.write(f"{unit.get('description', '')}\n\n")
+            f.write(f"**Estimated Hours:** {unit.get('estimated_hours', 0)}\n")
+            f.write(f"**Difficulty:** {unit.get('difficulty', '')}\n")
+            f.write(f"**Key Concepts:** {', '.join(unit.get('key_concepts', []))}\n")
+            f.write(f"**Activities:** {', '.join(unit.get('activities', []))}\n\n")
+        
+        # Study Schedule
+        f.write("## Study Schedule\n\n")
+        schedule = study_plan.get('schedule', {})
+        f.write(f"**Total Hours:** {schedule.get('total_hours', 0)}\n")
+        f.write(f"**Study Method:** {schedule.get('study_method', '')}\n\n")
+        
+        for daily in schedule.get('daily_schedules', []):
+            f.write(f"### Day {daily.get('day', '')} - {daily.get('day_of_week', '')} ({daily.get('date', '')})\n\n")
+            f.write(f"**Total Hours:** {daily.get('total_hours', 0)}\n\n")
+        
+            for session in daily.get('sessions', []):
+                f.write(f"**{session.get('unit', '')}** ({session.get('duration', 0)} hours)\n")
+                f.write(f"- Activities: {', '.join(session.get('activities', []))}\n")
+                f.write(f"- Key Concepts: {', '.join(session.get('key_concepts', []))}\n")
+                f.write(f"- Difficulty: {session.get('difficulty', '')}\n\n")
+        
+        # Study Tips
+        f.write("## Study Tips\n\n")
+        for tip in study_plan.get('study_tips', []):
+            f.write(f"- {tip}\n")
+        f.write("\n")
+        
+        # Resources
+        f.write("## Study Resources\n\n")
+        for resource in study_plan.get('resources', []):
+            f.write(f"### {resource.get('title', '')}\n")
+            f.write(f"**Type:** {resource.get('type', '')}\n")
+            f.write(f"**Description:** {resource.get('description', '')}\n")
+            f.write(f"**Difficulty:** {resource.get('difficulty', '')}\n")
+            if resource.get('url'):
+                f.write(f"**URL:** {resource.get('url', '')}\n")
+            f.write(f"**Cost:** {resource.get('cost', '')}\n")
+            f.write(f"**Recommended:** {'Yes' if resource.get('recommended') else 'No'}\n\n")
+        
+        # Progress Tracking
+        f.write("## Progress Tracking\n\n")
+        progress = study_plan.get('progress_tracking', {})
+        f.write(f"**Total Units:** {progress.get('total_units', 0)}\n")
+        f.write(f"**Total Hours:** {progress.get('total_hours', 0)}\n")
+        f.write(f"**Completed Units:** {progress.get('completed_units', 0)}\n")
+        f.write(f"**Progress:** {progress.get('progress_percentage', 0):.1f}%\n\n")
+        
+        f.write("### Milestones\n\n")
+        for milestone in progress.get('milestones', []):
+            status = "✅" if milestone.get('completed') else "⏳"
+            f.write(f"{status} **{milestone.get('unit', '')}** (Day {milestone.get('day_target', 0)})\n")
+            if milestone.get('completed'):
+                f.write(f"   Completed: {milestone.get('completion_date', '')}\n")
+            f.write(f"   Notes: {milestone.get('notes', '')}\n\n")
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""
+Hand-written Sun explainer content shared by the Sun video scripts
+"""
+
+import queue
+import threading
+
+# Seconds to wait for AI content before switching to the manual content
+AI_CONTENT_TIMEOUT = 60
+
+# AI content with fewer slides than this is treated as a failed generation
+MIN_AI_SLIDES = 3
+
+SUN_CONTENT = {
+    "topic": "The Sun: Our Star",
+    "level": "beginner",
+    "category": "space",
+    "complexity": "moderate",
+    "slides": [
+        {
+            "title": "Introduction to the Sun",
+            "subtopics": ["Definition", "Core Concepts"],
+            "bullets": [
+                "Our closest star",
+                "Center of solar system",
+                "Provides light and energy"
+            ],
+            "narration": "The Sun is our closest star and the center of our solar system. This massive ball of hydrogen and helium provides all the light and energy that sustains life on Earth. The Sun's immense gravity holds all the planets in orbit, and its energy drives weather patterns, ocean currents, and the entire food chain. Without the Sun, life as we know it would not exist. The Sun is so large that about 1.3 million Earths could fit inside it, and it contains 99.86% of all the mass in our solar system.",
+            "examples": [
+                "Solar energy powers solar panels",
+                "Sunlight enables photosynthesis in plants"
+            ],
+            "visual_prompts": [
+                "Bright yellow sun with solar flares",
+                "Solar system diagram with Sun at center"
+            ],
+            "layout": "clean minimal, concept fade-in",
+            "subtopic_type": "definition",
+            "timing": 8
+        },
+        {
+            "title": "Sun's Structure and Layers",
+            "subtopics": ["Core", "Radiative Zone", "Convective Zone"],
+            "bullets": [
+                "Nuclear fusion in core",
+                "Energy transfer through layers",
+                "Visible surface called photosphere"
+            ],
+            "narration": "The Sun has several distinct layers, each with unique properties and functions. At the very center lies the core, where nuclear fusion occurs at temperatures of 15 million degrees Celsius. This is where hydrogen atoms combine to form helium, releasing enormous amounts of energy. The radiative zone surrounds the core, where energy travels outward as electromagnetic radiation. Above that is the convective zone, where hot plasma rises and cooler material sinks, creating convection currents. The visible surface we see is called the photosphere, which appears as a bright disk in the sky.",
+            "examples": [
+                "Nuclear fusion powers hydrogen bombs",
+                "Convection currents occur in boiling water"
+            ],
+            "visual_prompts": [
+                "Cross-section diagram of Sun layers",
+                "Nuclear fusion reaction illustration"
+            ],
+            "layout": "layered diagram, sequential reveals",
+            "subtopic_type": "classification",
+            "timing": 8
+        },
+        {
+            "title": "Solar Activity and Phenomena",
+            "subtopics": ["Sunspots", "Solar Flares", "Coronal Mass Ejections"],
+            "bullets": [
+                "Dark spots on surface",
+                "Explosive energy releases",
+                "Magnetic field disturbances"
+            ],
+            "narration": "The Sun is far from static - it's a dynamic, active star with various phenomena occurring on its surface and in its atmosphere. Sunspots are dark regions on the photosphere that appear when magnetic field lines become twisted and concentrated. These spots are cooler than the surrounding areas, making them appear darker. Solar flares are sudden, intense bursts of radiation that occur when magnetic energy is released. These can affect Earth's atmosphere and disrupt communications. Coronal mass ejections are massive eruptions of plasma and magnetic field that can travel through space and impact Earth, causing geomagnetic storms.",
+            "examples": [
+                "Aurora borealis caused by solar activity",
+                "Satellite communications affected by solar storms"
+            ],
+            "visual_prompts": [
+                "Sunspots on solar surface",
+                "Solar flare eruption sequence"
+            ],
+            "layout": "dynamic animations, energy burst effects",
+            "subtopic_type": "process",
+            "timing": 8
+        },
+        {
+            "title": "Sun's Impact on Earth",
+            "subtopics": ["Climate", "Technology", "Life"],
+            "bullets": [
+                "Drives weather patterns",
+                "Affects satellite systems",
+                "Essential for all life"
+            ],
+            "narration": "The Sun's influence on Earth extends far beyond just providing light and warmth. It drives our planet's weather patterns through the heating of the atmosphere and oceans, creating wind currents and ocean circulation. The Sun's energy is essential for all life on Earth - plants use it for photosynthesis, which forms the base of the food chain. However, solar activity can also pose challenges to our technology. Solar storms can disrupt satellite communications, GPS systems, and even power grids. Understanding the Sun's behavior is crucial for protecting our technological infrastructure and understanding Earth's climate system.",
+            "examples": [
+                "Solar panels convert sunlight to electricity",
+                "Weather satellites monitor solar radiation"
+            ],
+            "visual_prompts": [
+                "Earth receiving solar energy",
+                "Solar storm affecting satellites"
+            ],
+            "layout": "cause-effect diagram, impact visualization",
+            "subtopic_type": "advantages_disadvantages",
+            "timing": 8
+        },
+        {
+            "title": "Future of Solar Research",
+            "subtopics": ["Space Missions", "Solar Energy", "Climate Science"],
+            "bullets": [
+                "Parker Solar Probe mission",
+                "Renewable energy development",
+                "Climate change understanding"
+            ],
+            "narration": "Our understanding of the Sun continues to evolve through advanced space missions and research. The Parker Solar Probe, launched in 2018, is the first spacecraft to fly through the Sun's corona, collecting unprecedented data about solar wind and magnetic fields. This mission helps us understand space weather and its effects on Earth. Solar energy technology is rapidly advancing, with more efficient solar panels and energy storage systems being developed. Understanding the Sun's role in climate change is crucial for predicting Earth's future climate patterns and developing strategies to address global warming.",
+            "examples": [
+                "Parker Solar Probe discoveries",
+                "Solar energy becoming cheaper than fossil fuels"
+            ],
+            "visual_prompts": [
+                "Parker Solar Probe near Sun",
+                "Solar energy farm with panels"
+            ],
+            "layout": "timeline style, future projections",
+            "subtopic_type": "timeline",
+            "timing": 8
+        }
+    ]
+}
+
+def _generate_ai_sun_content() -> dict:
+    """Generate Sun content with the universal AI prompt (cached on disk)"""
+    # Imported lazily so the manual-only path never loads the AI stack
+    from ai_cache import cached_explainer
+    from service_registry import get_ai_service
+    
+    return cached_explainer(
+        get_ai_service(),
+        topic=SUN_CONTENT["topic"],
+        level="beginner",
+        num_slides=5,  # More slides for better content
+        max_retries=3
+    )
+
+def get_sun_content(prefer_ai: bool = True, timeout: float = AI_CONTENT_TIMEOUT) -> dict:
+    """Return AI-generated Sun content when it arrives in time, otherwise SUN_CONTENT
+    
+    The result is SUN_CONTENT itself whenever the manual content is used, so
+    callers can tell the two apart with an identity check.
+    """
+    if not prefer_ai:
+        return SUN_CONTENT
+    
+    # A daemon thread, unlike a concurrent.futures worker (which is joined
+    # at interpreter exit), lets the script exit without waiting for a slow
+    # AI call that has timed out
+    result = queue.Queue(maxsize=1)
+    
+    def generate():
+        try:
+            result.put(_generate_ai_sun_content())
+        except Exception as e:
+            result.put(e)
+    
+    threading.Thread(target=generate, daemon=True).start()
+    try:
+        content = result.get(timeout=timeout)
+    except queue.Empty:
+        print(f"\n⏱️ AI generation did not finish within {timeout} seconds")
+        content = None
+    if isinstance(content, Exception):
+        print(f"❌ Error generating real content: {content}")
+        content = None
+    
+    if not content or len(content.get('slides', [])) < MIN_AI_SLIDES:
+        print("\n⚠️ AI generation didn't produce good content, using manual content...")
+        return SUN_CONTENT
+    return content
@@ -6,7 +6,8 @@ Master prompt that handles any topic with multiple subtopic types and enhanced f
 
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+from typing import Callable, Dict, Any, List, Optional
 from ai_service import AIService
 from video_generator import VideoGenerator
 
@@ -14,6 +15,67 @@ from video_generator import VideoGenerator
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_SLIDES_ARRAY_RE = re.compile(r'"slides"\s*:\s*\[')
+
+class _SlideStream:
+    """
+    Pulls complete slide objects out of streamed JSON text as they arrive
+    
+    Chunks are fed in order; each feed returns the (index, slide) pairs whose
+    closing brace arrived in that chunk. Braces inside strings are ignored.
+    """
+    
+    def __init__(self):
+        self.text = ""
+        self.pos = None  # scan position inside the "slides" array
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.start = 0
+        self.count = 0
+        self.done = False
+    
+    def feed(self, chunk: str) -> List[tuple]:
+        self.text += chunk
+        if self.done:
+            return []
+        if self.pos is None:
+            match = _SLIDES_ARRAY_RE.search(self.text)
+            if not match:
+                return []
+            self.pos = match.end()
+        
+        slides = []
+        text = self.text
+        for i in range(self.pos, len(text)):
+            char = text[i]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == "\\":
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                if self.depth == 0:
+                    self.start = i
+                self.depth += 1
+            elif char == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    try:
+                        slides.append((self.count, json.loads(text[self.start:i + 1])))
+                        self.count += 1
+                    except ValueError:
+                        pass
+            elif char == "]" and self.depth == 0:
+                self.done = True
+                break
+        self.pos = len(text)
+        return slides
+
 class UniversalAIPrompt:
     """
     Universal AI Prompt System for generating NotebookLM-style slide-to-video content
@@ -90,22 +152,17 @@ class UniversalAIPrompt:
         # Determine optimal subtopic types based on topic
         recommended_types = self._get_recommended_subtopic_types(topic, topic_category)
         
-        # Build the master prompt
+        # Build the master prompt. The static instructions come first and the
+        # topic-specific sections last, so repeated requests share a long
+        # identical prefix that provider-side prompt caching can reuse.
         prompt = f"""
 You are an AI system that generates video slideshows with synced narration in Google NotebookLM style.
 
-## 🎯 TASK
-Create a professional presentation for: "{topic}"
-Audience Level: {level}
-Target Slides: {num_slides}
-Topic Category: {topic_category}
-Complexity Level: {topic_complexity}
-
 ## 📋 CRITICAL STYLE RULES - NEVER VIOLATE
 - NEVER use question marks (?) anywhere in any content
 - NEVER start sentences with "What", "How", "Why", "When", "Where", "Which"
 - Write ONLY clear, declarative statements
-- Use simple, direct language appropriate for {level} level
+- Use simple, direct language appropriate for the audience level below
 - Focus on understanding, not memorization
 - Make each slide build on the previous one
 - Avoid jargon and complex terminology
@@ -130,11 +187,6 @@ Complexity Level: {topic_complexity}
 - Use professional language and clear structure
 - End with a comprehensive summary and key takeaways
 
-## 🎭 SUBTOPIC TYPE VARIETY
-Use these different subtopic types to create engaging, non-repetitive content:
-
-{self._format_subtopic_types(recommended_types)}
-
 ## 📝 SLIDE STRUCTURE REQUIREMENTS
 
 Each slide must include:
@@ -154,6 +206,18 @@ Each slide must include:
 5. Examples/Applications: Real-world usage and case studies
 6. Summary: Key takeaways and next steps
 
+IMPORTANT: 
+- Do not include markdown fences or any text outside JSON
+- Ensure all text is clean, professional, and free of question marks
+- Make narration significantly more detailed than bullet points
+- Vary subtopic types to avoid repetition
+- Keep slides visually clean and non-overlapping
+
+## 🎭 SUBTOPIC TYPE VARIETY
+Use these different subtopic types to create engaging, non-repetitive content:
+
+{self._format_subtopic_types(recommended_types)}
+
 ## 🎯 CONTENT FOCUS
 {focus_instruction}
 
@@ -178,12 +242,12 @@ Return ONLY valid JSON with this exact structure:
   ]
 }}
 
-IMPORTANT: 
-- Do not include markdown fences or any text outside JSON
-- Ensure all text is clean, professional, and free of question marks
-- Make narration significantly more detailed than bullet points
-- Vary subtopic types to avoid repetition
-- Keep slides visually clean and non-overlapping
+## 🎯 TASK
+Create a professional presentation for: "{topic}"
+Audience Level: {level}
+Target Slides: {num_slides}
+Topic Category: {topic_category}
+Complexity Level: {topic_complexity}
         """
         
         return prompt
@@ -228,7 +292,8 @@ IMPORTANT:
     
     def generate_structured_content(self, topic: str, subtopics: List[str] = None,
                                   level: str = "beginner", num_slides: int = 8,
-                                  max_retries: int = 3) -> Dict[str, Any]:
+                                  max_retries: int = 3,
+                                  on_slide: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Generate structured content using the universal prompt
         
@@ -238,6 +303,9 @@ IMPORTANT:
             level: Audience level
             num_slides: Number of slides
             max_retries: Maximum retry attempts
+            on_slide: Optional callback; when given, the response is streamed
+                and on_slide(index, slide) is called as each slide completes
+                (a retried attempt streams its slides again from index 0)
             
         Returns:
             Structured content dictionary
@@ -254,11 +322,21 @@ IMPORTANT:
                         top_p=0.9,
                         top_k=50,
                         max_output_tokens=2048,
-                    )
+                    ),
+                    stream=on_slide is not None
                 )
                 
-                if response and hasattr(response, 'text'):
+                content = None
+                if on_slide is not None:
+                    slide_stream = _SlideStream()
+                    for chunk in response:
+                        for index, slide in slide_stream.feed(chunk.text):
+                            on_slide(index, slide)
+                    content = slide_stream.text.strip()
+                elif response and hasattr(response, 'text'):
                     content = response.text.strip()
+                
+                if content is not None:
                     
                     # Clean the response
                     if content.startswith('```json'):
@@ -10,6 +10,12 @@ import requests
 import json
 from PIL import Image
 import io
+import contextlib
+import functools
+import hashlib
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Attempt to import MoviePy; provide a clear message if unavailable
 try:
@@ -47,6 +53,61 @@ except Exception:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Set FRAME_CACHE=1 to cache rendered slide frames as PNGs keyed by their
+# render inputs; bump the version whenever slide drawing changes to
+# invalidate old entries. The least recently used frames are evicted once
+# the directory exceeds FRAME_CACHE_MAX_MB.
+FRAME_CACHE_ENABLED = os.getenv("FRAME_CACHE", "0") == "1"
+FRAME_CACHE_DIR = os.path.expanduser(os.getenv("FRAME_CACHE_DIR", "~/.cache/majorprozenith/frames"))
+FRAME_CACHE_MAX_BYTES = int(float(os.getenv("FRAME_CACHE_MAX_MB", "512")) * (1 << 20))
+FRAME_CACHE_VERSION = 1
+
+def _prune_frame_cache() -> None:
+	"""Delete the least recently used cached frames until the cache fits FRAME_CACHE_MAX_BYTES"""
+	entries = []
+	total = 0
+	with os.scandir(FRAME_CACHE_DIR) as it:
+		for entry in it:
+			if not entry.name.endswith(".png") or ".tmp." in entry.name:
+				continue
+			with contextlib.suppress(OSError):
+				stat = entry.stat()
+				entries.append((stat.st_mtime, stat.st_size, entry.path))
+				total += stat.st_size
+	if total <= FRAME_CACHE_MAX_BYTES:
+		return
+	# Hits refresh the mtime, so the oldest mtimes are the least recently used
+	for _, size, path in sorted(entries):
+		with contextlib.suppress(OSError):
+			os.unlink(path)
+			total -= size
+		if total <= FRAME_CACHE_MAX_BYTES:
+			break
+
+@functools.lru_cache(maxsize=1)
+def nvenc_available() -> bool:
+	"""Whether the bundled ffmpeg offers the h264_nvenc encoder (probed once per process)"""
+	if not IMAGEIO_FFMPEG_AVAILABLE:
+		return False
+	try:
+		result = subprocess.run(
+			[imageio_ffmpeg.get_ffmpeg_exe(), "-hide_banner", "-encoders"],
+			stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10
+		)
+		return b"h264_nvenc" in result.stdout
+	except Exception:
+		return False
+
+def slides_to_script(slides: List[Dict]) -> str:
+	"""Render structured slides as the markdown script read by generate_slideshow_video"""
+	lines = []
+	for slide in slides:
+		get = slide.get
+		lines.append(f"### {get('title', 'Untitled')}")
+		lines.extend(f"- {bullet}" for bullet in get('bullets', ()))
+		lines.append("")
+	return "\n".join(lines)
+
 class VideoGenerator:
 	"""Handles video generation from text content with enhanced features"""
 	
@@ -56,6 +117,8 @@ class VideoGenerator:
 		self.default_background = self._load_default_background()
 		# Cache for topic-related backgrounds
 		self.topic_backgrounds = {}
+		# Default background resized per output (width, height)
+		self._default_background_sizes = {}
 		# Professional NotebookLM-style backgrounds
 		self.notebooklm_backgrounds = self._create_notebooklm_backgrounds()
 	
@@ -109,8 +172,9 @@ class VideoGenerator:
 					best_match = image_url
 			
 			if best_match:
-				# Download and process the image
-				response = requests.get(best_match, timeout=10)
+				# Download and process the image (over the shared keep-alive session)
+				from service_registry import get_http_session
+				response = get_http_session().get(best_match, timeout=10)
 				if response.status_code == 200:
 					# Convert PIL image to OpenCV format
 					pil_image = Image.open(io.BytesIO(response.content))
@@ -174,17 +238,18 @@ class VideoGenerator:
 	
 	def _create_enhanced_slide_content(self, slide: Dict) -> str:
 		"""Create enhanced slide content with detailed explanations for each subtopic"""
-		title = slide.get("title", "")
-		bullets = slide.get("bullets", [])
 		narration = slide.get("narration", "")
-		subtopics = slide.get("subtopics", [])
 		
 		# Use the detailed narration that explains each subtopic
 		if narration:
 			# Use existing detailed narration that covers each subtopic
 			content = narration
 		else:
-			# Create detailed explanation from subtopics and bullets
+			# Create detailed explanation from subtopics and bullets (only
+			# looked up when there is no narration)
+			title = slide.get("title", "")
+			subtopics = slide.get("subtopics", [])
+			bullets = slide.get("bullets", [])
 			content_parts = []
 			
 			# Start with title introduction
@@ -194,22 +259,16 @@ class VideoGenerator:
 			# Include detailed subtopic explanations
 			if subtopics:
 				content_parts.append("This covers several key areas:")
-				for i, subtopic in enumerate(subtopics):
-					if i == len(subtopics) - 1:
-						content_parts.append(f"and finally, let me explain {subtopic.lower()}")
-					else:
-						content_parts.append(f"first, let me explain {subtopic.lower()}")
+				content_parts.extend(f"first, let me explain {subtopic.lower()}" for subtopic in subtopics[:-1])
+				content_parts.append(f"and finally, let me explain {subtopics[-1].lower()}")
 			
 			# Include detailed bullet explanations
 			if bullets:
 				content_parts.append("Let me explain each point in detail:")
-				for i, bullet in enumerate(bullets):
-					if i == 0:
-						content_parts.append(f"Starting with {bullet.lower()}")
-					elif i == len(bullets) - 1:
-						content_parts.append(f"Finally, {bullet.lower()}")
-					else:
-						content_parts.append(f"Next, {bullet.lower()}")
+				content_parts.append(f"Starting with {bullets[0].lower()}")
+				content_parts.extend(f"Next, {bullet.lower()}" for bullet in bullets[1:-1])
+				if len(bullets) > 1:
+					content_parts.append(f"Finally, {bullets[-1].lower()}")
 			
 			content = ". ".join(content_parts)
 		
@@ -424,6 +483,7 @@ class VideoGenerator:
 				img = cv2.imread(image_path)
 				if img is not None:
 					self.default_background = img
+					self._default_background_sizes.clear()
 					logger.info(f"Set new default background image: {image_path}")
 					return True
 				else:
@@ -520,6 +580,14 @@ class VideoGenerator:
 			return padded
 		return crop
 
+	def _default_background_at(self, width: int, height: int) -> np.ndarray:
+		"""Default background resized and cropped to (width, height), computed once per size"""
+		resized = self._default_background_sizes.get((width, height))
+		if resized is None:
+			resized = self._resize_and_crop(self.default_background, width, height)
+			self._default_background_sizes[(width, height)] = resized
+		return resized
+
 	def _ken_burns_frame(self, base_img: np.ndarray, width: int, height: int, t: float, total: float) -> np.ndarray:
 		"""Pan/zoom over time ensuring the image fully covers the frame (no corner padding)."""
 		start_scale = 1.05
@@ -1018,7 +1086,8 @@ class VideoGenerator:
 		if topic and hasattr(self, '_current_topic_background') and self._current_topic_background is not None:
 			frame = self._resize_and_crop(self._current_topic_background, width, height)
 		elif self.default_background is not None:
-			frame = self._resize_and_crop(self.default_background, width, height)
+			# Shared across frames; only read below (the overlay works on copies)
+			frame = self._default_background_at(width, height)
 		else:
 			frame = np.zeros((height, width, 3), dtype=np.uint8)
 			frame[:] = (20, 30, 45)
@@ -1203,10 +1272,22 @@ class VideoGenerator:
 		fps: Optional[int] = None,
 		seconds_per_slide: float = 10.0,  # Reduced from 8.0 to 10.0 for faster generation
 		style: Optional[dict] = None,
-		topic: str = ""
+		topic: str = "",
+		encoder_preset: str = "veryfast",
+		crf: Optional[int] = None,
+		threads: int = 0,
+		use_nvenc: bool = True,
+		parallel_segments: bool = False
 	) -> str:
 		"""
 		Generate a slideshow video from markdown script with enhanced features
+		
+		encoder_preset and crf are passed to libx264 for the final encode; use
+		"ultrafast" and a higher crf (e.g. 28) for quick previews and demos.
+		threads sets the encoder thread count (0 uses every CPU core). With
+		use_nvenc, the h264_nvenc GPU encoder is used when ffmpeg provides it.
+		With parallel_segments, each slide is encoded straight to H.264 by its
+		own ffmpeg process and the segments are joined without re-encoding.
 		"""
 		try:
 			# Parse script into slides
@@ -1225,8 +1306,7 @@ class VideoGenerator:
 			if topic:
 				try:
 					from ai_service import AIService
-					ai_service = AIService()
-					topic_category = ai_service._categorize_topic(topic)
+					topic_category = AIService._categorize_topic(topic)
 				except:
 					# Fallback categorization
 					if any(word in topic.lower() for word in ['ai', 'machine learning', 'neural', 'algorithm', 'programming', 'software', 'computer', 'data', 'technology']):
@@ -1246,71 +1326,161 @@ class VideoGenerator:
 					elif any(word in topic.lower() for word in ['space', 'astronomy', 'cosmos', 'galaxy', 'planet']):
 						topic_category = 'space'
 			
-			# Generate audio for each slide with detailed content
-			audio_segments = []
-			total_duration = 0
+			# Generate audio for each slide with detailed content in a producer
+			# thread, so network-bound TTS for later slides overlaps with frame
+			# rendering for earlier ones. Segments (or the error) arrive in order.
+			# stop_audio is set when the video side fails, so no further paid
+			# TTS calls are made for slides that will never be used.
+			segment_queue = queue.Queue()
+			stop_audio = threading.Event()
 			
-			for i, slide in enumerate(slides):
-				# Create enhanced slide content with detailed explanations for each subtopic
-				slide_content = self._create_enhanced_slide_content(slide)
-				
-				# Generate audio for this slide
-				audio_path = self.text_to_speech(slide_content)
-				
-				# Get audio duration
-				audio_duration = self._get_audio_duration(audio_path)
-				
-				# Ensure minimum duration of 20 seconds per slide for detailed explanations
-				if audio_duration < 20.0:
-					audio_duration = 20.0
-				
-				audio_segments.append({
-					'path': audio_path,
-					'duration': audio_duration,
-					'start_time': total_duration
-				})
-				
-				total_duration += audio_duration
+			def produce_audio_segments():
+				try:
+					for slide in slides:
+						if stop_audio.is_set():
+							return
+						
+						# Create enhanced slide content with detailed explanations for each subtopic
+						slide_content = self._create_enhanced_slide_content(slide)
+						
+						# Generate audio for this slide
+						audio_path = self.text_to_speech(slide_content)
+						
+						# Get audio duration, ensuring a minimum of 20 seconds per
+						# slide for detailed explanations
+						audio_duration = max(self._get_audio_duration(audio_path), 20.0)
+						segment_queue.put((audio_path, audio_duration))
+				except Exception as e:
+					segment_queue.put(e)
+			
+			audio_thread = threading.Thread(target=produce_audio_segments, daemon=True)
+			audio_thread.start()
 			
 			# Create video frames
 			temp_video = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
 			temp_video_path = temp_video.name
 			temp_video.close()
 			
-			fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-			video_writer = cv2.VideoWriter(temp_video_path, fourcc, fps, (width, height))
-			
-			# Generate frames for each slide with proper duration
-			current_time = 0
-			
-			for slide_index, slide in enumerate(slides):
-				# Use the actual audio duration for this slide
-				slide_duration = audio_segments[slide_index]['duration']
-				frames_for_slide = int(slide_duration * fps)
+			segment_mode = parallel_segments and IMAGEIO_FFMPEG_AVAILABLE
+			if segment_mode:
+				# Each slide is a still image, so its segment is encoded by a
+				# separate ffmpeg process; the pool threads just wait on them
+				# Split the thread budget (threads, or every core) across the
+				# concurrent encodes rather than letting each x264 use all cores
+				segment_workers = max(1, min(len(slides), os.cpu_count() or 1))
+				segment_threads = max(1, (threads or os.cpu_count() or 1) // segment_workers)
+				segment_args = [
+					"-c:v", "libx264", "-preset", encoder_preset,
+					"-threads", str(segment_threads), "-pix_fmt", "yuv420p",
+				]
+				if crf is not None:
+					segment_args += ["-crf", str(crf)]
+				segment_pool = ThreadPoolExecutor(max_workers=segment_workers)
+				segment_futures = []
+				
+				def emit_slide(frame, frame_count):
+					segment_futures.append(segment_pool.submit(
+						self._encode_still_segment, frame, frame_count, fps, segment_args
+					))
 				
-				# Get different background for each slide
-				bg_img = self._get_notebooklm_background(topic_category, slide_index)
-				bg_img = self._resize_and_crop(bg_img, width, height)
+				def finish_frames():
+					segment_pool.shutdown(wait=True)
+			else:
+				fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+				video_writer = cv2.VideoWriter(temp_video_path, fourcc, fps, (width, height))
+				
+				# Encode frames in a writer thread fed through a small bounded queue
+				# (cv2 releases the GIL while encoding), so drawing the next slide
+				# overlaps with encoding the current one. None ends the stream.
+				frame_queue = queue.Queue(maxsize=4)
+				writer_errors = []
+				
+				def drain_frames():
+					write_frame = video_writer.write
+					while True:
+						item = frame_queue.get()
+						if item is None:
+							return
+						if writer_errors:
+							# Keep draining so the producer never blocks on a full queue
+							continue
+						frame, frame_count = item
+						try:
+							for _ in range(frame_count):
+								write_frame(frame)
+						except Exception as e:
+							writer_errors.append(e)
 				
-				# Generate frames for this slide
-				for frame_index in range(frames_for_slide):
-					frame = bg_img.copy()
+				writer_thread = threading.Thread(target=drain_frames, daemon=True)
+				writer_thread.start()
+				
+				def emit_slide(frame, frame_count):
+					frame_queue.put((frame, frame_count))
+				
+				def finish_frames():
+					frame_queue.put(None)
+					writer_thread.join()
+					video_writer.release()
+			
+			# Generate frames for each slide as soon as its audio is ready
+			audio_segments = []
+			total_duration = 0
+			try:
+				try:
+					for slide_index, slide in enumerate(slides):
+						segment = segment_queue.get()
+						if isinstance(segment, Exception):
+							raise segment
+						audio_path, audio_duration = segment
+						audio_segments.append({
+							'path': audio_path,
+							'duration': audio_duration,
+							'start_time': total_duration
+						})
+						total_duration += audio_duration
 					
-					# Add text overlay with subtopics and detailed narration
-					frame = self._draw_slide_text_styled(
-						frame,
-						slide.get('title', ''),
-						slide.get('bullets', []),
-						style,
-						subtopics=slide.get('subtopics', []),
-						narration=slide.get('narration', ''),
-						topic_category=topic_category
-					)
+						# Use the actual audio duration for this slide
+						slide_duration = audio_duration
+						frames_for_slide = int(slide_duration * fps)
 					
-					video_writer.write(frame)
-					current_time += 1/fps
-			
-			video_writer.release()
+						# The slide is static, so render it once and write the same
+						# frame for the whole slide duration
+						frame = self._render_slide_frame(slide, slide_index, topic_category, width, height, style)
+						emit_slide(frame, frames_for_slide)
+				finally:
+					finish_frames()
+			
+				if segment_mode:
+					segment_paths = [future.result() for future in segment_futures]
+					self._concat_segments(segment_paths, temp_video_path)
+				elif writer_errors:
+					raise writer_errors[0]
+			except Exception:
+				# Stop the TTS producer (waiting out any call in flight) and
+				# delete its audio, both consumed and still queued
+				stop_audio.set()
+				audio_thread.join()
+				orphaned_audio = [segment['path'] for segment in audio_segments]
+				while True:
+					try:
+						item = segment_queue.get_nowait()
+					except queue.Empty:
+						break
+					if not isinstance(item, Exception):
+						orphaned_audio.append(item[0])
+				for path in orphaned_audio:
+					with contextlib.suppress(OSError):
+						os.unlink(path)
+				raise
+			finally:
+				if segment_mode:
+					# _concat_segments deletes the segments it joins; this also
+					# removes those already encoded when rendering, an encode or
+					# the concat failed part-way (the pool has finished by now)
+					for future in segment_futures:
+						if future.exception() is None:
+							with contextlib.suppress(OSError):
+								os.unlink(future.result())
 			
 			# Combine audio segments
 			if len(audio_segments) > 1:
@@ -1321,17 +1491,42 @@ class VideoGenerator:
 			# Merge video and audio
 			if IMAGEIO_FFMPEG_AVAILABLE:
 				ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
-				cmd = [
-					ffmpeg_exe, "-y",
-					"-i", temp_video_path,
-					"-i", combined_audio,
+				x264_args = [
 					"-c:v", "libx264",
-					"-preset", "veryfast",
-					"-c:a", "aac",
-					"-shortest",
-					output_path,
+					"-preset", encoder_preset,
+					"-threads", str(threads or os.cpu_count() or 0),
+					"-pix_fmt", "yuv420p",
 				]
-				subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+				if crf is not None:
+					x264_args += ["-crf", str(crf)]
+				
+				def merge_cmd(video_args: List[str]) -> List[str]:
+					return [
+						ffmpeg_exe, "-y",
+						"-i", temp_video_path,
+						"-i", combined_audio,
+						*video_args,
+						"-c:a", "aac",
+						"-shortest",
+						output_path,
+					]
+				
+				# Segments are already H.264, so only the audio is encoded here.
+				# Otherwise prefer the GPU encoder when ffmpeg has it; the encoder
+				# can be listed without a usable GPU, so fall back to libx264
+				if segment_mode:
+					subprocess.run(merge_cmd(["-c:v", "copy"]), check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+				elif use_nvenc and nvenc_available():
+					nvenc_args = ["-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll", "-pix_fmt", "yuv420p"]
+					if crf is not None:
+						nvenc_args += ["-cq", str(crf)]
+					try:
+						subprocess.run(merge_cmd(nvenc_args), check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+					except subprocess.CalledProcessError as e:
+						logger.warning(f"NVENC encode failed, falling back to libx264: {e}")
+						subprocess.run(merge_cmd(x264_args), check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+				else:
+					subprocess.run(merge_cmd(x264_args), check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 				
 				# Cleanup
 				try:
@@ -1351,6 +1546,145 @@ class VideoGenerator:
 			logger.error(f"Video generation failed: {e}")
 			raise
 
+	def _render_slide_frame(self, slide: Dict, slide_index: int, topic_category: str, width: int, height: int, style: Optional[dict]) -> np.ndarray:
+		"""Render a static slide frame, reusing the cached PNG of an identical earlier render
+		
+		The disk cache is only used when FRAME_CACHE=1.
+		"""
+		title = slide.get('title', '')
+		bullets = slide.get('bullets', [])
+		subtopics = slide.get('subtopics', [])
+		narration = slide.get('narration', '')
+		
+		cache_path = None
+		if FRAME_CACHE_ENABLED:
+			key_source = json.dumps(
+				[FRAME_CACHE_VERSION, title, bullets, subtopics, narration, slide_index, topic_category, width, height, style],
+				sort_keys=True, default=str
+			)
+			key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=20).hexdigest()
+			cache_path = os.path.join(FRAME_CACHE_DIR, f"{key}.png")
+			
+			frame = cv2.imread(cache_path)
+			if frame is not None and frame.shape == (height, width, 3):
+				# Mark the entry as recently used for LRU eviction
+				with contextlib.suppress(OSError):
+					os.utime(cache_path)
+				return frame
+		
+		# Get different background for each slide
+		bg_img = self._get_notebooklm_background(topic_category, slide_index)
+		bg_img = self._resize_and_crop(bg_img, width, height)
+		frame = self._draw_slide_text_styled(
+			bg_img.copy(),
+			title,
+			bullets,
+			style,
+			subtopics=subtopics,
+			narration=narration,
+			topic_category=topic_category
+		)
+		
+		if cache_path is not None:
+			try:
+				os.makedirs(FRAME_CACHE_DIR, exist_ok=True)
+				# Write then rename so a concurrent reader never sees a partial file
+				temp_path = os.path.join(FRAME_CACHE_DIR, f"{key}.{os.getpid()}.tmp.png")
+				if cv2.imwrite(temp_path, frame):
+					os.replace(temp_path, cache_path)
+					_prune_frame_cache()
+			except Exception as e:
+				logger.warning(f"Could not cache slide frame {cache_path}: {e}")
+		
+		return frame
+
+	def _encode_still_segment(self, frame: np.ndarray, frame_count: int, fps: int, video_args: List[str]) -> str:
+		"""Encode frame_count copies of a still frame into a temporary mp4 segment"""
+		ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+		fd, image_path = tempfile.mkstemp(suffix=".png")
+		os.close(fd)
+		fd, segment_path = tempfile.mkstemp(suffix=".mp4")
+		os.close(fd)
+		try:
+			if not cv2.imwrite(image_path, frame):
+				raise RuntimeError(f"Failed to write slide frame {image_path}")
+			subprocess.run([
+				ffmpeg_exe, "-y", "-loglevel", "error", "-nostats",
+				"-loop", "1", "-framerate", str(fps), "-i", image_path,
+				"-frames:v", str(frame_count),
+				*video_args,
+				segment_path,
+			], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+		except Exception:
+			with contextlib.suppress(OSError):
+				os.unlink(segment_path)
+			raise
+		finally:
+			with contextlib.suppress(OSError):
+				os.unlink(image_path)
+		return segment_path
+
+	def _concat_segments(self, segment_paths: List[str], output_path: str) -> None:
+		"""Join same-codec mp4 segments with the ffmpeg concat demuxer (no re-encode), deleting them"""
+		fd, list_path = tempfile.mkstemp(suffix=".txt")
+		try:
+			with os.fdopen(fd, "w") as f:
+				f.writelines(f"file '{path}'\n" for path in segment_paths)
+			subprocess.run([
+				imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-loglevel", "error", "-nostats",
+				"-f", "concat", "-safe", "0", "-i", list_path,
+				"-c", "copy",
+				output_path,
+			], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+		finally:
+			for path in (list_path, *segment_paths):
+				with contextlib.suppress(OSError):
+					os.unlink(path)
+
+	def warmup(self, width: int = 1280, height: int = 720, fps: int = 30, parallel_segments: bool = False) -> None:
+		"""Render and encode one throwaway slide frame
+		
+		This pays the one-off costs of the slideshow path up front, so the first
+		real slide renders at steady-state speed. Pass the same
+		parallel_segments as the generate_slideshow_video call that follows:
+		with it, the frame goes through a one-frame libx264 segment encode (as
+		segment mode does); without it, through the mp4 writer's codec init
+		and the NVENC probe used by the final merge.
+		"""
+		try:
+			bg_img = self._resize_and_crop(self._get_notebooklm_background("default", 0), width, height)
+			frame = self._draw_slide_text_styled(
+				bg_img.copy(),
+				"Warmup",
+				["Warmup"],
+				None,
+				subtopics=["Warmup"],
+				narration="Warmup",
+				topic_category="default"
+			)
+			if parallel_segments and IMAGEIO_FFMPEG_AVAILABLE:
+				segment_path = self._encode_still_segment(
+					frame, 1, fps, ["-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p"]
+				)
+				with contextlib.suppress(OSError):
+					os.unlink(segment_path)
+				return
+			
+			temp_video = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
+			temp_video.close()
+			try:
+				video_writer = cv2.VideoWriter(temp_video.name, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+				try:
+					video_writer.write(frame)
+				finally:
+					video_writer.release()
+			finally:
+				with contextlib.suppress(OSError):
+					os.unlink(temp_video.name)
+			nvenc_available()
+		except Exception as e:
+			logger.warning(f"Video warmup failed: {e}")
+
 	def cleanup_temp_files(self, file_paths: list):
 		"""Clean up temporary files"""
 		for file_path in file_paths:
@@ -1447,39 +1781,34 @@ class VideoGenerator:
 	
 	def _create_gradient_background(self, width: int, height: int, start_color: tuple, end_color: tuple, direction: str) -> np.ndarray:
 		"""Create a gradient background with specified colors and direction"""
-		background = np.zeros((height, width, 3), dtype=np.uint8)
+		# Build the per-pixel blend ratio as one broadcast array, then mix the
+		# two colors for all pixels at once
+		ys = np.arange(height)[:, None]
+		xs = np.arange(width)[None, :]
 		
 		if direction == 'vertical':
-			for y in range(height):
-				ratio = y / height
-				color = tuple(int(start_color[i] + (end_color[i] - start_color[i]) * ratio) for i in range(3))
-				background[y, :] = color
+			ratio = ys / height
 		
 		elif direction == 'horizontal':
-			for x in range(width):
-				ratio = x / width
-				color = tuple(int(start_color[i] + (end_color[i] - start_color[i]) * ratio) for i in range(3))
-				background[:, x] = color
+			ratio = xs / width
 		
 		elif direction == 'diagonal':
-			for y in range(height):
-				for x in range(width):
-					ratio = (x + y) / (width + height)
-					color = tuple(int(start_color[i] + (end_color[i] - start_color[i]) * ratio) for i in range(3))
-					background[y, x] = color
+			ratio = (xs + ys) / (width + height)
 		
 		elif direction == 'radial':
 			center_x, center_y = width // 2, height // 2
 			max_distance = ((width // 2) ** 2 + (height // 2) ** 2) ** 0.5
 			
-			for y in range(height):
-				for x in range(width):
-					distance = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
-					ratio = distance / max_distance
-					color = tuple(int(start_color[i] + (end_color[i] - start_color[i]) * ratio) for i in range(3))
-					background[y, x] = color
+			distance = ((xs - center_x) ** 2 + (ys - center_y) ** 2) ** 0.5
+			ratio = distance / max_distance
+		
+		else:
+			return np.zeros((height, width, 3), dtype=np.uint8)
 		
-		return background
+		start = np.asarray(start_color, dtype=np.float64)
+		delta = np.asarray(end_color, dtype=np.float64) - start
+		colors = (start + delta * ratio[..., None]).astype(np.uint8)
+		return np.ascontiguousarray(np.broadcast_to(colors, (height, width, 3)))
 
 	def _get_notebooklm_background(self, topic_category: str = 'default', slide_index: int = 0) -> np.ndarray:
 		"""Get a NotebookLM-style background based on topic category and slide index"""